@@ -0,0 +1,131 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.gamma_ray as gamma_ray
+from scripts.petrophysics.batch import DEFAULT_PARAMETERS, find_wells, run_batch
+from scripts.welllog.store import DEFAULT_STORE, list_wells
+from components.petrofisicahub.well_log_tab import directory_input
+
+
+def render_batch():
+    st.write(
+        """
+        Evaluate every well of a directory at once: shale volume (Larionov), porosity, water saturation (Archie), permeability (Timur) and net pay.
+        Each well runs in its own process and the input and computed curves are written to the well store, where they can be opened in the Well Logs tab.
+        """
+    )
+    cols = st.columns(2)
+    with cols[0]:
+        source_dir = directory_input(
+            "Wells directory",
+            None,
+            key="batch_source",
+            help="Directory with LAS files or a well store.",
+        )
+    with cols[1]:
+        store = directory_input("Well store directory", DEFAULT_STORE, "batch_store")
+    workers = st.number_input(
+        "Worker processes", min_value=1, value=os.cpu_count() or 1, step=1
+    )
+
+    params = {}
+    with st.expander("Parameters"):
+        st.caption(
+            "The effective porosity is the total porosity minus the shale volume times phi_shale, the apparent porosity read in pure shale; with phi_shale = 0 the PHIE cutoff and Archie use the total porosity."
+        )
+        cols = st.columns(3)
+        for i, (name, value) in enumerate(DEFAULT_PARAMETERS.items()):
+            with cols[i % 3]:
+                # Valor inicial via session state: o gráfico de Pickett pode preenchê-lo
+                st.session_state.setdefault(f"batch_{name}", float(value))
+                params[name] = st.number_input(name, format="%.4f", key=f"batch_{name}")
+
+    if st.button("Run", key="batch_run"):
+        if source_dir is None or store is None:
+            return
+        if not source_dir.is_dir():
+            st.warning("Choose an existing wells directory.")
+            return
+        if not find_wells(source_dir):
+            st.warning("There are no LAS files or stored wells in this directory.")
+            return
+
+        bar = st.progress(0.0, text="Starting workers...")
+
+        def progress(done, total, result):
+            bar.progress(done / total, text=f"{done}/{total} wells - {result['well']}")
+
+        results = run_batch(
+            source_dir, store, params, max_workers=int(workers), progress=progress
+        )
+        df = pd.DataFrame(results).set_index("well").sort_index()
+
+        errors = df["error"].dropna() if "error" in df else pd.Series(dtype=str)
+        cols = st.columns(3)
+        with cols[0]:
+            st.metric("Wells", value=len(df) - len(errors))
+        with cols[1]:
+            st.metric("Failed", value=len(errors))
+        with cols[2]:
+            cpu_time = df.get("seconds", pd.Series(dtype=float)).sum()
+            st.metric("Total CPU time", value=f"{cpu_time:.1f} s")
+        for well, error in errors.items():
+            st.error(f"{well}: {error}")
+        st.dataframe(df.drop(columns="error", errors="ignore"))
+
+
+def render_gr_normalization():
+    st.write(
+        f"""
+        Normalize the gamma ray of every well in a well store to the distribution of a type well, so the same clean and shale baselines apply to all of them.
+        The two-point method stretches each well's low and high percentiles onto the type well's; the quantile method matches the whole distribution.
+        The result is saved in each well as the {gamma_ray.NORMALIZED_GR} curve, which the shale volume calculations use in place of the original gamma ray.
+        """
+    )
+    store = directory_input("Well store directory", DEFAULT_STORE, "gr_norm_store")
+    if store is None:
+        return
+    wells = list_wells(store)
+    if not wells:
+        st.info("There are no wells saved in this store yet.")
+        return
+
+    cols = st.columns(2)
+    with cols[0]:
+        type_well = st.selectbox("Type well", wells, key="gr_norm_type_well")
+        method = st.radio(
+            "Method",
+            gamma_ray.NORMALIZATION_METHODS,
+            format_func=lambda m: m.replace("_", " ").title(),
+            horizontal=True,
+            key="gr_norm_method",
+        )
+    with cols[1]:
+        selected = st.multiselect("Wells", wells, default=wells, key="gr_norm_wells")
+        if method == "TWO_POINT":
+            low, high = st.slider(
+                "Percentiles", 0.0, 100.0, (5.0, 95.0), key="gr_norm_percentiles"
+            )
+        else:
+            low, high = 5.0, 95.0
+
+    if st.button("Normalize", key="gr_norm_run"):
+        bar = st.progress(0.0, text="Starting workers...")
+
+        def progress(done, total, result):
+            bar.progress(done / total, text=f"{done}/{total} wells - {result['well']}")
+
+        try:
+            results = gamma_ray.normalize_wells(
+                store, type_well, selected, method, low, high, progress=progress
+            )
+        except (OSError, ValueError) as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        df = pd.DataFrame(results).set_index("well").sort_index()
+        for well, error in df.get("error", pd.Series(dtype=str)).dropna().items():
+            st.error(f"{well}: {error}")
+        st.dataframe(df.drop(columns="error", errors="ignore"))
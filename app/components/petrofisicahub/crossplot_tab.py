@@ -0,0 +1,170 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from scripts.petrophysics.crossplot import bin_points, mn_curves, zoom_bins
+from scripts.welllog.las import find_curve
+
+CROSSPLOT_TYPES = ("Neutron-Density", "M-N", "Custom")
+
+# O cache guarda uma grade ZOOM_LEVELS vezes mais fina que a exibida, de
+# modo que aproximações de até esse fator não precisam reler os pontos
+ZOOM_LEVELS = 4
+
+
+def crossplot_points(kind, curves, log_x, log_y, data):
+    """x and y values of a crossplot from the loaded curves"""
+    if kind == "M-N":
+        m, n = mn_curves(data[curves["DT"]], data[curves["RHOB"]], data[curves["NPHI"]])
+        x, y = n, m
+    else:
+        x, y = data[curves["X"]], data[curves["Y"]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.log10(x) if log_x else np.asarray(x, dtype=float)
+        y = np.log10(y) if log_y else np.asarray(y, dtype=float)
+    return x, y
+
+
+@st.cache_data(max_entries=16)
+def base_bins(
+    source, interval, kind, curves, log_x, log_y, top, base, bins, _depth, _load
+):
+    """Fine binned crossplot of a zone, cached per well data, curves, zone and bins.
+
+    Only the numbers in the signature are hashed; `source` identifies the
+    data of the well (upload id or stored file and its modification time),
+    so a new file never reuses the counts of another one, and `interval`
+    (first and last depth and number of samples) the depth range read from
+    it. The curves are loaded through `_load` on a cache miss.
+    """
+    data = _load(list(dict.fromkeys(curves.values())))
+    zone = (_depth >= top) & (_depth <= base)
+    x, y = crossplot_points(kind, curves, log_x, log_y, data)
+    return bin_points(x[zone], y[zone], bins * ZOOM_LEVELS)
+
+
+@st.cache_data(max_entries=64)
+def window_bins(
+    source,
+    interval,
+    kind,
+    curves,
+    log_x,
+    log_y,
+    top,
+    base,
+    bins,
+    extent,
+    _depth,
+    _load,
+):
+    """Crossplot of a zoomed window binned again from the points"""
+    data = _load(list(dict.fromkeys(curves.values())))
+    zone = (_depth >= top) & (_depth <= base)
+    x, y = crossplot_points(kind, curves, log_x, log_y, data)
+    return bin_points(x[zone], y[zone], bins, extent)
+
+
+def axis_range(label, edges, key):
+    """Slider over the full extent of an axis, used to zoom in"""
+    low, high = float(edges[0]), float(edges[-1])
+    return st.slider(label, low, high, (low, high), step=(high - low) / 1000, key=key)
+
+
+def render_crossplot(source, mnemonics, depth, load_curves):
+    st.write(
+        """
+        Crossplots of every sample drawn as a density image: the points are counted on a grid here and only the grid goes to the browser, so wells with millions of samples plot instantly.
+        Zoom with the axis ranges; the view is cut from a finer cached grid and the points are binned again only for deep zooms.
+        """
+    )
+    options = mnemonics[1:]
+
+    def curve_select(label, kind, key):
+        default = find_curve(options, kind)
+        return st.selectbox(
+            label,
+            options,
+            index=options.index(default) if default else 0,
+            key=key,
+        )
+
+    cols = st.columns(3)
+    with cols[0]:
+        kind = st.radio("Crossplot", CROSSPLOT_TYPES, key="xplot_type")
+    log_x = log_y = False
+    with cols[1]:
+        if kind == "Neutron-Density":
+            curves = {
+                "X": curve_select("Neutron", "NPHI", "xplot_nphi"),
+                "Y": curve_select("Density", "RHOB", "xplot_rhob"),
+            }
+        elif kind == "M-N":
+            curves = {
+                "DT": curve_select("Sonic", "DT", "xplot_dt"),
+                "RHOB": curve_select("Density", "RHOB", "xplot_mn_rhob"),
+                "NPHI": curve_select("Neutron", "NPHI", "xplot_mn_nphi"),
+            }
+        else:
+            curves = {
+                "X": st.selectbox("X curve", options, key="xplot_x"),
+                "Y": st.selectbox(
+                    "Y curve", options, index=min(1, len(options) - 1), key="xplot_y"
+                ),
+            }
+            log_x = st.checkbox("Logarithmic X", key="xplot_log_x")
+            log_y = st.checkbox("Logarithmic Y", key="xplot_log_y")
+    with cols[2]:
+        top = st.number_input("Zone top", value=float(depth.min()), key="xplot_top")
+        base = st.number_input("Zone base", value=float(depth.max()), key="xplot_base")
+        bins = st.number_input(
+            "Bins", min_value=20, max_value=500, value=200, step=10, key="xplot_bins"
+        )
+
+    # O intervalo lido do poço entra na chave, como no índice de zonas
+    interval = (depth[0], depth[-1], depth.size)
+    key = (source, interval, kind, curves, log_x, log_y, top, base, int(bins))
+    try:
+        counts, xedges, yedges = base_bins(*key, depth, load_curves)
+    except (KeyError, ValueError) as e:
+        st.warning(f"An error occurred: {e}")
+        return
+
+    cols = st.columns(2)
+    with cols[0]:
+        x_range = axis_range("X range", xedges, key="xplot_x_range")
+    with cols[1]:
+        y_range = axis_range("Y range", yedges, key="xplot_y_range")
+    extent = (*x_range, *y_range)
+    zoomed = zoom_bins(counts, xedges, yedges, extent, int(bins))
+    if zoomed is None:
+        zoomed = window_bins(*key, extent, depth, load_curves)
+    counts, xedges, yedges = zoomed
+
+    labels = {
+        "Neutron-Density": (curves.get("X"), curves.get("Y")),
+        "M-N": ("N", "M"),
+        "Custom": (curves.get("X"), curves.get("Y")),
+    }[kind]
+    labels = [
+        f"log10({label})" if log else label
+        for label, log in zip(labels, (log_x, log_y))
+    ]
+    with np.errstate(divide="ignore"):
+        image = np.where(counts > 0, np.log10(counts), np.nan)
+    fig = go.Figure(
+        go.Heatmap(
+            z=image,
+            x=(xedges[:-1] + xedges[1:]) / 2,
+            y=(yedges[:-1] + yedges[1:]) / 2,
+            customdata=counts,
+            hovertemplate="x: %{x:.4g}<br>y: %{y:.4g}<br>samples: %{customdata}<extra></extra>",
+            colorscale="Viridis",
+            colorbar={"title": "log10(samples)"},
+        )
+    )
+    fig.update_layout(xaxis_title=labels[0], yaxis_title=labels[1], height=600)
+    if kind == "Neutron-Density":
+        fig.update_yaxes(autorange="reversed")
+    st.plotly_chart(fig)
+    st.caption(f"{int(counts.sum())} samples in view")
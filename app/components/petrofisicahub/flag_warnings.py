@@ -0,0 +1,36 @@
+import streamlit as st
+
+from scripts.petrophysics.flags import (
+    ABOVE_RANGE,
+    BELOW_RANGE,
+    UNDEFINED,
+    raised_flags,
+)
+
+DENSITY_POROSITY_WARNINGS = {
+    UNDEFINED: "This will result in a division by zero.",
+    BELOW_RANGE: "Rho_Matriz must be greater than Rho_fluid and Rho_Log",
+    ABOVE_RANGE: "rhob value is lower than rhof",
+}
+
+SONIC_POROSITY_WARNINGS = {
+    UNDEFINED: "This will result in a division by zero",
+    BELOW_RANGE: "dt and dtf must be greater than dtma",
+    ABOVE_RANGE: "dt value is greather than dtf",
+}
+
+NEUTRON_DENSITY_POROSITY_WARNINGS = {
+    BELOW_RANGE: "The value must be a value between 0 and 1",
+    ABOVE_RANGE: "The value must be a value between 0 and 1",
+}
+
+
+def warn_flags(flags, messages, ignore=0):
+    """Show one Streamlit warning per flag raised by any sample of `flags`"""
+    raised = raised_flags(flags) & ~ignore
+    shown = set()
+    for flag, message in messages.items():
+        if raised & flag and message not in shown:
+            st.warning(message, icon="🚨")
+            shown.add(message)
+    return raised
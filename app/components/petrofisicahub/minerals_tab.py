@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.minerals as minerals
+from scripts.welllog.las import find_curve
+
+# Perfis de entrada; o PEF é convertido em U com a densidade
+INPUT_LABELS = {
+    "RHOB": r"$\rho_{b}$ curve",
+    "NPHI": r"$\phi_{N}$ curve",
+    "DT": r"$\Delta t$ curve",
+    "PEF": "PEF curve",
+}
+
+# Número máximo de amostras enviadas para o gráfico
+MAX_PLOT_SAMPLES = 5000
+
+ENDPOINT_LABELS = {
+    "RHOB": "ρb (g/cm³)",
+    "NPHI": "φN (v/v)",
+    "DT": "Δt (us/ft)",
+    "U": "U (barns/cm³)",
+}
+
+
+def render_minerals(mnemonics, depth, load_curves):
+    st.write(
+        """
+        Invert the density, neutron, sonic and photoelectric logs for the volumes of quartz, calcite, dolomite, clay and porosity at every depth.
+        Each sample is a small least-squares problem with volumes between 0 and 1 adding up to one, weighted by the usual uncertainty of each log; logs left as None, or missing samples, drop their equation.
+        """
+    )
+    options = ["None"] + mnemonics[1:]
+
+    def default(kind):
+        curve = find_curve(options, kind)
+        return options.index(curve) if curve else 0
+
+    cols = st.columns(4)
+    selected = {}
+    for col, (name, label) in zip(cols, INPUT_LABELS.items()):
+        with col:
+            selected[name] = st.selectbox(
+                label, options, index=default(name), key=f"mineral_{name.lower()}"
+            )
+
+    components = st.multiselect(
+        "Components",
+        list(minerals.ENDPOINTS),
+        default=list(minerals.ENDPOINTS),
+        key="mineral_components",
+        help="At most one more component than input logs gives a unique solution",
+    )
+    endpoints = st.data_editor(
+        pd.DataFrame(minerals.ENDPOINTS).T,
+        column_config={
+            k: st.column_config.NumberColumn(v, format="%.3f")
+            for k, v in ENDPOINT_LABELS.items()
+        },
+        key="mineral_endpoints",
+    )
+
+    if st.button("Calculate", key="mineral_calculate"):
+        curves = {k: c for k, c in selected.items() if c != "None"}
+        if not components:
+            st.warning("Select at least one component.")
+            return
+        if "PEF" in curves and "RHOB" not in curves:
+            st.warning("The PEF curve needs the density curve to give U.")
+            return
+        loaded = load_curves(list(dict.fromkeys(curves.values())))
+        logs = {k: np.asarray(loaded[c], dtype=float) for k, c in curves.items()}
+        if "PEF" in logs:
+            logs["U"] = minerals.volumetric_pef(logs.pop("PEF"), logs["RHOB"])
+        try:
+            result = minerals.solve_minerals(
+                logs, components, endpoints.to_dict(orient="index")
+            )
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        volumes = {name: result[name] for name in components}
+        step = max(1, depth.size // MAX_PLOT_SAMPLES)
+        df = pd.DataFrame({name: v[::step] for name, v in volumes.items()})
+        df.index = depth[::step]
+        st.area_chart(df)
+        st.dataframe(pd.DataFrame(volumes).describe())
+        st.metric(
+            "Median weighted misfit", value=f"{np.nanmedian(result['MISFIT']):.3f}"
+        )
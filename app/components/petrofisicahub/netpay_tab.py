@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import scripts.petrophysics.netpay as netpay
+from components.petrofisicahub.zones_tab import zone_tops, zone_tops_caption
+
+LABELS = {
+    "VSH": "Shale volume (V/V)",
+    "PHIE": "Effective porosity (V/V)",
+    "SW": "Water saturation (V/V)",
+    "PERM": "Permeability (mD)",
+}
+
+DEFAULT_CUTOFFS = {"VSH": 0.4, "PHIE": 0.08, "SW": 0.5, "PERM": 1.0}
+
+# Faixas testadas na análise de sensibilidade
+SENSITIVITY_RANGES = {
+    "VSH": np.linspace(0.0, 1.0, 51),
+    "PHIE": np.linspace(0.0, 0.3, 61),
+    "SW": np.linspace(0.0, 1.0, 51),
+    "PERM": np.geomspace(0.01, 1000.0, 51),
+}
+
+
+def render_net_pay(mnemonics, depth, load_curves):
+    st.write(
+        """
+        Turn the computed curves into reservoir summaries: samples passing the shale volume, porosity and permeability cutoffs are net reservoir, and those also passing the water saturation cutoff are net pay.
+        Gross, net and pay thickness, net-to-gross and thickness-weighted pay averages are reported per zone, with the list of pay intervals and how the net pay changes with any two cutoffs.
+        """
+    )
+    options = mnemonics[1:]
+    curves = {}
+    cutoffs = {}
+    cols = st.columns(4)
+    for col, name in zip(cols, netpay.CUTOFF_SENSE):
+        with col:
+            choices = ["None", *options]
+            curves[name] = st.selectbox(
+                LABELS[name],
+                choices,
+                index=choices.index(name) if name in options else 0,
+                key=f"netpay_{name.lower()}",
+            )
+            sense = "≤" if netpay.CUTOFF_SENSE[name] == "max" else "≥"
+            cutoffs[name] = st.number_input(
+                f"Cutoff ({sense})",
+                value=DEFAULT_CUTOFFS[name],
+                format="%.4g",
+                key=f"netpay_{name.lower()}_cutoff",
+            )
+    curves = {name: c for name, c in curves.items() if c != "None"}
+
+    cols = st.columns(2)
+    with cols[0]:
+        zone_tops_caption()
+    with cols[1]:
+        varied = st.multiselect(
+            "Sensitivity cutoffs",
+            list(curves),
+            default=[c for c in ("PHIE", "SW") if c in curves],
+            max_selections=2,
+            key="netpay_sensitivity",
+        )
+
+    if st.button("Calculate", key="netpay_calculate"):
+        if "SW" not in curves:
+            st.warning("Choose the water saturation curve.")
+            return
+        loaded = load_curves(list(dict.fromkeys(curves.values())))
+        data = {name: np.asarray(loaded[c], dtype=float) for name, c in curves.items()}
+        thickness = netpay.sample_thickness(depth)
+        try:
+            tops = zone_tops()
+            reservoir, pay = netpay.pay_flags(data, cutoffs)
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        averaged = {k: v for k, v in data.items() if k != "PERM"}
+        summary = netpay.zone_summary(
+            depth, reservoir, pay, averaged, tops=tops, thickness=thickness
+        )
+        df = pd.DataFrame(summary).set_index("TOP")
+        st.dataframe(
+            df.rename(columns={"NET_TO_GROSS": "N/G", "PAY_TO_GROSS": "Pay/G"})
+        )
+
+        intervals = netpay.pay_intervals(depth, pay, thickness)
+        st.metric("Pay intervals", value=f"{intervals['TOP'].size}")
+        st.dataframe(pd.DataFrame(intervals).drop(columns=["START", "STOP"]))
+
+        if varied:
+            # Os demais cutoffs ficam fixos nos valores escolhidos
+            grids = {
+                name: SENSITIVITY_RANGES[name] if name in varied else [cutoffs[name]]
+                for name in data
+            }
+            net = netpay.cutoff_sensitivity(data, grids, thickness)
+            varied = [name for name in grids if name in varied]
+            axes = tuple(i for i, name in enumerate(grids) if name not in varied)
+            net = net.sum(axis=axes) if axes else net
+            if len(varied) == 1:
+                st.line_chart(
+                    pd.DataFrame(
+                        {"Net pay": net},
+                        index=pd.Index(grids[varied[0]], name=varied[0]),
+                    )
+                )
+            else:
+                fig = go.Figure(
+                    go.Heatmap(
+                        z=net.T,
+                        x=grids[varied[0]],
+                        y=grids[varied[1]],
+                        colorscale="Viridis",
+                        colorbar={"title": "Net pay"},
+                    )
+                )
+                fig.update_layout(xaxis_title=varied[0], yaxis_title=varied[1])
+                st.plotly_chart(fig)
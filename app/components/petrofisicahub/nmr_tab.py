@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.nmr as nmr
+
+
+def load_depth_table(uploaded_file):
+    """Read a CSV/NumPy table: first column depth, then one column per T2 bin or echo"""
+    if uploaded_file.name.lower().endswith(".npy"):
+        table = np.load(uploaded_file)
+    else:
+        table = np.loadtxt(uploaded_file, delimiter=",", ndmin=2)
+    if table.ndim != 2 or table.shape[1] < 3:
+        raise ValueError("The file must have a depth column and the data columns.")
+    return table[:, 0], np.ascontiguousarray(table[:, 1:])
+
+
+def render_t2_distribution():
+    st.write(
+        """
+        Process a whole T2 distribution log at once. Upload a CSV or NumPy (.npy) file with one row per depth: the first column is the depth and the others are either the amplitudes (porosity units) of the log-spaced T2 bins or the raw CPMG echo train, which is inverted into a T2 distribution by regularized non-negative least squares.
+        The total porosity, the T2 logarithmic mean, the bound (BVI) and free (FFI) fluid volumes split at the T2 cutoff and the SDR and Coates permeabilities are computed for every depth.
+        """
+    )
+    source = st.radio(
+        "Input",
+        ["T2 distribution", "CPMG echo trains"],
+        horizontal=True,
+        key="t2_input",
+    )
+    uploaded_file = st.file_uploader(source, type=["csv", "npy"], key="t2_file")
+    if source == "CPMG echo trains":
+        cols = st.columns(3)
+        with cols[0]:
+            te = st.number_input("Echo spacing (ms)", min_value=0.01, value=0.2)
+        with cols[1]:
+            n_bins = st.number_input("T2 bins", min_value=8, value=64, step=1)
+        with cols[2]:
+            alpha = st.number_input(
+                "Regularization",
+                min_value=0.0,
+                value=1.0,
+                help="Larger values give smoother T2 distributions",
+            )
+    cols = st.columns(3)
+    with cols[0]:
+        t2_min = st.number_input(r"$T_2$ first bin (ms)", min_value=0.01, value=0.3)
+        t2_max = st.number_input(r"$T_2$ last bin (ms)", min_value=0.01, value=3000.0)
+    with cols[1]:
+        cutoff = st.number_input(
+            r"$T_2$ cutoff (ms)",
+            min_value=0.01,
+            value=33.0,
+            help="Usually 33 ms for sandstones and 92 ms for carbonates",
+        )
+    with cols[2]:
+        a = st.number_input(r"SDR $a$", min_value=0.0, value=4.0, key="t2_sdr_a")
+        c = st.number_input(r"Coates $C$", min_value=0.01, value=10.0, key="t2_c")
+
+    if st.button("Calculate", key="t2_calculate"):
+        if uploaded_file is None:
+            st.warning("Upload a T2 distribution file.")
+            return
+        try:
+            depth, data = load_depth_table(uploaded_file)
+            if source == "CPMG echo trains":
+                with st.spinner("Inverting echo trains..."):
+                    amplitudes = nmr.invert_echoes(
+                        data, te, t2_min, t2_max, int(n_bins), alpha
+                    )
+            else:
+                amplitudes = data
+            t2 = nmr.t2_axis(t2_min, t2_max, amplitudes.shape[1])
+            curves = nmr.nmr_curves(amplitudes, t2, cutoff, sdr_a=a, coates_c=c)
+        except Exception as e:
+            st.write(f"An error occurred: {e}")
+            return
+
+        df = pd.DataFrame(curves, index=pd.Index(depth, name="DEPTH"))
+        st.line_chart(df[["TCMR", "BVI", "FFI"]])
+        st.line_chart(np.log10(df[["KSDR", "KTIM"]].where(df[["KSDR", "KTIM"]] > 0)))
+        st.caption("Permeabilities in log10(mD)")
+        st.dataframe(df)
@@ -1,5 +1,13 @@
+import pandas as pd
 import streamlit as st
 
+import scripts.petrophysics.gas as gas
+from components.petrofisicahub.pvt_tab import pvt_fvf, render_pvt
+from components.petrofisicahub.volumetrics_tab import (
+    render_map_volumes,
+    render_probabilistic_volumes,
+)
+
 
 def render_oil_reserves():
     st.write(
@@ -20,6 +28,8 @@ def render_oil_reserves():
             "Oil Reserves",
             r"Oil Volume Factor ($B_{oi}$)",
             "Gas-Oil Ratio (GOR)",
+            "PVT",
+            "Probabilistic",
         ]
 
         reserve_tabs = st.tabs(list_of_reserves_tabs)
@@ -59,9 +69,12 @@ def render_oil_reserves():
                 oil_sh = st.number_input(
                     r"$S_{h}$ (decimal)", min_value=0.00, max_value=1.00
                 )
-                oil_boi = st.number_input(r"$B_{oi}$ (Bbls/STB)", min_value=0.01)
+                if st.checkbox(r"$B_{oi}$ from the PVT table", key="oil_boi_pvt"):
+                    oil_boi = pvt_fvf("BO", "oil_boi")
+                else:
+                    oil_boi = st.number_input(r"$B_{oi}$ (Bbls/STB)", min_value=0.01)
 
-            if st.button("Calculate Reserves"):
+            if st.button("Calculate Reserves") and oil_boi is not None:
                 try:
                     oil_nf = (
                         7758 * oil_acre * oil_h * oil_phi * oil_sh * oil_fr
@@ -99,10 +112,17 @@ def render_oil_reserves():
                 gor_final = gor_gas / gor_oil
                 st.metric("Gas-Oil Ratio", value=f"{gor_final} SFC/STB")
 
+        with reserve_tabs[3]:
+            render_pvt()
+
+        with reserve_tabs[4]:
+            render_probabilistic_volumes("oil")
+
     with st.expander("Gas"):
         list_of_gas_reserves_tab = [
             "Gas Reserves",
             "Gas Reserves - Alternate",
+            "Probabilistic",
         ]
         gas_reserve_tabs = st.tabs(list_of_gas_reserves_tab)
 
@@ -156,13 +176,18 @@ def render_oil_reserves():
                         max_value=1.00,
                         key="gas_sh",
                     )
-                    gas_boi = st.number_input(
-                        r"$B_{gi}$ (Bbls/STB)",
-                        min_value=0.01,
-                        key="gas_boi",
-                    )
+                    if st.checkbox(r"$B_{gi}$ from the PVT table", key="gas_boi_pvt"):
+                        # A tabela dá Bg em cubic ft/SCF; aqui entra o inverso
+                        bg = pvt_fvf("BG", "gas_boi")
+                        gas_boi = None if bg is None else 1 / bg
+                    else:
+                        gas_boi = st.number_input(
+                            r"$B_{gi}$ (Bbls/STB)",
+                            min_value=0.01,
+                            key="gas_boi",
+                        )
 
-                if st.button("Calculate Reservas", key="gas"):
+                if st.button("Calculate Reservas", key="gas") and gas_boi is not None:
                     try:
                         gas_nf = (
                             43560
@@ -180,21 +205,77 @@ def render_oil_reserves():
                         st.warning(f"An error occurred: {e}")
 
             with gas_f_tabs[1]:
+                z_source = st.radio(
+                    "Compressibility factor",
+                    options=["Compute from gas gravity", "Enter Z"],
+                    horizontal=True,
+                    key="z_source",
+                )
                 cols = st.columns(3)
                 with cols[0]:
                     formation_temp = st.number_input("$T_{f}$ (ºF)", min_value=0.00)
                 with cols[1]:
                     reservoir_pressure = st.number_input("$P$ (psi)", min_value=0.01)
                 with cols[2]:
-                    compressibility_factor = st.number_input("$Z$", min_value=0.00)
+                    if z_source == "Enter Z":
+                        compressibility_factor = st.number_input("$Z$", min_value=0.00)
+                    else:
+                        gas_gravity = st.number_input(
+                            r"$\gamma_{g}$ (air = 1)",
+                            min_value=0.55,
+                            max_value=3.0,
+                            value=0.65,
+                            key="gas_gravity",
+                        )
+                        z_method = st.selectbox(
+                            "Correlation",
+                            gas.Z_METHODS,
+                            format_func=lambda m: m.replace("_", " ").title(),
+                            key="z_method",
+                        )
 
                 if st.button("Calculate", key="bgf"):
-                    bgf = (
-                        0.02827 * compressibility_factor * (459.7 + formation_temp)
-                    ) / reservoir_pressure
-                    st.metric(
-                        r"Gas Volume Factor ($B_{gi}$)", value=f"{bgf:.2f} SCF/CF"
+                    try:
+                        if z_source != "Enter Z":
+                            compressibility_factor = gas.z_factor(
+                                reservoir_pressure,
+                                formation_temp,
+                                gas_gravity,
+                                z_method,
+                            )
+                            st.metric("Z", value=f"{compressibility_factor:.4f}")
+                        bgf = gas.gas_fvf(
+                            reservoir_pressure, formation_temp, compressibility_factor
+                        )
+                        st.metric(
+                            r"Gas Volume Factor ($B_{gi}$)", value=f"{bgf:.5f} SCF/CF"
+                        )
+                    except Exception as e:
+                        st.warning(f"An error occurred: {e}")
+
+                if z_source != "Enter Z":
+                    st.write(
+                        """
+                        Depletion of a volumetric gas reservoir: Z, $B_{g}$ and recovery factor from the reservoir pressure down to the abandonment pressure.
+                        """
+                    )
+                    abandonment = st.number_input(
+                        "Abandonment pressure (psi)", min_value=0.0, value=500.0
                     )
+                    if st.button("Calculate depletion", key="depletion"):
+                        try:
+                            path = gas.depletion_path(
+                                reservoir_pressure,
+                                abandonment,
+                                formation_temp,
+                                gas_gravity,
+                                method=z_method,
+                            )
+                            df = pd.DataFrame(path).set_index("P")
+                            st.line_chart(df[["Z", "RF"]])
+                            st.dataframe(df)
+                        except Exception as e:
+                            st.warning(f"An error occurred: {e}")
 
         with gas_reserve_tabs[1]:
             st.latex(
@@ -265,3 +346,9 @@ def render_oil_reserves():
                     st.metric("Gas Reserves", value=f"{gas_nf:.2f} Stock-Tank Barrel")
                 except Exception as e:
                     st.warning(f"An error occurred: {e}")
+
+        with gas_reserve_tabs[2]:
+            render_probabilistic_volumes("gas")
+
+    with st.expander("Maps"):
+        render_map_volumes()
@@ -1,8 +1,11 @@
 import streamlit as st
 import scripts.petrophysics.porosity as porosity
 import scripts.petrophysics.shale_volume as sv
+import scripts.petrophysics.permeability as pm
 import numpy as np
 
+from components.petrofisicahub.nmr_tab import render_t2_distribution
+
 
 def render_permeability():
 
@@ -62,9 +65,9 @@ def render_permeability():
             )
         if st.button("Calculate", key=key_mgo * 3):
             try:
-                constant = 250 if radio_calcs == "Medium Gravity Oil" else 73
+                constant = pm.WYLLIE_ROSE_CONSTANTS[radio_calcs]
 
-                K = (constant * ((phi**3) / swirr)) ** 2
+                K = pm.wyllie_rose(phi, swirr, constant)
                 st.metric("Permeability", value=f"{K:.4f} mD")
             except Exception as e:
                 st.warning(f"An error occurred: {e}")
@@ -100,7 +103,7 @@ def render_permeability():
 
         if st.button("Calculate", key="timur_perm_3"):
             try:
-                K = ((93 * phi ** (2.2)) / (swirr)) ** 2
+                K = pm.timur(phi, swirr)
                 st.metric("Permeability", value=f"{K:.4f}")
             except Exception as e:
                 st.error(f"An error occurred: {e}")
@@ -151,9 +154,7 @@ def render_permeability():
 
             if st.button("Calculate", key="coates_perm_6"):
                 try:
-                    num = C * phi ** (2 * W)
-                    den = W**4 * (rw / rtirr)
-                    K = (num / den) ** 2
+                    K = pm.coates_dumanoir(phi, rw, rtirr, C, W)
                     st.metric("Permeability", value=f"{K:.4f} mD")
                 except Exception as e:
                     st.error(f"An error occurred: {e}")
@@ -214,10 +215,7 @@ def render_permeability():
 
             if st.button("Calculate", key="w_coates_perm_4"):
                 try:
-                    factor1 = 3.75 - phi
-                    num = (np.log10(rw / rtirr) + 2.2) ** 2
-                    den = 2.0
-                    W = (factor1 + (num / den)) ** (1 / 2)
+                    W = pm.coates_dumanoir_w(phi, rw, rtirr)
                     st.metric("Constant W", value=f"{W}")
                 except Exception as e:
                     st.write(f"An error occurred: {e}")
@@ -251,13 +249,13 @@ def render_permeability():
 
             if st.button("Calculate", key="c_coates_perm_2"):
                 try:
-                    C = 23 + 465 * rho_h - 188 * rho_h**2
+                    C = pm.coates_dumanoir_c(rho_h)
                     st.metric("Constant C", value=f"{C}")
                 except Exception as e:
                     st.write(f"An error occurred: {e}")
 
     with st.expander("NMR"):
-        tabs = st.tabs(["Normal Model", "Coates Model"])
+        tabs = st.tabs(["Normal Model", "Coates Model", "T2 Distribution"])
 
         with tabs[0]:
             st.write(
@@ -293,7 +291,7 @@ def render_permeability():
 
             if st.button("Calculate", key="nmr_4"):
                 try:
-                    K = a * (phi_nmr**4) * (t2gm**2)
+                    K = pm.nmr_sdr(phi_nmr, t2gm, a)
                     st.metric("Permeability", value=f"{K:.4f} mD")
                 except Exception as e:
                     st.write(f"An error occurred: {e}")
@@ -334,7 +332,10 @@ def render_permeability():
 
             if st.button("Calculate", key="nmr_coates_5"):
                 try:
-                    K = ((phi_nmr / C) ** 4) * ((FFI / BVI) ** 2)
+                    K = pm.nmr_coates(phi_nmr, FFI, BVI, C)
                     st.metric("Permeability", value=f"{K:.4f} mD")
                 except Exception as e:
                     st.write(f"An error occurred: {e}")
+
+        with tabs[2]:
+            render_t2_distribution()
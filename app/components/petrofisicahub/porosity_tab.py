@@ -1,6 +1,12 @@
 import streamlit as st
 import scripts.petrophysics.porosity as porosity
 import scripts.petrophysics.shale_volume as sv
+from components.petrofisicahub.flag_warnings import (
+    DENSITY_POROSITY_WARNINGS,
+    NEUTRON_DENSITY_POROSITY_WARNINGS,
+    SONIC_POROSITY_WARNINGS,
+    warn_flags,
+)
 
 # TODO - Turn this into a class (future refactoring)
 
@@ -59,7 +65,10 @@ def render_porosity():
 
             if st.button("Calculate", key=1):
                 try:
-                    result = porosity.density_porosity(rho_log, rho_matrix, rho_fluid)
+                    result, flags = porosity.density_porosity(
+                        rho_log, rho_matrix, rho_fluid
+                    )
+                    warn_flags(flags, DENSITY_POROSITY_WARNINGS)
                     if 0 < result < 1:
                         st.metric(
                             label="Porosity",
@@ -101,13 +110,14 @@ def render_porosity():
             if st.button("Calculate", key=2):
                 try:
                     if squared_btn == "Sim":
-                        result = porosity.neutron_density_porosity(
+                        result, flags = porosity.neutron_density_porosity(
                             phid=phid, phin=phin, squared=True
                         )
                     elif squared_btn == "Não":
-                        result = porosity.neutron_density_porosity(
+                        result, flags = porosity.neutron_density_porosity(
                             phid=phid, phin=phin, squared=False
                         )
+                    warn_flags(flags, NEUTRON_DENSITY_POROSITY_WARNINGS)
                     st.success(f"Porosity calculada: {result:.4f} | {result*100:.2f}%")
                 except Exception as e:
                     st.warning(e)
@@ -166,9 +176,10 @@ def render_porosity():
                 )
             if st.button("Calculate", key="sonic_porosity"):
                 try:
-                    result = porosity.sonic_porosity(
+                    result, flags = porosity.sonic_porosity(
                         delta_t_log, delta_t_ma, delta_t_fl
                     )
+                    warn_flags(flags, SONIC_POROSITY_WARNINGS)
                     if 0 < result < 1:
                         st.metric("Porosity", value=f"{result:.4g} | {result*100:.2f}%")
                     else:
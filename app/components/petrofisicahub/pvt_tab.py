@@ -0,0 +1,181 @@
+import io
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from scripts.petrophysics.pvt import PVT_CORRELATIONS, PVTTable, bubble_point
+
+LABELS = {
+    "RS": "GOR (SCF/STB)",
+    "BO": "Bo (Bbls/STB)",
+    "BG": "Bg (cubic ft/SCF)",
+    "MUO": "Oil viscosity (cp)",
+}
+
+PVT_SOURCES = ("Correlations", "Lab data")
+
+# Fluido usado pelas outras seções antes de a aba PVT ser aberta
+PVT_DEFAULTS = {
+    "pvt_source": "Correlations",
+    "pvt_api": 35.0,
+    "pvt_gamma_g": 0.75,
+    "pvt_rsb": 600.0,
+    "pvt_correlation": "STANDING",
+    "pvt_lab_t": 200.0,
+}
+
+
+@st.cache_resource(max_entries=16)
+def build_pvt_table(api, gamma_g, rsb, correlation):
+    """PVT table of a fluid, shared between reruns and sessions"""
+    return PVTTable.from_correlations(api, gamma_g, rsb, correlation)
+
+
+@st.cache_resource(max_entries=16)
+def read_lab_table(data, temperature):
+    """PVT table of a laboratory report (CSV bytes), shared between reruns.
+
+    The file has a pressure column `P` (psia) and one column per property
+    (e.g. `RS`, `BO`, `BG`, `MUO`). With a temperature column `T` (ºF) every
+    temperature must be measured at the same pressures; without it the
+    report is taken at `temperature`.
+    """
+    df = pd.read_csv(io.BytesIO(data))
+    df.columns = [str(c).strip().upper() for c in df.columns]
+    if "P" not in df:
+        raise ValueError("The lab data needs a pressure column 'P'.")
+    names = [c for c in df.columns if c not in ("P", "T")]
+    if not names:
+        raise ValueError("The lab data has no property columns.")
+    if "T" not in df:
+        tables = {name: df[name].to_numpy(float) for name in names}
+        return PVTTable.from_lab(df["P"].to_numpy(float), temperature, **tables)
+
+    grid = df.pivot_table(index="T", columns="P", values=names)
+    if grid.isna().any().any():
+        raise ValueError("Every temperature must be measured at the same pressures.")
+    tables = {name: grid[name].to_numpy() for name in names}
+    return PVTTable.from_lab(grid[names[0]].columns, grid.index, **tables)
+
+
+def pvt_table():
+    """PVT table of the fluid set in the PVT tab, from correlations or lab data"""
+    state = {k: st.session_state.get(k, v) for k, v in PVT_DEFAULTS.items()}
+    if state["pvt_source"] == "Lab data":
+        uploaded = st.session_state.get("pvt_lab_file")
+        if uploaded is None:
+            raise ValueError("Upload the lab data in the PVT tab.")
+        return read_lab_table(uploaded.getvalue(), state["pvt_lab_t"])
+    return build_pvt_table(
+        state["pvt_api"],
+        state["pvt_gamma_g"],
+        state["pvt_rsb"],
+        state["pvt_correlation"],
+    )
+
+
+def pvt_fvf(name, key):
+    """Volume factor `name` ("BO" or "BG") of the PVT table at a typed P and T.
+
+    Returns None, after a warning, when the table cannot be built.
+    """
+    cols = st.columns(2)
+    with cols[0]:
+        pressure = st.number_input(
+            "$P$ (psi)", min_value=14.7, value=3000.0, key=f"{key}_p"
+        )
+    with cols[1]:
+        temperature = st.number_input("$T_{f}$ (ºF)", value=200.0, key=f"{key}_t")
+    try:
+        value = float(pvt_table().query(pressure, temperature, [name])[name])
+    except ValueError as e:
+        st.warning(f"An error occurred: {e}")
+        return None
+    st.caption(f"{LABELS[name]} from the PVT table: {value:.4g}")
+    return value
+
+
+def render_pvt():
+    st.write(
+        """
+        Black-oil properties (solution gas-oil ratio, oil and gas volume factors and oil viscosity) from the Standing or Vasquez & Beggs correlations.
+        The table of each fluid is built once over a pressure and temperature grid and every query is interpolated from it.
+        Laboratory data can be used instead: a CSV file with a pressure column `P` (psi), an optional temperature column `T` (ºF) and one column per property (`RS`, `BO`, `BG`, `MUO`).
+        The volumetrics and reserves sections take their volume factors from the fluid set here.
+        """
+    )
+    source = st.radio("Source", PVT_SOURCES, horizontal=True, key="pvt_source")
+    cols = st.columns(3)
+    with cols[0]:
+        api = st.number_input(
+            "Oil gravity (ºAPI)",
+            min_value=5.0,
+            value=PVT_DEFAULTS["pvt_api"],
+            key="pvt_api",
+        )
+        gamma_g = st.number_input(
+            r"$\gamma_{g}$ (air = 1)",
+            min_value=0.55,
+            value=PVT_DEFAULTS["pvt_gamma_g"],
+            key="pvt_gamma_g",
+        )
+    with cols[1]:
+        rsb = st.number_input(
+            r"$R_{sb}$ (SCF/STB)",
+            min_value=1.0,
+            value=PVT_DEFAULTS["pvt_rsb"],
+            help="Solution gas-oil ratio at the bubble point",
+            key="pvt_rsb",
+        )
+        correlation = st.selectbox(
+            "Correlation",
+            PVT_CORRELATIONS,
+            format_func=lambda c: c.replace("_", " ").title(),
+            key="pvt_correlation",
+        )
+        if source == "Lab data":
+            st.file_uploader("Lab data", type=["csv", "txt"], key="pvt_lab_file")
+            st.number_input(
+                "Lab temperature (ºF)",
+                value=PVT_DEFAULTS["pvt_lab_t"],
+                help="Used when the file has no `T` column",
+                key="pvt_lab_t",
+            )
+    with cols[2]:
+        temperature = st.number_input(
+            "$T_{f}$ (ºF)", min_value=60.0, max_value=350.0, value=200.0, key="pvt_t"
+        )
+        pressure = st.number_input(
+            "$P$ (psi)", min_value=14.7, max_value=10000.0, value=3000.0, key="pvt_p"
+        )
+
+    if st.button("Calculate", key="pvt"):
+        try:
+            table = pvt_table()
+            point = table.query(pressure, temperature)
+            pb = None
+            if source == "Correlations":
+                pb = bubble_point(rsb, temperature, api, gamma_g, correlation)
+        except Exception as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        cols = st.columns(len(table.properties) + 1)
+        with cols[0]:
+            if pb is not None:
+                st.metric("Bubble point", value=f"{pb:.0f} psi")
+        for col, name in zip(cols[1:], table.properties):
+            with col:
+                st.metric(LABELS.get(name, name), value=f"{point[name]:.4g}")
+
+        if pb is None:
+            p = np.linspace(table.pressure[0], table.pressure[-1], 200)
+        else:
+            p = np.linspace(14.7, max(2 * pb, pressure), 200)
+        curves = table.query(p, temperature)
+        df = pd.DataFrame(curves, index=pd.Index(p, name="P (psi)"))
+        chart_cols = st.columns(2)
+        for i, name in enumerate(table.properties):
+            with chart_cols[i % 2]:
+                st.line_chart(df[name].rename(LABELS.get(name, name)))
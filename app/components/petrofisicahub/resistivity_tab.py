@@ -1,6 +1,8 @@
 import streamlit as st
 import numpy as np
 
+import scripts.petrophysics.temperature as temperature
+
 
 def render_resistivity():
     st.write(
@@ -96,34 +98,38 @@ def render_resistivity():
     with st.expander("Water Resistivity - Western Atlas (1985)"):
         st.write(
             r"""
-            Western Atlas (1985) proposed an equation for calculating water resistivity ($R_w$), composed of mathematical expressions and values such as the equivalent water resistivity ($R_{we}$) and the bottom hole temperature ($\text{BHT}$). The equation is as follows:
+            Western Atlas (1985) proposed an equation for calculating water resistivity ($R_{w}$), composed of mathematical expressions and values such as the equivalent water resistivity ($R_{we}$) and the formation temperature ($T_{f}$), taken at the formation depth from the bottom hole temperature ($\text{BHT}$) with the gradient below. The equation is as follows:
             """
         )
         st.latex(
-            r"R_{w} = \frac{ R_{we} + 0.131 \cdot 10 ^ {\left(\frac{1}{\log(\text{BHT}/19.9)} - 2 \right)} }{ -0.5 \cdot R_{we} + 10 ^ {\left(\frac{0.0426}{\log(\text{BHT}/50.8)}\right)} }"
+            r"R_{w} = \frac{ R_{we} + 0.131 \cdot 10 ^ {\left(\frac{1}{\log(T_{f}/19.9)} - 2 \right)} }{ -0.5 \cdot R_{we} + 10 ^ {\left(\frac{0.0426}{\log(T_{f}/50.8)}\right)} }"
         )
 
-        cols = st.columns(2)
+        cols = st.columns(3)
         with cols[0]:
             rwe = st.number_input("$R_{we} $ (ohm-m)", min_value=0.00)
+            amst = st.number_input(r"$AMST$ (ºF)", value=75.0, key="amst_rw")
         with cols[1]:
             bht = st.number_input(r"$\text{BHT}$ (ºF)", min_value=0.00)
+            td = st.number_input(r"$TD$ (ft)", min_value=0.00, key="td_rw")
+        with cols[2]:
+            fd = st.number_input(r"$FD$ (ft)", min_value=0.00, key="fd_rw")
 
         if st.button("Calculate", key="western_atlas_1"):
             try:
-                if a == 0:
-                    st.warning("The tortuosity factor cannot be zero.")
+                tf = float(temperature.formation_temperature(fd, amst, [(td, bht)]))
+                rw = (rwe + 0.131 * 10 ** ((1 / (np.log10(tf / 19.9))) - 2)) / (
+                    -0.5 * rwe + 10 ** (0.0426 / np.log10(tf / 50.8))
+                )
+                if rw < 0:
+                    st.error("Something is wrong, the result cannot be negative.")
                 else:
-                    rw = (rwe + 0.131 * 10 ** ((1 / (np.log10(bht / 19.9))) - 2)) / (
-                        -0.5 * rwe + 10 ** (0.0426 / np.log10(bht / 50.8))
+                    st.metric(
+                        "Water Resistivity",
+                        value=f"{rw:.4f} ohm-m",
+                        delta=f"at {tf:.1f} ºF",
+                        delta_color="off",
                     )
-                    if rw < 0:
-                        st.error("Something is wrong, the result cannot be negative.")
-                    else:
-                        st.metric(
-                            "Water Resistivity",
-                            value=f"{rw:.4f} ohm-m",
-                        )
             except Exception as e:
                 st.warning(f"An error occurred: {e}")
 
@@ -157,9 +163,7 @@ def render_resistivity():
             if st.button("Calculate", key="western_atlas_2"):
                 try:
                     rwe = rmf * 10 ** (sp / (61 + 0.133 * bht))
-                    st.metric(
-                        "Equivalent Water Resistivity", value=f"{rwe:.4f} ohm-m"
-                    )
+                    st.metric("Equivalent Water Resistivity", value=f"{rwe:.4f} ohm-m")
                 except Exception as e:
                     st.warning(f"An error occurred: {e}")
 
@@ -180,17 +184,15 @@ def render_resistivity():
                 )
             with cols[1]:
                 tsurf = st.number_input(
-                    r"$T_{surf}$ (ºC)", min_value=0.00, key="tsurf_rmf"
+                    r"$T_{surf}$ (ºF)", min_value=0.00, key="tsurf_rmf"
                 )
             with cols[2]:
-                tf = st.number_input("$SP$ (mV)", min_value=0.00, key="tf_rmf")
+                tf = st.number_input("$T_{f}$ (ºF)", min_value=0.00, key="tf_rmf")
 
             if st.button("Calculate", key="wester_atlas_3"):
                 try:
-                    rmf = (rmfsurf * (tsurf + 6.77)) / (tf + 6.77)
-                    st.metric(
-                        "Equivalent Water Resistivity", value=f"{rmf:.4f} ohm-m"
-                    )
+                    rmf = temperature.arps(rmfsurf, tsurf, tf)
+                    st.metric("Mud Filtrate Resistivity", value=f"{rmf:.4f} ohm-m")
                 except Exception as e:
                     st.warning(f"An error occurred: {e}")
         with wes_at_tabs[2]:
@@ -215,10 +217,10 @@ def render_resistivity():
 
             if st.button("Calculate", key="calculate_tf"):
                 try:
-                    tf = ((bht - amst) / td * fd) + amst
-                    st.metric("Formation Temperature", value=f"{tf:.2f} ºF")
-                except:
-                    print("An exception occurred")
+                    tf = temperature.formation_temperature(fd, amst, [(td, bht)])
+                    st.metric("Formation Temperature", value=f"{float(tf):.2f} ºF")
+                except ValueError as e:
+                    st.warning(f"An error occurred: {e}")
 
     with st.expander("Water Resistivity - SP Log"):
         st.write(
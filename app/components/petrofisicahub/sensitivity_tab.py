@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import scripts.petrophysics.permeability as perm
+import scripts.petrophysics.porosity as porosity
+import scripts.petrophysics.water_saturation as ws
+from scripts.petrophysics.sensitivity import sensitivity
+
+# Variação padrão em torno do caso base (low e high)
+DEFAULT_SWING = 0.1
+
+
+def _coates_dumanoir(phi, rw, rtirr, rho_h):
+    c = perm.coates_dumanoir_c(rho_h)
+    w = perm.coates_dumanoir_w(phi, rw, rtirr)
+    return perm.coates_dumanoir(phi, rw, rtirr, c, w)
+
+
+# Equação e caso base de cada parâmetro
+SENSITIVITY_MODELS = {
+    "Density porosity": (
+        lambda rhob, rhom, rhof: porosity.density_porosity(rhob, rhom, rhof)[0],
+        {"rhob": 2.4, "rhom": 2.65, "rhof": 1.0},
+    ),
+    "Sonic porosity": (
+        lambda dt, dtma, dtf: porosity.sonic_porosity(dt, dtma, dtf)[0],
+        {"dt": 80.0, "dtma": 55.5, "dtf": 189.0},
+    ),
+    "Sw - Archie": (
+        ws.archie,
+        {"rt": 20.0, "phi": 0.2, "rw": 0.05, "a": 1.0, "m": 2.0, "n": 2.0},
+    ),
+    "Sw - Simandoux": (
+        ws.simandoux,
+        {"rt": 20.0, "phi": 0.2, "rw": 0.05, "vsh": 0.2, "rsh": 4.0},
+    ),
+    "Sw - Schlumberger": (
+        ws.schlumberger,
+        {"rt": 20.0, "phi": 0.2, "rw": 0.05, "vsh": 0.2, "rsh": 4.0},
+    ),
+    "Sw - Fertl": (
+        ws.fertl,
+        {"rt": 20.0, "phi": 0.2, "rw": 0.05, "vsh": 0.2, "a": 0.25},
+    ),
+    "Sw - Dewan (compensated)": (
+        ws.dewan_compensated,
+        {"rt": 20.0, "phi_s": 0.2, "rw": 0.05},
+    ),
+    "Sw - Dewan (dispersed clay)": (
+        ws.dewan_dispersed_clay,
+        {"rt": 20.0, "phi_s": 0.2, "rw": 0.05, "q": 0.2},
+    ),
+    "K - Timur": (perm.timur, {"phi": 0.2, "swirr": 0.2}),
+    "K - Wyllie & Rose": (
+        perm.wyllie_rose,
+        {"phi": 0.2, "swirr": 0.2, "constant": 250.0},
+    ),
+    "K - Coates & Dumanoir": (
+        _coates_dumanoir,
+        {"phi": 0.2, "rw": 0.05, "rtirr": 20.0, "rho_h": 0.8},
+    ),
+    "K - NMR SDR": (perm.nmr_sdr, {"phi_nmr": 0.2, "t2gm": 100.0, "a": 4.0}),
+    "K - NMR Coates": (
+        perm.nmr_coates,
+        {"phi_nmr": 0.2, "ffi": 0.15, "bvi": 0.05, "c": 10.0},
+    ),
+}
+
+
+@st.cache_data(max_entries=64)
+def sensitivity_charts(model, parameters, n):
+    """Tornado and Sobol charts, computed once per equation and parameter set.
+
+    `parameters` is a tuple of (name, base, low, high) rows; parameters whose
+    low and high equal the base are kept fixed.
+    """
+    function = SENSITIVITY_MODELS[model][0]
+    base = {name: b for name, b, _, _ in parameters}
+    varied = [(name, lo, hi) for name, b, lo, hi in parameters if lo != b or hi != b]
+    result = sensitivity(
+        function,
+        base,
+        {name: lo for name, lo, _ in varied},
+        {name: hi for name, _, hi in varied},
+        n=n,
+        seed=0,
+    )
+
+    # Barras do caso base até o resultado de low e de high, maior variação no topo
+    names = result["NAMES"][::-1]
+    y0 = result["BASE"]
+    tornado = go.Figure()
+    for label, values in (("Low", result["LOW"]), ("High", result["HIGH"])):
+        tornado.add_trace(
+            go.Bar(
+                y=names,
+                x=values[::-1] - y0,
+                base=y0,
+                orientation="h",
+                name=label,
+            )
+        )
+    tornado.update_layout(
+        barmode="overlay", xaxis_title=f"{model} (base {y0:.4g})", yaxis_title=None
+    )
+
+    sobol = go.Figure(
+        [
+            go.Bar(x=result["NAMES"], y=result["FIRST"], name="First order"),
+            go.Bar(x=result["NAMES"], y=result["TOTAL"], name="Total"),
+        ]
+    )
+    sobol.update_layout(barmode="group", yaxis_title="Sobol index")
+    table = pd.DataFrame(
+        {k: result[k] for k in ("LOW", "HIGH", "FIRST", "TOTAL")},
+        index=pd.Index(result["NAMES"], name="Parameter"),
+    )
+    return tornado, sobol, table
+
+
+def render_sensitivity():
+    st.write(
+        """
+        Find which input drives the result of an equation. The tornado chart moves each input alone to its low and high value, from the base case; the Sobol indices split the variance of the result among the inputs sampled between low and high, where the first-order index is the share of each input alone and the total index adds its interactions with the others.
+        Inputs whose low and high equal the base stay fixed.
+        """
+    )
+    model = st.selectbox("Equation", list(SENSITIVITY_MODELS), key="sensitivity_model")
+    defaults = SENSITIVITY_MODELS[model][1]
+    table = pd.DataFrame(
+        {
+            "Base": defaults,
+            "Low": {k: v * (1 - DEFAULT_SWING) for k, v in defaults.items()},
+            "High": {k: v * (1 + DEFAULT_SWING) for k, v in defaults.items()},
+        }
+    )
+    table.index.name = "Parameter"
+    edited = st.data_editor(
+        table,
+        column_config={
+            c: st.column_config.NumberColumn(c, format="%.4g") for c in table
+        },
+        key=f"sensitivity_table_{model}",
+    )
+    n = st.number_input(
+        "Sobol samples", min_value=1024, value=4096, step=1024, key="sensitivity_n"
+    )
+
+    if st.button("Calculate", key="sensitivity_calculate"):
+        parameters = tuple(
+            (name, float(row.Base), float(row.Low), float(row.High))
+            for name, row in edited.iterrows()
+        )
+        if any(np.isnan(v) for row in parameters for v in row[1:]):
+            st.warning("Fill the base, low and high value of every parameter.")
+            return
+        try:
+            tornado, sobol, result = sensitivity_charts(model, parameters, int(n))
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+        st.plotly_chart(tornado)
+        st.plotly_chart(sobol)
+        st.dataframe(result)
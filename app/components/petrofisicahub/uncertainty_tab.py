@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.permeability as perm
+import scripts.petrophysics.porosity as porosity
+import scripts.petrophysics.uncertainty as uncertainty
+import scripts.petrophysics.water_saturation as ws
+from scripts.welllog.las import find_curve
+from components.petrofisicahub.zones_tab import zone_parameter
+
+# Número máximo de amostras enviadas para o gráfico
+MAX_PLOT_SAMPLES = 5000
+
+# Equação, curvas de entrada (argumento: tipo de curva) e parâmetros
+UNCERTAINTY_MODELS = {
+    "Density porosity": (
+        lambda rhob, rhom, rhof: porosity.density_porosity(rhob, rhom, rhof)[0],
+        {"rhob": "RHOB"},
+        ("rhom", "rhof"),
+    ),
+    "Sonic porosity": (
+        lambda dt, dtma, dtf: porosity.sonic_porosity(dt, dtma, dtf)[0],
+        {"dt": "DT"},
+        ("dtma", "dtf"),
+    ),
+    "Archie water saturation": (
+        ws.archie,
+        {"rt": "RT", "phi": "PHIE"},
+        ("rw", "a", "m", "n"),
+    ),
+    "Timur permeability": (perm.timur, {"phi": "PHIE", "swirr": "SW"}, ()),
+}
+
+# Rótulo, média, desvio padrão e distribuição de cada parâmetro
+PARAMETERS = {
+    "rhom": (r"$\rho_{ma}$ (g/cm³)", 2.65, 0.02, "normal"),
+    "rhof": (r"$\rho_{fl}$ (g/cm³)", 1.0, 0.02, "normal"),
+    "dtma": (r"$\Delta t_{ma}$", 55.5, 1.0, "normal"),
+    "dtf": (r"$\Delta t_{fl}$", 189.0, 3.0, "normal"),
+    "rw": ("$R_w$ (ohm-m)", 0.05, 0.01, "lognormal"),
+    "a": ("$a$", 1.0, 0.0, "normal"),
+    "m": ("$m$", 2.0, 0.1, "normal"),
+    "n": ("$n$", 2.0, 0.1, "normal"),
+}
+
+# Coluna da tabela de zonas de cada parâmetro
+ZONE_COLUMNS = {
+    "rhom": "RHOMA",
+    "rhof": "RHOFL",
+    "dtma": "DTMA",
+    "dtf": "DTFL",
+    "rw": "RW",
+    "a": "A",
+    "m": "M",
+    "n": "N",
+}
+
+# Ruído típico de cada perfil (desvio padrão; em % para a resistividade)
+LOG_NOISE = {"RHOB": 0.025, "DT": 2.0, "RT": 5.0, "PHIE": 0.02, "SW": 0.03}
+
+
+def render_uncertainty(mnemonics, depth, load_curves, formation=None):
+    """Uncertainty section; `formation` holds the curves of the temperature profile"""
+    st.write(
+        """
+        Propagate the uncertainty of the parameters and the noise of the logs into a porosity, water saturation or permeability curve.
+        Each parameter gets a mean and standard deviation, drawn once per realization for the whole well, and each log gets a noise level drawn per sample. The realizations give the P90, P50 and P10 curves, the values exceeded with 90, 50 and 10 % probability at each depth.
+        Parameters set per zone in the Zones section replace the mean in those zones, and the standard deviation is drawn around them.
+        """
+    )
+    options = mnemonics[1:]
+    model = st.selectbox("Equation", list(UNCERTAINTY_MODELS), key="uncertainty_model")
+    function, inputs, params = UNCERTAINTY_MODELS[model]
+
+    cols = st.columns(len(inputs))
+    selected, noise = {}, {}
+    for col, (arg, kind) in zip(cols, inputs.items()):
+        with col:
+            curve = find_curve(options, kind)
+            selected[arg] = st.selectbox(
+                f"{kind} curve",
+                options,
+                index=options.index(curve) if curve else 0,
+                key=f"uncertainty_{model}_{arg}",
+            )
+            unit = " (%)" if kind == "RT" else ""
+            noise[arg] = st.number_input(
+                f"Noise{unit}",
+                min_value=0.0,
+                value=LOG_NOISE[kind],
+                format="%.4g",
+                key=f"uncertainty_{model}_{arg}_noise",
+            )
+
+    # Rw da formação em cada profundidade, vindo do perfil de temperatura
+    rw_profile = formation is not None and "rw" in params
+    if rw_profile:
+        rw_profile = st.checkbox(
+            "$R_w$ from the formation temperature profile",
+            value=True,
+            help="Rw at the formation temperature of each depth, set in the Formation Temperature section. Otherwise the Rw of the zone table, if set, or the value below.",
+            key="uncertainty_rw_profile",
+        )
+
+    # Parâmetros que variam com a profundidade recebem um erro sorteado por
+    # realização: relativo (lognormal) ou somado (normal)
+    distributions, errors = {}, {}
+    if params:
+        cols = st.columns(len(params))
+        for col, name in zip(cols, params):
+            label, mean, std, kind = PARAMETERS[name]
+            if name == "rw" and rw_profile:
+                with col:
+                    error = st.number_input(
+                        "$R_w$ uncertainty (%)",
+                        min_value=0.0,
+                        value=100 * std / mean,
+                        format="%.4g",
+                        key="uncertainty_rw_error",
+                    )
+                distributions["rw"] = formation["RW"]
+                if error > 0:
+                    distributions["rw_error"] = {
+                        "type": kind,
+                        "mean": 1.0,
+                        "std": error / 100,
+                    }
+                    errors["rw"] = kind
+                continue
+            with col:
+                mean = st.number_input(
+                    label, value=mean, format="%.4g", key=f"uncertainty_param_{name}"
+                )
+                std = st.number_input(
+                    "Std. deviation",
+                    min_value=0.0,
+                    value=std,
+                    format="%.4g",
+                    key=f"uncertainty_param_{name}_std",
+                )
+            value = zone_parameter(ZONE_COLUMNS[name], mean)
+            if np.ndim(value):
+                distributions[name] = value
+                if std > 0:
+                    distributions[f"{name}_error"] = (
+                        {"type": kind, "mean": 1.0, "std": std / max(mean, 1e-12)}
+                        if kind == "lognormal"
+                        else {"type": kind, "mean": 0.0, "std": std}
+                    )
+                    errors[name] = kind
+            elif std > 0:
+                distributions[name] = {"type": kind, "mean": mean, "std": std}
+            else:
+                distributions[name] = {"type": "constant", "value": mean}
+    n = st.number_input(
+        "Realizations", min_value=10, value=1000, step=100, key="uncertainty_n"
+    )
+
+    if errors:
+        equation = function
+
+        def function(**kwargs):
+            for name, kind in errors.items():
+                error = kwargs.pop(f"{name}_error")
+                if kind == "lognormal":
+                    kwargs[name] = kwargs[name] * error
+                else:
+                    kwargs[name] = kwargs[name] + error
+            return equation(**kwargs)
+
+    if st.button("Calculate", key="uncertainty_calculate"):
+        loaded = load_curves(list(dict.fromkeys(selected.values())))
+        curves = {
+            arg: np.asarray(loaded[c], dtype=float) for arg, c in selected.items()
+        }
+        if "rt" in noise:
+            noise["rt"] = noise["rt"] / 100 * curves["rt"]
+        try:
+            with st.spinner("Running realizations..."):
+                result = uncertainty.monte_carlo_curves(
+                    function, curves, distributions, noise, n=int(n)
+                )
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        step = max(1, depth.size // MAX_PLOT_SAMPLES)
+        names = list(uncertainty.PERCENTILES)
+        df = pd.DataFrame({name: result[name][::step] for name in names})
+        df.index = depth[::step]
+        st.line_chart(df)
+        st.dataframe(pd.DataFrame(result).describe())
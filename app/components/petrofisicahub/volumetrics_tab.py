@@ -0,0 +1,290 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.volumetrics as vol
+from components.petrofisicahub.pvt_tab import pvt_fvf, pvt_table
+
+LABELS = {
+    "area": "A (acres)",
+    "thickness": "h (ft)",
+    "phi": r"$\phi$ (decimal)",
+    "sh": r"$S_{h}$ (decimal)",
+    "rf": "RF (decimal)",
+    "boi": r"$B_{oi}$ (Bbls/STB)",
+    "bgi": r"$B_{gi}$ (SCF/cubic ft)",
+}
+
+DEFAULTS = {
+    "area": 640.0,
+    "thickness": 30.0,
+    "phi": 0.2,
+    "sh": 0.7,
+    "rf": 0.3,
+    "boi": 1.2,
+    "bgi": 150.0,
+}
+
+# Fatores volume que podem vir da tabela PVT: Boi direto e Bgi em SCF/cubic ft,
+# o inverso do Bg da tabela
+FVF_PROPERTIES = {"boi": "BO", "bgi": "BG"}
+
+FVF_SOURCES = ("Single value", "Grid", "PVT table")
+
+
+def distribution_input(name, key):
+    """Widgets for the distribution of one input, returned as a dict.
+
+    The volume factors can also come from the PVT table, as a constant;
+    None when that table cannot be built.
+    """
+    value = DEFAULTS[name]
+    kinds = list(vol.DISTRIBUTIONS)
+    if name in FVF_PROPERTIES:
+        kinds.append("PVT table")
+    kind = st.selectbox(LABELS[name], kinds, key=f"{key}_type")
+    if kind == "PVT table":
+        fvf = pvt_fvf(FVF_PROPERTIES[name], key)
+        if fvf is None:
+            return None
+        return {"type": "constant", "value": fvf if name == "boi" else 1 / fvf}
+    dist = {"type": kind}
+    if kind == "empirical":
+        text = st.text_area("Values", key=f"{key}_sample", help="Comma separated")
+        try:
+            dist["sample"] = np.array(
+                [float(v) for v in text.replace("\n", ",").split(",") if v.strip()]
+            )
+        except ValueError:
+            st.warning("The values must be numbers separated by commas.")
+            dist["sample"] = np.array([])
+        return dist
+
+    # Valores iniciais razoáveis a partir do valor típico da variável
+    start = {
+        "value": value,
+        "mean": value,
+        "std": value * 0.1,
+        "low": value * 0.8,
+        "mode": value,
+        "high": value * 1.2,
+    }
+    for param in vol.DISTRIBUTIONS[kind]:
+        dist[param] = st.number_input(
+            param, value=start[param], format="%.4f", key=f"{key}_{param}"
+        )
+    return dist
+
+
+def render_probabilistic_volumes(fluid="oil"):
+    names = vol.OIL_INPUTS if fluid == "oil" else vol.GAS_INPUTS
+    factor = vol.OIL_FACTOR if fluid == "oil" else vol.GAS_FACTOR
+    divisors = ("boi",) if fluid == "oil" else ()
+    unit = "STB" if fluid == "oil" else "SCF"
+
+    st.write(
+        """
+        Instead of single values, give each input a probability distribution (constant, normal, lognormal, triangular, uniform or an empirical sample of measured values).
+        The reserves are computed for a large number of random realizations and summarized by the P90 (proved), P50 (probable) and P10 (possible) estimates, the values exceeded with 90, 50 and 10 % probability.
+        """
+    )
+    inputs = {}
+    cols = st.columns(3)
+    for i, name in enumerate(names):
+        with cols[i % 3]:
+            inputs[name] = distribution_input(name, key=f"mc_{fluid}_{name}")
+
+    with st.expander("Correlations"):
+        st.write(
+            "Correlation coefficients between the inputs (e.g. porosity and hydrocarbon saturation)."
+        )
+        matrix = st.data_editor(
+            pd.DataFrame(np.eye(len(names)), index=names, columns=names),
+            key=f"mc_{fluid}_correlations",
+        )
+
+    cols = st.columns(2)
+    with cols[0]:
+        n = st.number_input(
+            "Realizations",
+            min_value=1000,
+            max_value=10_000_000,
+            value=1_000_000,
+            step=100_000,
+            key=f"mc_{fluid}_n",
+        )
+    with cols[1]:
+        seed = st.number_input(
+            "Random seed", min_value=0, value=0, key=f"mc_{fluid}_seed"
+        )
+
+    if st.button("Simulate", key=f"mc_{fluid}_run"):
+        if any(dist is None for dist in inputs.values()):
+            return
+        correlations = {
+            (a, b): matrix.loc[a, b]
+            for i, a in enumerate(names)
+            for b in names[i + 1 :]
+            if matrix.loc[a, b]
+        }
+        try:
+            result = vol.monte_carlo_volumes(
+                inputs,
+                int(n),
+                factor=factor,
+                divisors=divisors,
+                correlations=correlations,
+                seed=int(seed),
+            )
+        except Exception as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        cols = st.columns(4)
+        for col, key in zip(cols, ("P90", "P50", "P10", "mean")):
+            with col:
+                st.metric(
+                    key.capitalize() if key == "mean" else key,
+                    value=f"{result[key]:.4g} {unit}",
+                )
+
+        counts, edges = result["histogram"]
+        centers = (edges[:-1] + edges[1:]) / 2
+        st.bar_chart(pd.DataFrame({"Realizations": counts}, index=centers))
+        volumes, exceedance = result["exceedance"]
+        st.line_chart(
+            pd.DataFrame({"Probability of exceedance": exceedance}, index=volumes)
+        )
+
+
+def grid_uploader(label, key):
+    return st.file_uploader(f"{label} (.npy)", type=["npy"], key=key)
+
+
+def spool_grid(uploaded_file, path):
+    """Copy an uploaded grid to `path` and open it memory-mapped (None if absent)"""
+    if uploaded_file is None:
+        return None
+    uploaded_file.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(uploaded_file, f)
+    return vol.load_grid(path)
+
+
+def render_map_volumes():
+    st.write(
+        """
+        In-place volumes from grids (NumPy .npy files) of gross thickness (isochore, ft), porosity, water saturation and, optionally, net-to-gross, all with the same number of rows and columns.
+        The uploaded grids are copied to a temporary file and read in blocks from it, so maps with millions of nodes can be used. An optional grid of integer segment numbers (0 for none) splits the volumes by segment.
+        The volume factor is a single value, a grid, or looked up at every node in the PVT table of the PVT tab from grids of pressure and temperature.
+        """
+    )
+    cols = st.columns(2)
+    files = {}
+    with cols[0]:
+        files["thickness"] = grid_uploader("Isochore grid", key="map_h")
+        files["phi"] = grid_uploader("Porosity grid", key="map_phi")
+        files["sw"] = grid_uploader("Water saturation grid", key="map_sw")
+    with cols[1]:
+        files["ntg"] = grid_uploader("Net-to-gross grid (optional)", key="map_ntg")
+        files["labels"] = grid_uploader("Segments grid (optional)", key="map_seg")
+        fluid = st.radio("Fluid", ["Oil", "Gas"], horizontal=True, key="map_fluid")
+
+    property_name = "BO" if fluid == "Oil" else "BG"
+    fvf_source = st.radio(
+        "Volume factor",
+        FVF_SOURCES,
+        horizontal=True,
+        help="A single value, a grid or the PVT table at pressure and temperature grids",
+        key="map_fvf_source",
+    )
+    cols = st.columns(3)
+    with cols[0]:
+        dx = st.number_input("Cell size X (ft)", min_value=0.01, value=82.0)
+    with cols[1]:
+        dy = st.number_input("Cell size Y (ft)", min_value=0.01, value=82.0)
+    with cols[2]:
+        if fvf_source == "Grid":
+            files["fvf"] = grid_uploader(
+                r"$B_{oi}$ grid" if fluid == "Oil" else r"$B_{gi}$ grid",
+                key="map_fvf",
+            )
+        elif fvf_source == "PVT table":
+            files["pressure"] = grid_uploader("Pressure grid (psi)", key="map_p")
+            files["temperature"] = grid_uploader(
+                "Temperature grid (ºF, optional)", key="map_t"
+            )
+            temperature = st.number_input(
+                "$T_{f}$ (ºF)",
+                value=200.0,
+                help="Used when there is no temperature grid",
+                key="map_tf",
+            )
+        elif fluid == "Oil":
+            fvf = st.number_input(
+                r"$B_{oi}$ (Bbls/STB)", min_value=0.01, value=1.2, key="map_boi"
+            )
+        else:
+            fvf = st.number_input(
+                r"$B_{gi}$ (cubic ft/SCF)",
+                min_value=1e-5,
+                value=0.005,
+                format="%.5f",
+                key="map_bgi",
+            )
+
+    if st.button("Calculate", key="map_volumes"):
+        required = {"thickness", "phi", "sw"} | {
+            "Grid": {"fvf"},
+            "PVT table": {"pressure"},
+        }.get(fvf_source, set())
+        if any(files[name] is None for name in required):
+            st.warning(
+                "Choose the isochore, porosity and water saturation grids and the grids of the volume factor."
+            )
+            return
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                grids = {
+                    name: spool_grid(uploaded_file, Path(tmp) / f"{name}.npy")
+                    for name, uploaded_file in files.items()
+                }
+                if fvf_source == "PVT table":
+                    if grids["temperature"] is None:
+                        grids["temperature"] = temperature
+                    grids.update(pvt=pvt_table(), fvf=property_name)
+                elif fvf_source == "Single value":
+                    grids["fvf"] = fvf
+                result = vol.map_volumes(
+                    **grids,
+                    cell_area=dx * dy / 43560,
+                    factor=vol.OIL_FACTOR if fluid == "Oil" else vol.GAS_FACTOR,
+                )
+        except Exception as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        unit = "STB" if fluid == "Oil" else "SCF"
+        df = pd.DataFrame(result).rename_axis("Segment")
+        df = df[df["AREA"] > 0].rename(index=str)
+        df.loc["Total"] = df.sum()
+        st.metric(
+            "Oil in place" if fluid == "Oil" else "Gas in place",
+            value=f"{df.loc['Total', 'IN_PLACE']:.4g} {unit}",
+        )
+        st.dataframe(
+            df.rename(
+                columns={
+                    "AREA": "Area (acres)",
+                    "GRV": "GRV (acre-ft)",
+                    "NRV": "NRV (acre-ft)",
+                    "PV": "Pore volume (acre-ft)",
+                    "HCPV": "HCPV (acre-ft)",
+                    "IN_PLACE": f"In place ({unit})",
+                }
+            )
+        )
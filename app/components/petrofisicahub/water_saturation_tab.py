@@ -1,5 +1,6 @@
 import streamlit as st
 import numpy as np
+import scripts.petrophysics.water_saturation as ws
 
 
 def render_water_saturation():
@@ -79,10 +80,13 @@ def render_water_saturation():
                 if a == 0:
                     st.warning("The tortuosity factor cannot be zero.")
                 else:
-                    sw_archie = ((a * rw_in) / (rt * (phi**m))) ** (1 / n)
-                    st.success(
-                        f"Calculated Water Saturation: {sw_archie:.4f} | {sw_archie*100:.2f}%"
-                    )
+                    sw_archie = ws.archie(rt, phi, rw_in, a=a, m=m, n=n, clip=False)
+                    if np.isfinite(sw_archie):
+                        st.success(
+                            f"Calculated Water Saturation: {sw_archie:.4f} | {sw_archie*100:.2f}%"
+                        )
+                    else:
+                        st.warning("Check your values, the result is undefined.")
             except Exception as e:
                 print("An error occurred: {e}")
 
@@ -129,7 +133,7 @@ def render_water_saturation():
 
             if st.button("Calculate", key="calc_dewan_comp_sw"):
                 try:
-                    sw = 0.9 * ((np.sqrt(rw / rt)) / (phi_s))
+                    sw = ws.dewan_compensated(rt, phi_s, rw, clip=False)
                     if 0 <= sw <= 1:
                         st.metric("Water Saturation", value=f"{sw:.4g} | {sw*100:.2f}%")
                     else:
@@ -185,9 +189,7 @@ def render_water_saturation():
 
             if st.button("Calculate", key="calc_dewan_clay_sw"):
                 try:
-                    root_1 = (0.8 * rw) / (rt * phi_s**2)
-                    root_2 = (q / 2) ** 2
-                    sw = (np.sqrt(root_1 + root_2) - (q / 2)) / (1 - q)
+                    sw = ws.dewan_dispersed_clay(rt, phi_s, rw, q, clip=False)
                     if 0 <= sw <= 1:
                         st.metric("Water Saturation", value=f"{sw:.4g} | {sw*100:.2f}%")
                     else:
@@ -295,10 +297,7 @@ def render_water_saturation():
 
             if st.button("Calculate", key=key_simandoux + "6"):
                 try:
-                    external_eq = (0.4 * rw) / (phi**2)
-                    root_1 = (vsh / rsh) ** 2
-                    root_2 = (5 * phi**2) / (rt * rw)
-                    sw = external_eq * (np.sqrt(root_1 + root_2) - (vsh / rsh))
+                    sw = ws.simandoux(rt, phi, rw, vsh, rsh, clip=False)
                     if 0 <= sw <= 1:
                         st.metric("Water Saturation", value=f"{sw:.4g} | {sw*100:.2f}%")
                     else:
@@ -361,15 +360,7 @@ def render_water_saturation():
 
             if st.button("Calculate", key=key_slb + "6"):
                 try:
-                    # numerator
-                    term1 = (vsh / rsh) ** 2
-                    term2 = (phi**2) / (0.2 * rw * rt * (1 - vsh))
-                    term3 = vsh / rsh
-                    num = term1 + term2 - term3
-                    # denominator
-                    den = (phi**2) / (0.4 * rw * (1 - vsh))
-
-                    sw = num / den
+                    sw = ws.schlumberger(rt, phi, rw, vsh, rsh, clip=False)
                     if 0 <= sw <= 1:
                         st.metric("Water Saturation", value=f"{sw:.4g} | {sw*100:.2f}%")
                     else:
@@ -434,12 +425,7 @@ def render_water_saturation():
 
             if st.button("Calculate", key=key_ferlt + "6"):
                 try:
-                    root1 = rw / rt
-                    root2 = ((a * vsh) / 2) ** 2
-                    term1 = np.sqrt(root1 + root2)
-                    term2 = (a * vsh) / 2
-
-                    sw = (1 / phi) * (term1 - term2)
+                    sw = ws.fertl(rt, phi, rw, vsh, a, clip=False)
                     if 0 <= sw <= 1:
                         st.metric("Water Saturation", value=f"{sw:.4g} | {sw*100:.2f}%")
                     else:
@@ -0,0 +1,595 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import scripts.petrophysics.gamma_ray as gamma_ray
+import scripts.petrophysics.pickett as pickett
+import scripts.petrophysics.porosity as porosity
+import scripts.petrophysics.shale_volume as sv
+import scripts.petrophysics.sp as sp
+import scripts.petrophysics.temperature as temperature
+from scripts.petrophysics.flags import UNDEFINED
+from scripts.welllog.las import find_curve, read_las
+from scripts.welllog.store import (
+    DATA_ROOT,
+    DEFAULT_STORE,
+    data_directory,
+    list_wells,
+    read_well,
+    well_info,
+    well_version,
+    write_well,
+)
+from components.petrofisicahub.crossplot_tab import render_crossplot
+from components.petrofisicahub.minerals_tab import render_minerals
+from components.petrofisicahub.netpay_tab import render_net_pay
+from components.petrofisicahub.uncertainty_tab import render_uncertainty
+from components.petrofisicahub.zones_tab import (
+    render_zones,
+    zone_parameter,
+    zone_tops,
+    zone_tops_caption,
+)
+from components.petrofisicahub.flag_warnings import (
+    DENSITY_POROSITY_WARNINGS,
+    SONIC_POROSITY_WARNINGS,
+    warn_flags,
+)
+
+# Número máximo de amostras enviadas para os gráficos
+MAX_PLOT_SAMPLES = 5000
+
+# Campos das calculadoras que recebem os parâmetros do gráfico de Pickett
+ARCHIE_KEYS = {
+    "a": ("fator_tortuosidade_1", "fator_tortuosidade_2", "batch_a"),
+    "m": ("expoente_cimentacao_1", "expoente_cimentacao_2", "batch_m"),
+    "rw": (
+        "rw_sw_archie",
+        "dewan_comp_sw_1",
+        "dewan_clay_sw_1",
+        "rw_simandoux",
+        "sw_schlumberger",
+        "sw_ferlt",
+        "batch_rw",
+    ),
+}
+
+# Curvas de porosidade procuradas, em ordem, para o gráfico de Pickett
+PICKETT_POROSITY_CURVES = ("PHIE", "PHIT", "PHID", "PHIND", "NPHI")
+
+
+def load_well_log(uploaded_file, dtype=np.float64):
+    """Parse an uploaded LAS file once and keep it in the session state"""
+    if st.session_state.get("well_log_file_id") != uploaded_file.file_id:
+        with st.spinner("Reading LAS file..."):
+            uploaded_file.seek(0)
+            st.session_state.well_log = read_las(uploaded_file, dtype=dtype)
+        st.session_state.well_log_file_id = uploaded_file.file_id
+    return st.session_state.well_log
+
+
+def plot_curves(depth, curves):
+    """Line chart of `curves` against depth, decimated to MAX_PLOT_SAMPLES"""
+    step = max(1, depth.size // MAX_PLOT_SAMPLES)
+    df = pd.DataFrame({name: curve[::step] for name, curve in curves.items()})
+    df.index = depth[::step]
+    st.line_chart(df)
+
+
+def directory_input(label, default, key, help=None):
+    """Text input of a directory inside the data root.
+
+    Returns the resolved directory, or None (with a warning) when the path
+    leads outside `DATA_ROOT`.
+    """
+    root = DATA_ROOT.resolve()
+    path = st.text_input(
+        label,
+        value=str(Path(default).resolve().relative_to(root)) if default else "",
+        key=key,
+        help=" ".join(filter(None, [help, f"Relative to the data directory {root}."])),
+    )
+    try:
+        return data_directory(path)
+    except ValueError as e:
+        st.warning(f"An error occurred: {e}")
+        return None
+
+
+def select_well():
+    """Pick a well from an uploaded LAS file or from the well store.
+
+    Returns the well header (same layout as `read_las`, plus the well
+    `name` and a `source` string identifying its data) and a function that
+    loads a dict of the requested curves, or (None, None) if no well is set.
+    """
+    source = st.radio(
+        "Source", ["Upload LAS", "Well Store"], horizontal=True, key="well_source"
+    )
+    store = directory_input("Well store directory", DEFAULT_STORE, key="well_store")
+    if store is None:
+        return None, None
+
+    if source == "Upload LAS":
+        uploaded_file = st.file_uploader("Upload a LAS file", type=["las"])
+        if uploaded_file is None:
+            return None, None
+        try:
+            las = load_well_log(uploaded_file)
+        except ValueError as e:
+            st.error(f"Could not read the LAS file: {e}")
+            return None, None
+
+        cols = st.columns([3, 1], vertical_alignment="bottom")
+        with cols[0]:
+            default_name = las["well"].get("WELL", {}).get("value")
+            name = st.text_input(
+                "Well name", value=default_name or Path(uploaded_file.name).stem
+            )
+        with cols[1]:
+            if st.button("Save to store", key="save_well"):
+                try:
+                    write_well(store, name, las)
+                    st.success(f"Well saved to {store}")
+                except (OSError, ValueError) as e:
+                    st.error(f"Could not save the well: {e}")
+
+        las["name"] = name
+        las["source"] = f"upload:{uploaded_file.file_id}"
+        return las, lambda curves: {c: las["data"][c] for c in curves}
+
+    wells = list_wells(store)
+    if not wells:
+        st.info("There are no wells saved in this store yet.")
+        return None, None
+
+    name = st.selectbox("Well", wells)
+    info = well_info(store, name)
+    if info["top"] is None:
+        st.info("This well has no depth samples.")
+        return None, None
+    cols = st.columns(2)
+    with cols[0]:
+        top = st.number_input("Top", value=info["top"], key="store_top")
+    with cols[1]:
+        base = st.number_input("Base", value=info["base"], key="store_base")
+
+    # Apenas a profundidade é lida aqui; as demais curvas sob demanda
+    las = read_well(store, name, curves=[], top=top, base=base)
+    las["curves"] = info["curves"]
+    las["name"] = name
+    las["source"] = well_version(store, name)
+    return (
+        las,
+        lambda curves: read_well(store, name, curves=curves, top=top, base=base)[
+            "data"
+        ],
+    )
+
+
+def porosity_section(mnemonics, depth, load_curves):
+    options = ["None"] + mnemonics[1:]
+
+    def default(kind):
+        curve = find_curve(options, kind)
+        return options.index(curve) if curve else 0
+
+    cols = st.columns(3)
+    with cols[0]:
+        rhob_curve = st.selectbox(r"$\rho_{b}$ curve", options, index=default("RHOB"))
+        rho_matrix = st.number_input(
+            r"$\rho_{ma}$ (g/cm³)", value=2.65, key="well_log_rhoma"
+        )
+    with cols[1]:
+        nphi_curve = st.selectbox(r"$\phi_{N}$ curve", options, index=default("NPHI"))
+        rho_fluid = st.number_input(
+            r"$\rho_{fl}$ (g/cm³)", value=1.0, key="well_log_rhofl"
+        )
+    with cols[2]:
+        dt_curve = st.selectbox(r"$\Delta t$ curve", options, index=default("DT"))
+        delta_t_ma = st.number_input(
+            r"$\Delta t_{ma}$", value=55.5, key="well_log_dtma"
+        )
+        delta_t_fl = st.number_input(
+            r"$\Delta t_{fl}$", value=189.0, key="well_log_dtfl"
+        )
+
+    if st.button("Calculate", key="well_log_porosity"):
+        selected = [c for c in (rhob_curve, nphi_curve, dt_curve) if c != "None"]
+        if not selected:
+            st.warning("Select at least one input curve.")
+            return
+        data = load_curves(selected)
+        curves, flags = porosity.porosity_curves(
+            rhob=data.get(rhob_curve),
+            nphi=data.get(nphi_curve),
+            dt=data.get(dt_curve),
+            rhom=zone_parameter("RHOMA", rho_matrix),
+            rhof=zone_parameter("RHOFL", rho_fluid),
+            dtma=zone_parameter("DTMA", delta_t_ma),
+            dtf=zone_parameter("DTFL", delta_t_fl),
+        )
+        # Amostras NULL (NaN) são esperadas em perfis reais
+        if rhob_curve in data:
+            warn_flags(flags[0], DENSITY_POROSITY_WARNINGS, ignore=UNDEFINED)
+        if dt_curve in data:
+            warn_flags(flags[1], SONIC_POROSITY_WARNINGS, ignore=UNDEFINED)
+
+        computed = {
+            name: curve
+            for name, curve in zip(porosity.POROSITY_CURVES, curves)
+            if not np.all(np.isnan(curve))
+        }
+        plot_curves(depth, computed)
+        st.dataframe(pd.DataFrame(computed).describe())
+
+
+def shale_volume_section(mnemonics, depth, load_curves):
+    options = mnemonics[1:]
+    gr_curve = find_curve(options, "GR")
+    cols = st.columns(2)
+    with cols[0]:
+        gr_curve = st.selectbox(
+            "Gamma ray curve",
+            options,
+            index=options.index(gr_curve) if gr_curve else 0,
+            key="vsh_gr",
+        )
+    with cols[1]:
+        methods = st.multiselect(
+            "Methods",
+            sv.VSH_METHODS,
+            default=["LARIONOV"],
+            format_func=lambda m: m.replace("_", " ").title(),
+            key="vsh_methods",
+        )
+
+    mode = st.radio(
+        "Baselines",
+        ["Zone percentiles", "Moving window", "Fixed"],
+        horizontal=True,
+        key="vsh_baselines",
+        help="Clean and shale gamma ray picked from the log percentiles of each zone or of a moving window, or typed in",
+    )
+    cols = st.columns(3)
+    if mode == "Fixed":
+        with cols[0]:
+            gr_clean = st.number_input("Clean GR (API)", value=20.0, key="vsh_clean")
+        with cols[1]:
+            gr_shale = st.number_input("Shale GR (API)", value=120.0, key="vsh_shale")
+    else:
+        with cols[0]:
+            low = st.number_input(
+                "Clean percentile", 0.0, 100.0, value=5.0, key="vsh_low"
+            )
+        with cols[1]:
+            high = st.number_input(
+                "Shale percentile", 0.0, 100.0, value=95.0, key="vsh_high"
+            )
+        with cols[2]:
+            if mode == "Zone percentiles":
+                zone_tops_caption()
+            else:
+                window = st.number_input(
+                    "Window (samples)", min_value=3, value=501, step=2, key="vsh_window"
+                )
+
+    if st.button("Calculate", key="well_log_vsh"):
+        if not methods:
+            st.warning("Select at least one method.")
+            return
+        gr = load_curves([gr_curve])[gr_curve]
+        try:
+            if mode == "Zone percentiles":
+                tops = zone_tops()
+                zones = np.searchsorted(tops, depth, side="right")
+                clean, shale = gamma_ray.pick_baselines(
+                    gr, zones, n_zones=tops.size + 1, low=low, high=high
+                )
+                st.dataframe(
+                    pd.DataFrame(
+                        {
+                            "Top": np.r_[depth[0], tops],
+                            "Clean GR": clean,
+                            "Shale GR": shale,
+                        }
+                    ).dropna()
+                )
+                gr_clean, gr_shale = clean[zones], shale[zones]
+            elif mode == "Moving window":
+                gr_clean, gr_shale = gamma_ray.rolling_baselines(gr, window, low, high)
+            else:
+                gr_clean = zone_parameter("GR_CLEAN", gr_clean)
+                gr_shale = zone_parameter("GR_SHALE", gr_shale)
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        vsh = sv.compute_vsh(gr, gr_clean, gr_shale, methods)
+        baselines = {"CLEAN": gr_clean, "SHALE": gr_shale}
+        plot_curves(
+            depth,
+            {
+                gr_curve: gr,
+                **{k: np.broadcast_to(v, depth.shape) for k, v in baselines.items()},
+            },
+        )
+        plot_curves(depth, dict(zip(methods, vsh)))
+
+
+def sp_section(mnemonics, depth, load_curves, formation):
+    """SP processing; `formation` holds the curves of `temperature_section`"""
+    options = mnemonics[1:]
+    sp_curve = find_curve(options, "SP")
+    gr_curve = find_curve(options, "GR")
+    st.write(
+        "$K$ and $R_{mf}$ follow the formation temperature profile set in the Formation Temperature section."
+    )
+    cols = st.columns(2)
+    with cols[0]:
+        sp_curve = st.selectbox(
+            "SP curve",
+            options,
+            index=options.index(sp_curve) if sp_curve else 0,
+            key="sp_curve",
+        )
+        method = st.radio(
+            "Shale baseline",
+            sp.SP_BASELINE_METHODS,
+            format_func=str.title,
+            horizontal=True,
+            key="sp_baseline",
+            help="Rolling median or cubic spline through the shale points, removed from the SP to correct its drift",
+        )
+        window = st.number_input(
+            "Window (samples)", min_value=5, value=1001, step=2, key="sp_window"
+        )
+    with cols[1]:
+        shale_points = st.radio(
+            "Shale points",
+            ["Automatic", "Gamma ray cutoff"],
+            horizontal=True,
+            key="sp_shale_points",
+            help="Automatic takes the samples above the rolling median of the SP",
+        )
+        if shale_points == "Gamma ray cutoff":
+            gr_curve = st.selectbox(
+                "Gamma ray curve",
+                options,
+                index=options.index(gr_curve) if gr_curve else 0,
+                key="sp_gr",
+            )
+            gr_cutoff = st.number_input(
+                "Shale above (API)", value=90.0, key="sp_gr_cutoff"
+            )
+        zone_tops_caption()
+        percentile = st.number_input(
+            "SSP percentile",
+            0.0,
+            50.0,
+            value=1.0,
+            key="sp_percentile",
+            help="Percentile of the corrected SP of each zone taken as its static SP",
+        )
+
+    if st.button("Calculate", key="well_log_sp"):
+        curves = [sp_curve, gr_curve] if shale_points != "Automatic" else [sp_curve]
+        data = load_curves(curves)
+        shale = data[gr_curve] >= gr_cutoff if shale_points != "Automatic" else None
+        try:
+            tops = zone_tops()
+            zones = np.searchsorted(tops, depth, side="right")
+            baseline = sp.shale_baseline(data[sp_curve], window, method, shale)
+            corrected = data[sp_curve] - baseline
+            ssp = sp.zone_ssp(corrected, zones, tops.size + 1, percentile)
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+
+        k = sp.sp_k(formation["TEMP"])
+        st.dataframe(
+            pd.DataFrame({"Top": np.r_[depth[0], tops], "SSP (mV)": ssp}).dropna()
+        )
+        plot_curves(
+            depth,
+            {sp_curve: data[sp_curve], "BASELINE": baseline, "SP_CORR": corrected},
+        )
+        plot_curves(
+            depth,
+            {
+                "VSH_SP": sp.sp_vsh(corrected, ssp[zones]),
+                "RW_SP": sp.sp_rw(ssp[zones], formation["RMF"], k),
+            },
+        )
+
+
+def push_archie_parameters(fit):
+    """Fill the Archie a, m and Rw inputs of the other tabs with a fit"""
+    for name, keys in ARCHIE_KEYS.items():
+        for key in keys:
+            st.session_state[key] = float(fit[name])
+
+
+def pickett_section(mnemonics, depth, load_curves):
+    options = mnemonics[1:]
+    rt_curve = find_curve(options, "RT")
+    phi_curve = next((c for c in PICKETT_POROSITY_CURVES if c in options), None)
+    st.write(
+        """
+        Fit the Archie cementation exponent $m$ and water resistivity $R_w$ from the resistivity and porosity of a water-bearing interval (log-log Rt vs. porosity).
+        The robust fits (Huber or RANSAC) are barely moved by hydrocarbon or shaly samples, and every sample is drawn as a density grid.
+        """
+    )
+    cols = st.columns(3)
+    with cols[0]:
+        rt_curve = st.selectbox(
+            "Resistivity curve",
+            options,
+            index=options.index(rt_curve) if rt_curve else 0,
+            key="pickett_rt",
+        )
+        phi_curve = st.selectbox(
+            "Porosity curve",
+            options,
+            index=options.index(phi_curve) if phi_curve else 0,
+            key="pickett_phi",
+        )
+    with cols[1]:
+        top = st.number_input(
+            "Water zone top", value=float(depth.min()), key="pickett_top"
+        )
+        base = st.number_input(
+            "Water zone base", value=float(depth.max()), key="pickett_base"
+        )
+    with cols[2]:
+        method = st.radio(
+            "Fit", pickett.PICKETT_METHODS, horizontal=True, key="pickett_method"
+        )
+        a = st.number_input("$a$", min_value=0.01, value=1.0, key="pickett_a")
+        n = st.number_input("$n$", min_value=0.1, value=2.0, key="pickett_n")
+
+    if st.button("Calculate", key="well_log_pickett"):
+        data = load_curves([rt_curve, phi_curve])
+        interval = (depth >= top) & (depth <= base)
+        rt, phi = data[rt_curve][interval], data[phi_curve][interval]
+        try:
+            fit = pickett.pickett_fit(rt, phi, method, a)
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            return
+        st.session_state.pickett = {"fit": fit, "rt": rt, "phi": phi, "n": n}
+
+    result = st.session_state.get("pickett")
+    if result is None:
+        return
+    fit = result["fit"]
+    cols = st.columns(3)
+    with cols[0]:
+        st.metric("m", value=f"{fit['m']:.3f}")
+    with cols[1]:
+        st.metric("Rw", value=f"{fit['rw']:.4f} ohm-m")
+    with cols[2]:
+        st.metric("Samples used", value=f"{fit['samples']}")
+    st.pyplot(pickett.plot_pickett(result["rt"], result["phi"], fit, result["n"]))
+    st.button(
+        "Use in the water saturation calculators",
+        key="pickett_push",
+        on_click=push_archie_parameters,
+        args=(fit,),
+        help="Sets a, m and Rw in the Resistivity, Water Saturation and Batch tabs",
+    )
+
+
+@st.cache_data(max_entries=32)
+def temperature_profile(source, top, base, n_samples, surface_temp, points, _depth):
+    """Formation temperature of a well, computed once per well and gradient.
+
+    The depth curve itself is not hashed; the well data `source` (see
+    `select_well`), depth range and number of samples identify it.
+    """
+    return temperature.formation_temperature(_depth, surface_temp, points)
+
+
+def temperature_section(source, depth):
+    """Formation temperature and Arps-corrected Rw and Rmf curves"""
+    st.write(
+        """
+        Formation temperature at every depth from the surface temperature and one or more measured temperatures (e.g. the BHT of each logging run): one measurement gives a linear gradient, several give a piecewise gradient.
+        The water and mud filtrate resistivities are taken from the temperature they were measured at to the formation temperature of each depth (Arps), and used by the uncertainty and SP calculations.
+        """
+    )
+    cols = st.columns(2)
+    with cols[0]:
+        surface_temp = st.number_input(
+            "Surface temperature (ºF)", value=75.0, key="temp_surface"
+        )
+        measured = st.data_editor(
+            pd.DataFrame({"Depth": [float(depth[-1])], "Temperature (ºF)": [200.0]}),
+            num_rows="dynamic",
+            key="temp_points",
+        )
+    with cols[1]:
+        resistivities = {}
+        for mnemonic, label, value in (
+            ("RW", "$R_{w}$", 0.05),
+            ("RMF", "$R_{mf}$", 0.5),
+        ):
+            inner = st.columns(2)
+            with inner[0]:
+                r = st.number_input(
+                    f"{label} (ohm-m)",
+                    min_value=0.001,
+                    value=value,
+                    format="%.4f",
+                    key=f"temp_{mnemonic.lower()}",
+                )
+            with inner[1]:
+                t = st.number_input(
+                    "at (ºF)", value=75.0, key=f"temp_{mnemonic.lower()}_t"
+                )
+            resistivities[mnemonic] = (r, t)
+
+    points = tuple(map(tuple, measured.dropna().to_numpy()))
+    try:
+        profile = temperature_profile(
+            source, depth[0], depth[-1], depth.size, surface_temp, points, depth
+        )
+    except ValueError as e:
+        st.warning(f"An error occurred: {e}")
+        return None
+
+    formation = {"TEMP": profile}
+    for mnemonic, (r, t) in resistivities.items():
+        formation[mnemonic] = temperature.arps(r, t, profile)
+    if st.checkbox("Show curves", key="temp_show"):
+        plot_curves(depth, {"TEMP": profile})
+        plot_curves(depth, {k: v for k, v in formation.items() if k != "TEMP"})
+    return formation
+
+
+def render_well_log():
+    st.write(
+        """
+        Load a well log in the LAS 2.0/3.0 format to run the PetrofisicaHub equations over the whole well instead of single values.
+        The ASCII data section is read in blocks straight into NumPy arrays, so large composite files can be used as well.
+        Wells saved to the well store are reopened instantly, reading only the curves and depth range in use.
+        """
+    )
+    las, load_curves = select_well()
+    if las is None:
+        return
+
+    mnemonics = list(las["curves"])
+    depth = las["data"][mnemonics[0]]
+
+    st.metric("Samples", value=f"{depth.size}")
+    with st.expander("Well Information"):
+        st.dataframe(pd.DataFrame(las["well"]).T)
+    with st.expander("Curves"):
+        st.dataframe(pd.DataFrame(las["curves"]).T)
+
+    with st.expander("Zones"):
+        render_zones(las["name"], depth)
+    with st.expander("Porosity Curves"):
+        porosity_section(mnemonics, depth, load_curves)
+    with st.expander("Shale Volume Curves"):
+        shale_volume_section(mnemonics, depth, load_curves)
+    with st.expander("Mineral Volumes"):
+        render_minerals(mnemonics, depth, load_curves)
+    with st.expander("Formation Temperature"):
+        formation = temperature_section(las["source"], depth)
+    with st.expander("Uncertainty"):
+        render_uncertainty(mnemonics, depth, load_curves, formation)
+    with st.expander("Net Pay"):
+        render_net_pay(mnemonics, depth, load_curves)
+    with st.expander("Crossplots"):
+        render_crossplot(las["source"], mnemonics, depth, load_curves)
+    with st.expander("Pickett Plot"):
+        pickett_section(mnemonics, depth, load_curves)
+    with st.expander("Spontaneous Potential Curves"):
+        if formation is None:
+            st.info("Set the formation temperature first.")
+        else:
+            sp_section(mnemonics, depth, load_curves, formation)
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from scripts.welllog.zones import ZoneIndex, parse_tops
+
+# Parâmetros que podem variar por zona, com o rótulo da tabela
+ZONE_PARAMETERS = {
+    "RHOMA": "ρma (g/cm³)",
+    "RHOFL": "ρfl (g/cm³)",
+    "DTMA": "Δtma",
+    "DTFL": "Δtfl",
+    "GR_CLEAN": "Clean GR (API)",
+    "GR_SHALE": "Shale GR (API)",
+    "RW": "Rw (ohm-m)",
+    "A": "a",
+    "M": "m",
+    "N": "n",
+}
+
+
+def zone_parameter(name, value):
+    """Parameter `name` along depth when the zone table sets it, else `value`.
+
+    Zones left blank in the table, and the interval above the first top,
+    use `value`, the global input of the section.
+    """
+    zones = st.session_state.get("zone_index")
+    table = st.session_state.get("zone_parameters")
+    if zones is None or table is None or table[name].isna().all():
+        return value
+    zones.set_parameter(name, table[name].fillna(value).to_numpy(), default=value)
+    return zones.parameter(name)
+
+
+def zone_tops():
+    """Tops of the zone manager, or no tops (a single zone) when none are set"""
+    zones = st.session_state.get("zone_index")
+    return np.empty(0) if zones is None else zones.tops
+
+
+def zone_tops_caption():
+    """Tell a zone-by-zone section which tops it is using"""
+    tops = zone_tops()
+    if tops.size:
+        st.caption(f"Zones from the {tops.size} tops set in the Zones section.")
+    else:
+        st.caption("No tops set in the Zones section: the well is a single zone.")
+
+
+def clear_zones():
+    """Drop the zones, so no section keeps the tops of another well or input"""
+    for key in ("zone_index", "zone_index_key", "zone_parameters"):
+        st.session_state.pop(key, None)
+
+
+def render_zones(name, depth):
+    st.write(
+        """
+        Formation tops split the well into zones, each going down to the next top. Matrix, fluid, gamma ray baseline and Archie (Rw, a, m, n) parameters can then be set per zone; blank cells use the values typed in each section.
+        The shale volume zone percentiles, the SP static values and the net pay summaries are computed over these zones.
+        """
+    )
+    uploaded = st.file_uploader(
+        "Tops file",
+        type=["csv", "txt"],
+        help="Or type the tops below",
+        key="zone_tops_file",
+    )
+    if uploaded is not None:
+        text = uploaded.getvalue().decode(errors="replace")
+    else:
+        text = st.text_area(
+            "Formation tops",
+            help="One `NAME, DEPTH` pair per line",
+            key="zone_tops_text",
+        )
+    try:
+        tops = tuple(parse_tops(text))
+    except ValueError as e:
+        st.warning(f"An error occurred: {e}")
+        clear_zones()
+        return
+
+    if not tops:
+        clear_zones()
+        return
+
+    # O índice só é refeito quando o poço, o intervalo ou os topos mudam
+    key = (name, depth[0], depth[-1], depth.size, tops)
+    if st.session_state.get("zone_index_key") != key:
+        try:
+            st.session_state.zone_index = ZoneIndex(depth, tops)
+        except ValueError as e:
+            st.warning(f"An error occurred: {e}")
+            clear_zones()
+            return
+        st.session_state.zone_index_key = key
+    zones = st.session_state.zone_index
+
+    table = pd.DataFrame(
+        np.nan, index=pd.Index(zones.names, name="Zone"), columns=list(ZONE_PARAMETERS)
+    )
+    previous = st.session_state.get("zone_parameters")
+    if previous is not None:
+        table.update(previous)
+    table.insert(0, "Top", zones.tops)
+    edited = st.data_editor(
+        table,
+        disabled=["Top"],
+        column_config={
+            k: st.column_config.NumberColumn(v) for k, v in ZONE_PARAMETERS.items()
+        },
+        key=f"zone_parameters_{hash(tops)}",
+    )
+    st.session_state.zone_parameters = edited.drop(columns="Top").astype(float)
@@ -9,6 +9,9 @@ from components.petrofisicahub.resistivity_tab import render_resistivity
 from components.petrofisicahub.water_saturation_tab import render_water_saturation
 from components.petrofisicahub.shale_volume_tab import render_shale_volume
 from components.petrofisicahub.oil_reserves_tab import render_oil_reserves
+from components.petrofisicahub.well_log_tab import render_well_log
+from components.petrofisicahub.batch_tab import render_batch, render_gr_normalization
+from components.petrofisicahub.sensitivity_tab import render_sensitivity
 
 from components.header import render_header
 
@@ -31,6 +34,9 @@ tabs_list = [
     "Water Saturation",
     "Shale Volume",
     "Reserves",
+    "Well Logs",
+    "Batch",
+    "Sensitivity",
 ]
 
 tabs = st.tabs(tabs_list)
@@ -52,3 +58,14 @@ with tabs[4]:  # Shale Volume
 
 with tabs[5]:  # Oil Reserves
     render_oil_reserves()
+
+with tabs[6]:  # Well Logs
+    render_well_log()
+
+with tabs[7]:  # Batch
+    render_batch()
+    with st.expander("Gamma Ray Normalization"):
+        render_gr_normalization()
+
+with tabs[8]:  # Sensitivity
+    render_sensitivity()
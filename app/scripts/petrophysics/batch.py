@@ -0,0 +1,249 @@
+"""Multi-well batch evaluation.
+
+Runs shale volume -> porosity -> water saturation -> permeability -> net pay
+for every well of a directory, one well per worker process, and writes the
+input and computed curves to the well store.
+
+Headless usage (from the `app` directory):
+
+    python -m scripts.petrophysics.batch path/to/las_dir --store data/wells
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+import scripts.petrophysics.netpay as netpay
+import scripts.petrophysics.permeability as pm
+import scripts.petrophysics.porosity as porosity
+import scripts.petrophysics.shale_volume as sv
+import scripts.petrophysics.temperature as temperature
+import scripts.petrophysics.water_saturation as ws
+from scripts.welllog.las import find_curve, read_las
+from scripts.welllog.store import DEFAULT_STORE, list_wells, read_well, write_well
+
+DEFAULT_PARAMETERS = {
+    # Volume de argila
+    "gr_clean": 20.0,
+    "gr_shale": 120.0,
+    # Porosidade
+    "rhom": 2.65,
+    "rhof": 1.0,
+    "dtma": 55.5,
+    "dtf": 189.0,
+    # Porosidade aparente lida na argila pura, descontada da porosidade total
+    # na proporção do volume de argila (0 deixa PHIE igual a PHIT)
+    "phi_shale": 0.1,
+    # Saturação de água (Archie)
+    "a": 1.0,
+    "m": 2.0,
+    "n": 2.0,
+    "rw": 0.05,
+    # Temperatura: Rw medido a rw_temp e levado à temperatura da formação
+    # (Arps), com o gradiente da superfície até o BHT medido em bht_depth
+    "rw_temp": 75.0,
+    "surface_temp": 75.0,
+    "bht": 75.0,
+    "bht_depth": 10000.0,
+    # Cutoffs de net pay
+    "vsh_cutoff": 0.4,
+    "phie_cutoff": 0.08,
+    "sw_cutoff": 0.5,
+}
+
+COMPUTED_CURVES = {
+    "VSH": "V/V",
+    "PHIE": "V/V",
+    "SW": "V/V",
+    "PERM": "MD",
+    "PAY": "",
+}
+
+
+def evaluate_well(data, params=None):
+    """Evaluate one well given its curves (dict of depth-indexed arrays).
+
+    Returns the computed curves (see `COMPUTED_CURVES`) and a summary with
+    the gross/net pay thickness and pay averages.
+    """
+    params = {**DEFAULT_PARAMETERS, **(params or {})}
+    mnemonics = list(data)
+    depth = data[mnemonics[0]]
+    curve = {
+        kind: data.get(find_curve(mnemonics, kind))
+        for kind in ("GR", "RHOB", "NPHI", "DT", "RT")
+    }
+    if curve["GR"] is None or curve["RT"] is None:
+        raise ValueError("The well needs at least a gamma ray and a resistivity curve.")
+    if curve["RHOB"] is None and curve["DT"] is None:
+        raise ValueError("The well needs a density or a sonic curve.")
+
+    # Volume de argila (Larionov, rochas terciárias)
+    vsh = sv.compute_vsh(
+        curve["GR"], params["gr_clean"], params["gr_shale"], ["LARIONOV"]
+    )[0]
+
+    # Porosidade total e efetiva: PHIE = PHIT - Vsh * phi_shale
+    phi, _ = porosity.porosity_curves(
+        rhob=curve["RHOB"],
+        nphi=curve["NPHI"],
+        dt=curve["DT"],
+        rhom=params["rhom"],
+        rhof=params["rhof"],
+        dtma=params["dtma"],
+        dtf=params["dtf"],
+    )
+    phid, phis, phind, _ = phi
+    if curve["RHOB"] is None:
+        phit = phis
+    elif curve["NPHI"] is None:
+        phit = phid
+    else:
+        phit = phind
+    phie = np.clip(phit - vsh * params["phi_shale"], 0, 1)
+
+    # Saturação de água (Archie) e permeabilidade (Timur)
+    tf = temperature.formation_temperature(
+        depth, params["surface_temp"], [(params["bht_depth"], params["bht"])]
+    )
+    rw = temperature.arps(params["rw"], params["rw_temp"], tf)
+    sw = ws.archie(curve["RT"], phie, rw, a=params["a"], m=params["m"], n=params["n"])
+    perm = pm.timur(phie, sw)
+
+    # Net pay
+    _, pay = netpay.pay_flags(
+        {"VSH": vsh, "PHIE": phie, "SW": sw},
+        {
+            "VSH": params["vsh_cutoff"],
+            "PHIE": params["phie_cutoff"],
+            "SW": params["sw_cutoff"],
+        },
+    )
+    zone = netpay.zone_summary(depth, pay, pay, {"PHIE": phie, "SW": sw})
+    gross, net = zone["GROSS"][0], zone["PAY"][0]
+    summary = {
+        "gross": float(gross),
+        "net_pay": float(net),
+        "net_to_gross": float(net / gross) if gross else 0.0,
+        "phie_pay": float(zone["PHIE"][0]),
+        "sw_pay": float(zone["SW"][0]),
+    }
+
+    curves = {
+        "VSH": vsh,
+        "PHIE": phie,
+        "SW": sw,
+        "PERM": perm,
+        "PAY": pay.astype(float),
+    }
+    return curves, summary
+
+
+def _evaluate_task(source, store, params):
+    """Worker: load one well, evaluate it and write the results to the store"""
+    start = time.perf_counter()
+    source = Path(source)
+    if source.suffix.lower() == ".las":
+        well = read_las(source)
+        name = source.stem
+    else:
+        well = read_well(source.parent, source.name)
+        name = source.name
+
+    curves, summary = evaluate_well(well["data"], params)
+
+    well["data"] = {**well["data"], **curves}
+    well["curves"] = {
+        **well["curves"],
+        **{
+            c: {"unit": u, "description": "Computed curve"}
+            for c, u in COMPUTED_CURVES.items()
+        },
+    }
+    write_well(store, name, well)
+
+    return {
+        "well": name,
+        "samples": int(next(iter(well["data"].values())).size),
+        "seconds": time.perf_counter() - start,
+        **summary,
+    }
+
+
+def find_wells(source_dir):
+    """LAS files of a directory or, if there are none, the wells of a store"""
+    source_dir = Path(source_dir)
+    las_files = sorted(
+        p for p in source_dir.iterdir() if p.is_file() and p.suffix.lower() == ".las"
+    )
+    if las_files:
+        return las_files
+    return [source_dir / name for name in list_wells(source_dir)]
+
+
+def run_batch(
+    source_dir, store=DEFAULT_STORE, params=None, max_workers=None, progress=None
+):
+    """Evaluate every well of `source_dir` in parallel, one well per process.
+
+    `progress(done, total, result)` is called as each well finishes. Each
+    result holds the well name, number of samples, elapsed seconds and the
+    net pay summary, or an `error` message if the well could not be
+    evaluated. Results are returned in completion order.
+    """
+    wells = find_wells(source_dir)
+    total = len(wells)
+    results = []
+    if not wells:
+        return results
+
+    max_workers = max_workers or min(total, os.cpu_count() or 1)
+    # "spawn": processos criados por fork podem travar nos threads do polars
+    with ProcessPoolExecutor(max_workers, mp_context=get_context("spawn")) as executor:
+        futures = {
+            executor.submit(_evaluate_task, str(well), str(store), params): well
+            for well in wells
+        }
+        for future in as_completed(futures):
+            well = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"well": Path(well).stem, "error": str(e)}
+            results.append(result)
+            if progress is not None:
+                progress(len(results), total, result)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="Directory with LAS files or a well store")
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="Output well store")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    def report(done, total, result):
+        if "error" in result:
+            print(f"[{done}/{total}] {result['well']}: ERROR {result['error']}")
+        else:
+            print(
+                f"[{done}/{total}] {result['well']}: {result['samples']} samples "
+                f"in {result['seconds']:.2f} s, net pay {result['net_pay']:.1f}"
+            )
+
+    start = time.perf_counter()
+    results = run_batch(
+        args.source, args.store, max_workers=args.workers, progress=report
+    )
+    print(f"{len(results)} wells in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
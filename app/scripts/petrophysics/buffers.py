@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def output_buffer(out, *args):
+    """Float output array with the broadcast shape of `args`.
+
+    Returns `out` itself when given (after checking its shape), so repeated
+    runs over the same well can reuse one buffer. Scalar inputs give a 0-d
+    array, which still works as an `out=` target for in-place ufuncs.
+    """
+    shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+    if out is None:
+        return np.empty(shape, dtype=np.result_type(*args, float))
+    if out.shape != shape:
+        raise ValueError(f"'out' must have shape {shape}, got {out.shape}.")
+    return out
+
+
+def unwrap(result):
+    """Turn a 0-d result array back into a scalar"""
+    return result[()] if result.ndim == 0 else result
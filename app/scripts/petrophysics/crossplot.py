@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def bin_points(x, y, bins=200, extent=None):
+    """2-D histogram of a crossplot, so large logs draw as a density grid.
+
+    `bins` is the number of bins per axis (or an (nx, ny) pair) and `extent`
+    the (xmin, xmax, ymin, ymax) range, taken from the data when not given.
+    Points outside the extent and NaNs are skipped. Returns the counts with
+    shape (ny, nx) and the x and y bin edges.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    nx, ny = (bins, bins) if np.isscalar(bins) else bins
+    valid = np.isfinite(x) & np.isfinite(y)
+    if extent is None:
+        if not valid.any():
+            raise ValueError("There are no valid points to plot.")
+        extent = (x[valid].min(), x[valid].max(), y[valid].min(), y[valid].max())
+    xmin, xmax, ymin, ymax = map(float, extent)
+    # Evita largura zero quando todos os pontos têm o mesmo valor
+    xmax = xmax if xmax > xmin else xmin + 1.0
+    ymax = ymax if ymax > ymin else ymin + 1.0
+
+    valid &= (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+    ix = np.minimum(((x[valid] - xmin) / (xmax - xmin) * nx).astype(np.intp), nx - 1)
+    iy = np.minimum(((y[valid] - ymin) / (ymax - ymin) * ny).astype(np.intp), ny - 1)
+    counts = np.bincount(iy * nx + ix, minlength=nx * ny).reshape(ny, nx)
+    return counts, np.linspace(xmin, xmax, nx + 1), np.linspace(ymin, ymax, ny + 1)
+
+
+def coarsen(counts, factor):
+    """Sum blocks of `factor` x `factor` bins (trailing partial blocks dropped)"""
+    ny, nx = counts.shape[0] // factor, counts.shape[1] // factor
+    blocks = counts[: ny * factor, : nx * factor].reshape(ny, factor, nx, factor)
+    return blocks.sum(axis=(1, 3))
+
+
+def zoom_bins(counts, xedges, yedges, extent, bins=200):
+    """Window `extent` of a finer, already binned crossplot.
+
+    The bins covering the window are summed into blocks so about `bins`
+    remain per axis. Returns (counts, xedges, yedges), or None when the
+    window spans fewer than `bins` of the cached bins and the points must
+    be binned again for the zoomed view.
+    """
+    xmin, xmax, ymin, ymax = extent
+    ix0 = max(np.searchsorted(xedges, xmin, side="right") - 1, 0)
+    ix1 = min(np.searchsorted(xedges, xmax, side="left"), xedges.size - 1)
+    iy0 = max(np.searchsorted(yedges, ymin, side="right") - 1, 0)
+    iy1 = min(np.searchsorted(yedges, ymax, side="left"), yedges.size - 1)
+    factor = min(ix1 - ix0, iy1 - iy0) // bins
+    if factor < 1:
+        return None
+
+    window = coarsen(counts[iy0:iy1, ix0:ix1], factor)
+    ny, nx = window.shape
+    xedges = xedges[ix0 : ix0 + nx * factor + 1 : factor]
+    yedges = yedges[iy0 : iy0 + ny * factor + 1 : factor]
+    return window, xedges, yedges
+
+
+def mn_curves(dt, rhob, nphi, dtf=189.0, rhof=1.0, nphif=1.0):
+    """M and N lithology curves (Burke et al., 1969) from DT, RHOB and NPHI"""
+    dt, rhob, nphi = (np.asarray(c, dtype=float) for c in (dt, rhob, nphi))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = 0.01 * (dtf - dt) / (rhob - rhof)
+        n = (nphif - nphi) / (rhob - rhof)
+    return m, n
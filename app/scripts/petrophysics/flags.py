@@ -0,0 +1,43 @@
+import numpy as np
+
+# Bits of the validity mask returned by the petrophysics compute functions
+VALID = 0
+BELOW_RANGE = 1
+ABOVE_RANGE = 2
+UNDEFINED = 4
+
+
+# Amostras por bloco: os temporários de um bloco ficam no cache, então os
+# valores são lidos da memória uma única vez
+FLAG_BLOCK = 2**14
+
+
+def range_flags(values, low=0.0, high=1.0):
+    """Build a uint8 validity bitmask for `values` against the [low, high] range.
+
+    Samples below `low` get BELOW_RANGE, samples above `high` get ABOVE_RANGE
+    and NaN/inf samples (e.g. zero denominators or NULL log values) get
+    UNDEFINED. The checks run on the computed result only, so no extra passes
+    over the input curves are needed, and block by block, so the result is
+    read from memory once for all three checks.
+    """
+    values = np.asarray(values)
+    flags = np.empty(values.shape, dtype=np.uint8)
+    flat, bits = values.reshape(-1), flags.reshape(-1)
+    check = np.empty(min(FLAG_BLOCK, flat.size), dtype=np.uint8)
+    with np.errstate(invalid="ignore"):
+        for start in range(0, flat.size, FLAG_BLOCK):
+            block = flat[start : start + FLAG_BLOCK]
+            out, test = bits[start : start + FLAG_BLOCK], check[: block.size]
+            np.less(block, low, out=out.view(bool))
+            np.greater(block, high, out=test.view(bool))
+            out |= np.left_shift(test, 1, out=test)
+            np.isfinite(block, out=test.view(bool))
+            np.bitwise_xor(test, 1, out=test)
+            out |= np.left_shift(test, 2, out=test)
+    return flags[()] if flags.ndim == 0 else flags
+
+
+def raised_flags(flags):
+    """Collapse a validity bitmask into the set of bits raised by any sample"""
+    return int(np.bitwise_or.reduce(np.ravel(flags), initial=VALID))
@@ -0,0 +1,210 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+import numpy as np
+from scipy import ndimage
+
+from scripts.welllog.las import find_curve
+from scripts.welllog.store import append_curves, read_well, well_info
+
+# Classes de 0.25 API para os histogramas de raios gama
+GR_EDGES = np.linspace(0.0, 400.0, 1601)
+
+NORMALIZATION_METHODS = ("TWO_POINT", "QUANTILE")
+
+# Mnemônico da curva normalizada gravada no armazenamento de poços
+NORMALIZED_GR = "GR_NORM"
+
+# Percentis usados na normalização por quantis
+QUANTILE_LEVELS = np.linspace(0.5, 99.5, 199)
+
+
+def zone_histograms(gr, zones=None, n_zones=1, edges=GR_EDGES, counts=None):
+    """Gamma ray histograms per zone, shape (n_zones, len(edges) - 1).
+
+    `zones` holds the zone index of each sample (negative for samples out of
+    every zone). Passing the `counts` of a previous call accumulates into
+    them, so long logs can be streamed in chunks. Values outside `edges`
+    fall in the first or last bin and NaNs are skipped.
+    """
+    gr = np.asarray(gr, dtype=float)
+    n_bins = edges.size - 1
+    if counts is None:
+        counts = np.zeros((n_zones, n_bins), dtype=np.int64)
+
+    valid = ~np.isnan(gr)
+    if zones is not None:
+        zones = np.broadcast_to(zones, gr.shape)
+        valid &= (zones >= 0) & (zones < n_zones)
+    bins = np.clip(np.searchsorted(edges, gr[valid], side="right") - 1, 0, n_bins - 1)
+    index = bins if zones is None else zones[valid] * n_bins + bins
+    counts += np.bincount(index, minlength=counts.size).reshape(counts.shape)
+    return counts
+
+
+def histogram_quantiles(counts, q, edges=GR_EDGES):
+    """Percentiles `q` (0-100) of each histogram row, interpolated in the bins.
+
+    Returns an array of shape (n_zones, len(q)); empty zones are NaN.
+    """
+    counts = np.atleast_2d(counts)
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    cdf = np.cumsum(counts, axis=1)
+    total = cdf[:, -1:]
+    target = total * q / 100
+
+    # Primeira classe onde a frequência acumulada atinge o alvo
+    index = (cdf[:, np.newaxis, :] < target[:, :, np.newaxis]).sum(axis=2)
+    index = np.minimum(index, counts.shape[1] - 1)
+    before = np.take_along_axis(cdf, index, axis=1) - np.take_along_axis(
+        counts, index, axis=1
+    )
+    inside = np.take_along_axis(counts, index, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.clip((target - before) / inside, 0, 1)
+    width = np.diff(edges)[index]
+    values = edges[index] + np.nan_to_num(fraction) * width
+    values[np.broadcast_to(total == 0, values.shape)] = np.nan
+    return values
+
+
+def pick_baselines(gr, zones=None, n_zones=None, low=5.0, high=95.0, edges=GR_EDGES):
+    """Clean and shale gamma ray baselines of each zone.
+
+    The baselines are the `low` and `high` percentiles of the zone's
+    histogram. Returns two arrays with one value per zone (a single value
+    each when `zones` is not given).
+    """
+    if n_zones is None:
+        n_zones = 1 if zones is None else int(np.max(zones)) + 1
+    counts = zone_histograms(gr, zones, n_zones, edges)
+    clean, shale = histogram_quantiles(counts, [low, high], edges).T
+    return clean, shale
+
+
+def rolling_baselines(gr, window, low=5.0, high=95.0):
+    """Moving-window clean and shale gamma ray baselines along the log.
+
+    `window` is the number of samples of the centered window. NaN gaps are
+    bridged by linear interpolation before filtering; scipy's 1-D rank
+    filter keeps each window sorted as it slides, instead of sorting every
+    window again.
+    """
+    gr = np.asarray(gr, dtype=float)
+    valid = ~np.isnan(gr)
+    if not valid.any():
+        return np.full_like(gr, np.nan), np.full_like(gr, np.nan)
+    if not valid.all():
+        samples = np.arange(gr.size)
+        gr = np.interp(samples, samples[valid], gr[valid])
+
+    window = max(1, int(window))
+    clean = ndimage.percentile_filter(gr, low, size=window, mode="nearest")
+    shale = ndimage.percentile_filter(gr, high, size=window, mode="nearest")
+    return clean, shale
+
+
+def normalization_map(counts, reference, method="TWO_POINT", low=5.0, high=95.0):
+    """Breakpoints (x, y) mapping a well's gamma ray onto a type well's.
+
+    With "TWO_POINT" the `low` and `high` percentiles of the well histogram
+    `counts` are stretched linearly onto those of `reference`; "QUANTILE"
+    matches the whole distribution through `QUANTILE_LEVELS`.
+    """
+    if method not in NORMALIZATION_METHODS:
+        raise ValueError(f"Unknown normalization method '{method}'.")
+    levels = [low, high] if method == "TWO_POINT" else QUANTILE_LEVELS
+    x, y = histogram_quantiles(np.stack([counts, reference]), levels)
+    if np.isnan(x).any() or np.isnan(y).any():
+        raise ValueError("The well or the type well has no gamma ray samples.")
+    if x[-1] <= x[0]:
+        raise ValueError("The well gamma ray has no spread to normalize.")
+    return x, y
+
+
+def apply_normalization(gr, x, y):
+    """Map a gamma ray curve through the breakpoints of `normalization_map`.
+
+    Values beyond the first and last breakpoints follow the end segments,
+    so the two-point map is a plain linear stretch of the whole curve.
+    """
+    gr = np.asarray(gr, dtype=float)
+    result = np.interp(gr, x, y)
+    if x.size > 1:
+        for end, (x0, x1, y0, y1) in (
+            (gr < x[0], (x[0], x[1], y[0], y[1])),
+            (gr > x[-1], (x[-2], x[-1], y[-2], y[-1])),
+        ):
+            result[end] = y0 + (gr[end] - x0) * (y1 - y0) / (x1 - x0)
+    return result
+
+
+def _gr_curve(store, name):
+    """Original gamma ray mnemonic of a stored well (never the normalized one)"""
+    curves = [c for c in well_info(store, name)["curves"] if c != NORMALIZED_GR]
+    curve = find_curve(curves, "GR")
+    if curve is None:
+        raise ValueError("The well has no gamma ray curve.")
+    return curve
+
+
+def _histogram_task(store, name):
+    """Worker: gamma ray histogram of one stored well"""
+    curve = _gr_curve(store, name)
+    return zone_histograms(read_well(store, name, curves=[curve])["data"][curve])[0]
+
+
+def _normalize_task(store, name, reference, method, low, high):
+    """Worker: normalize one stored well and write the curve back"""
+    curve = _gr_curve(store, name)
+    gr = read_well(store, name, curves=[curve])["data"][curve]
+    x, y = normalization_map(zone_histograms(gr)[0], reference, method, low, high)
+    normalized = apply_normalization(gr, x, y)
+    append_curves(store, name, {NORMALIZED_GR: normalized}, {NORMALIZED_GR: "API"})
+    return {"well": name, "curve": curve, "low": x[0], "high": x[-1]}
+
+
+def normalize_wells(
+    store,
+    type_well,
+    wells,
+    method="TWO_POINT",
+    low=5.0,
+    high=95.0,
+    max_workers=None,
+    progress=None,
+):
+    """Normalize the gamma ray of stored `wells` to the type well distribution.
+
+    Each well is read, histogrammed, mapped onto the type well histogram
+    (see `normalization_map`) and written back to the store as the
+    `NORMALIZED_GR` curve, one process per well. `progress(done, total,
+    result)` is called as each well finishes. Returns one result per well
+    with the source curve and its `low`/`high` percentiles, or an `error`
+    message, in completion order.
+    """
+    reference = _histogram_task(store, type_well)
+    results = []
+    if not wells:
+        return results
+
+    max_workers = max_workers or min(len(wells), os.cpu_count() or 1)
+    # "spawn": processos criados por fork podem travar nos threads do polars
+    with ProcessPoolExecutor(max_workers, mp_context=get_context("spawn")) as executor:
+        futures = {
+            executor.submit(
+                _normalize_task, str(store), well, reference, method, low, high
+            ): well
+            for well in wells
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"well": futures[future], "error": str(e)}
+            results.append(result)
+            if progress is not None:
+                progress(len(results), len(wells), result)
+
+    return results
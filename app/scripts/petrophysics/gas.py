@@ -0,0 +1,171 @@
+import numpy as np
+
+# Conversão de ºF para ºR
+RANKINE = 459.67
+
+Z_METHODS = ("DAK", "HALL_YARBOROUGH")
+
+# Constantes de Dranchuk & Abou-Kassem (1975)
+DAK = (
+    0.3265,
+    -1.0700,
+    -0.5339,
+    0.01569,
+    -0.05165,
+    0.5475,
+    -0.7361,
+    0.1844,
+    0.1056,
+    0.6134,
+    0.7210,
+)
+
+
+def pseudo_critical(gamma_g):
+    """Pseudo-critical pressure (psia) and temperature (ºR) of a natural gas.
+
+    Sutton (1985) correlation for the gas specific gravity `gamma_g` (air = 1).
+    """
+    gamma_g = np.asarray(gamma_g, dtype=float)
+    ppc = 756.8 - 131.0 * gamma_g - 3.6 * gamma_g**2
+    tpc = 169.2 + 349.5 * gamma_g - 74.0 * gamma_g**2
+    return ppc, tpc
+
+
+def _dak_residual(rho, ppr, tpr):
+    """Residual of the DAK equation in the reduced density and its derivative"""
+    a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = DAK
+    c1 = a1 + a2 / tpr + a3 / tpr**3 + a4 / tpr**4 + a5 / tpr**5
+    c2 = a6 + a7 / tpr + a8 / tpr**2
+    c3 = a9 * (a7 / tpr + a8 / tpr**2)
+    c4 = a10 / tpr**3
+    rho2 = rho * rho
+    decay = np.exp(-a11 * rho2)
+    pressure = 0.27 * ppr / (rho * tpr)
+
+    f = (
+        1
+        + c1 * rho
+        + c2 * rho2
+        - c3 * rho2 * rho2 * rho
+        + c4 * rho2 * (1 + a11 * rho2) * decay
+        - pressure
+    )
+    df = (
+        c1
+        + 2 * c2 * rho
+        - 5 * c3 * rho2 * rho2
+        + 2 * c4 * rho * (1 + a11 * rho2 - a11**2 * rho2 * rho2) * decay
+        + pressure / rho
+    )
+    return f, df
+
+
+def _hall_yarborough_residual(y, ppr, tpr):
+    """Residual of the Hall & Yarborough equation in the reduced density"""
+    t = 1 / tpr
+    a = 0.06125 * t * np.exp(-1.2 * (1 - t) ** 2)
+    b = 14.76 * t - 9.76 * t**2 + 4.58 * t**3
+    c = 90.7 * t - 242.2 * t**2 + 42.4 * t**3
+    d = 2.18 + 2.82 * t
+    y2 = y * y
+    f = -a * ppr + (y + y2 + y2 * y - y2 * y2) / (1 - y) ** 3 - b * y2 + c * y**d
+    df = (
+        (1 + 4 * y + 4 * y2 - 4 * y2 * y + y2 * y2) / (1 - y) ** 4
+        - 2 * b * y
+        + c * d * y ** (d - 1)
+    )
+    return f, df
+
+
+def _newton(residual, x, args, upper=np.inf, tol=1e-10, max_iter=50):
+    """Newton iteration over flat arrays, updating only unconverged elements.
+
+    Steps that leave (0, `upper`) are halved back toward the previous
+    iterate. Elements that do not converge within `max_iter` are NaN.
+    """
+    active = np.arange(x.size)
+    for _ in range(max_iter):
+        current = x[active]
+        f, df = residual(current, *(arg[active] for arg in args))
+        updated = current - f / df
+        # Mantém a densidade reduzida no domínio físico
+        updated = np.where(updated <= 0, current / 2, updated)
+        updated = np.where(updated >= upper, (current + upper) / 2, updated)
+        x[active] = updated
+
+        converged = np.abs(updated - current) <= tol * np.abs(updated)
+        active = active[~converged]
+        if not active.size:
+            break
+    x[active] = np.nan
+    return x
+
+
+def z_factor(p, t, gamma_g, method="DAK", tol=1e-10, max_iter=50):
+    """Gas compressibility factor at pressure `p` (psia) and temperature `t` (ºF).
+
+    `p`, `t` and `gamma_g` broadcast against each other, so a whole depth
+    profile or depletion path is solved at once. `method` is "DAK"
+    (Dranchuk & Abou-Kassem, 1975) or "HALL_YARBOROUGH" (1973), both on
+    Sutton's pseudo-critical properties. Each element stops iterating as
+    soon as it converges; elements that do not converge are NaN.
+    """
+    ppc, tpc = pseudo_critical(gamma_g)
+    ppr, tpr = np.broadcast_arrays(
+        np.asarray(p, dtype=float) / ppc, (np.asarray(t, dtype=float) + RANKINE) / tpc
+    )
+    shape = ppr.shape
+    ppr, tpr = ppr.ravel(), tpr.ravel()
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if method == "DAK":
+            # Estimativa inicial de gás ideal (Z = 1)
+            rho = _newton(
+                _dak_residual, 0.27 * ppr / tpr, (ppr, tpr), tol=tol, max_iter=max_iter
+            )
+            z = 0.27 * ppr / (rho * tpr)
+        elif method == "HALL_YARBOROUGH":
+            a = 0.06125 / tpr * np.exp(-1.2 * (1 - 1 / tpr) ** 2)
+            y = _newton(
+                _hall_yarborough_residual,
+                np.minimum(a * ppr, 0.5),
+                (ppr, tpr),
+                upper=1.0,
+                tol=tol,
+                max_iter=max_iter,
+            )
+            z = a * ppr / y
+        else:
+            raise ValueError(f"Unknown Z-factor method '{method}'.")
+
+    # Pressão nula: gás ideal
+    z[ppr == 0] = 1.0
+    return z.reshape(shape) if shape else z[0]
+
+
+def gas_fvf(p, t, z):
+    """Gas formation volume factor Bg (cubic ft/SCF)"""
+    return 0.02827 * np.asarray(z) * (np.asarray(t) + RANKINE) / p
+
+
+def gas_in_place(area, thickness, phi, sh, bg):
+    """Original gas in place (SCF) of a drainage area (acres) and thickness (ft)"""
+    return 43560 * area * thickness * phi * sh / np.asarray(bg)
+
+
+def depletion_path(p_initial, p_final, t, gamma_g, n=50, method="DAK"):
+    """Z, Bg and volumetric gas recovery factor from `p_initial` to `p_final`.
+
+    Assumes a volumetric (no water influx) reservoir at constant temperature,
+    where the recovery at pressure p is 1 - (p/Z) / (p_initial/Z_initial).
+    """
+    p = np.linspace(p_initial, p_final, n)
+    z = z_factor(p, t, gamma_g, method)
+    p_z = p / z
+    return {
+        "P": p,
+        "Z": z,
+        "BG": gas_fvf(p, t, z),
+        "RF": 1 - p_z / p_z[0],
+    }
@@ -0,0 +1,145 @@
+import numpy as np
+
+# Respostas dos componentes: densidade (g/cm³), neutrão (v/v, calcário),
+# sônico (us/ft) e seção de captura volumétrica U = PEF * rho_e (barns/cm³)
+ENDPOINTS = {
+    "QUARTZ": {"RHOB": 2.65, "NPHI": -0.02, "DT": 55.5, "U": 4.78},
+    "CALCITE": {"RHOB": 2.71, "NPHI": 0.00, "DT": 47.6, "U": 13.77},
+    "DOLOMITE": {"RHOB": 2.87, "NPHI": 0.02, "DT": 43.5, "U": 9.00},
+    "CLAY": {"RHOB": 2.55, "NPHI": 0.35, "DT": 95.0, "U": 8.70},
+    "POROSITY": {"RHOB": 1.00, "NPHI": 1.00, "DT": 189.0, "U": 0.40},
+}
+
+MINERAL_LOGS = ("RHOB", "NPHI", "DT", "U")
+
+# Incerteza típica de cada perfil, usada para ponderar as equações
+LOG_UNCERTAINTY = {"RHOB": 0.025, "NPHI": 0.03, "DT": 3.0, "U": 0.5}
+
+
+def volumetric_pef(pef, rhob):
+    """Volumetric photoelectric absorption U (barns/cm³) from PEF and RHOB"""
+    rho_e = (np.asarray(rhob, dtype=float) + 0.1883) / 1.0704
+    return np.asarray(pef, dtype=float) * rho_e
+
+
+def project_simplex(v):
+    """Euclidean projection of every row of `v` onto the unit simplex.
+
+    Sort-based algorithm (Duchi et al., 2008) applied to all rows at once:
+    each row is shifted by its own threshold and clipped at zero, so the
+    volumes are non-negative and add up to one.
+    """
+    v = np.asarray(v, dtype=float)
+    k = v.shape[-1]
+    u = -np.sort(-v, axis=-1)
+    css = np.cumsum(u, axis=-1) - 1
+    ranks = np.arange(1, k + 1)
+    rho = np.count_nonzero(u - css / ranks > 0, axis=-1)
+    theta = (
+        np.take_along_axis(css, rho[..., np.newaxis] - 1, axis=-1)
+        / rho[..., np.newaxis]
+    )
+    return np.maximum(v - theta, 0)
+
+
+def _face_operators(a):
+    """Stacked affine solutions of the system restricted to each simplex face.
+
+    On a face the volumes are a vertex plus a combination of its edges, so
+    closure holds exactly and the least-squares volumes are affine in the
+    data: `b @ gain + offset`, with the pseudo-inverse inside `gain`. The
+    operators of every face are stacked side by side (one block of columns
+    per face, zero outside its support), together with the logs they
+    predict.
+    """
+    m, k = a.shape
+    gains, offsets = [], []
+    for mask in range(1, 2**k):
+        support = np.flatnonzero([(mask >> j) & 1 for j in range(k)])
+        vertex = np.zeros(k)
+        vertex[support[0]] = 1
+        edges = np.zeros((k, support.size - 1))
+        edges[support[0]] = -1
+        edges[support[1:], np.arange(support.size - 1)] = 1
+        gain = edges @ np.linalg.pinv(a @ edges)
+        gains.append(gain.T)
+        offsets.append(vertex - gain @ (a @ vertex))
+    gain = np.stack(gains, axis=1)
+    offset = np.stack(offsets)
+    return (
+        gain.reshape(m, -1),
+        offset.ravel(),
+        (gain @ a.T).reshape(m, -1),
+        (offset @ a.T).ravel(),
+    )
+
+
+def _solve_group(b, a, chunk=16384):
+    """Volumes of samples sharing the same logs (weighted rows `b`, matrix `a`)"""
+    m, k = a.shape
+    gain, offset, log_gain, log_offset = _face_operators(a)
+    # A última face é o simplex inteiro: se os volumes já são >= 0, é a solução
+    v = b @ gain[:, -k:] + offset[-k:]
+    outside = np.flatnonzero(v.min(axis=1) < -1e-9)
+
+    # Nas demais amostras, a face de menor misfit entre as admissíveis
+    n_faces = offset.size // k
+    # Somas por face como produto matricial (mais rápido que reduzir eixos curtos)
+    per_face = np.repeat(np.eye(n_faces), k, axis=0)
+    per_face_logs = np.repeat(np.eye(n_faces), m, axis=0)
+    for i in range(0, outside.size, chunk):
+        samples = outside[i : i + chunk]
+        rows = b[samples]
+        faces = rows @ gain + offset
+        residual = rows @ log_gain + log_offset - np.tile(rows, n_faces)
+        misfit = (residual * residual) @ per_face_logs
+        misfit[(faces < -1e-9) @ per_face > 0] = np.inf
+        best = np.argmin(misfit, axis=1)
+        index = (best * k)[:, np.newaxis] + np.arange(k)
+        v[samples] = np.take_along_axis(faces, index, axis=1)
+    # Remove os resíduos de arredondamento (volumes de -1e-16, soma 1 - 1e-16)
+    return project_simplex(v)
+
+
+def solve_minerals(logs, components=tuple(ENDPOINTS), endpoints=ENDPOINTS):
+    """Mineral and porosity volumes at every depth from RHOB, NPHI, DT and U.
+
+    `logs` maps names of `MINERAL_LOGS` to curves (missing logs, or NaN
+    samples, drop their equation). Each sample solves a weighted
+    least-squares system with volumes >= 0 adding up to 1. The pseudo-inverse
+    solutions of the system on every face of the simplex are precomputed and
+    stacked, so all samples are solved by matrix products: samples with
+    non-negative volumes on the whole simplex are done, the others take the
+    face with the lowest misfit among those with non-negative volumes. The
+    volumes are then projected onto the simplex to clear rounding. Returns a
+    dict with one volume curve per component and the weighted RMS `MISFIT`.
+    """
+    names = [name for name in MINERAL_LOGS if logs.get(name) is not None]
+    if not names:
+        raise ValueError("Give at least one of the RHOB, NPHI, DT or PEF logs.")
+    b = np.column_stack([np.asarray(logs[name], dtype=float) for name in names])
+    weights = np.array([1 / LOG_UNCERTAINTY[name] for name in names])
+    a = np.array([[endpoints[c][name] for c in components] for name in names])
+    b = b * weights
+    a = a * weights[:, np.newaxis]
+
+    n = b.shape[0]
+    volumes = np.full((n, len(components)), np.nan)
+    misfit = np.full(n, np.nan)
+    available = ~np.isnan(b)
+    # Um sistema por combinação de perfis disponíveis (poucas combinações)
+    bits = 1 << np.arange(len(names))
+    code = available @ bits
+    for pattern in np.flatnonzero(np.bincount(code)):
+        used = pattern & bits > 0
+        if not used.any():
+            continue
+        rows = np.flatnonzero(code == pattern)
+        sub_b, sub_a = b[np.ix_(rows, used)], a[used]
+        v = _solve_group(sub_b, sub_a)
+        volumes[rows] = v
+        misfit[rows] = np.sqrt(np.mean((v @ sub_a.T - sub_b) ** 2, axis=1))
+
+    result = dict(zip(components, volumes.T))
+    result["MISFIT"] = misfit
+    return result
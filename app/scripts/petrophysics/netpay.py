@@ -0,0 +1,152 @@
+import numpy as np
+
+# Sentido de cada cutoff: "max" aprova valores até o cutoff, "min" a partir dele
+CUTOFF_SENSE = {"VSH": "max", "PHIE": "min", "SW": "max", "PERM": "min"}
+
+# Cutoffs de rocha (reservatório); o de saturação separa o net pay
+ROCK_CUTOFFS = ("VSH", "PHIE", "PERM")
+
+
+def sample_thickness(depth):
+    """Thickness represented by each sample of a depth curve"""
+    depth = np.asarray(depth, dtype=float)
+    return np.abs(np.gradient(depth)) if depth.size > 1 else np.zeros_like(depth)
+
+
+def cutoff_mask(curves, cutoffs):
+    """Samples passing every cutoff of `cutoffs` (see `CUTOFF_SENSE`).
+
+    `curves` maps the names of `CUTOFF_SENSE` to depth curves; cutoffs of
+    curves that are missing or set to None are ignored. NaN samples fail.
+    """
+    mask = None
+    for name, cutoff in cutoffs.items():
+        if cutoff is None or curves.get(name) is None:
+            continue
+        curve = np.asarray(curves[name])
+        with np.errstate(invalid="ignore"):
+            passed = curve <= cutoff if CUTOFF_SENSE[name] == "max" else curve >= cutoff
+        mask = passed if mask is None else mask & passed
+    if mask is None:
+        raise ValueError("Give at least one cutoff for an available curve.")
+    return mask
+
+
+def pay_flags(curves, cutoffs):
+    """Net reservoir (rock cutoffs) and net pay (rock and saturation) masks"""
+    rock = {k: v for k, v in cutoffs.items() if k in ROCK_CUTOFFS}
+    reservoir = cutoff_mask(curves, rock)
+    pay = reservoir & cutoff_mask(curves, {"SW": cutoffs.get("SW")})
+    return reservoir, pay
+
+
+def pay_intervals(depth, mask, thickness=None):
+    """Contiguous runs of `mask`, found by run-length encoding.
+
+    Returns a dict of arrays with the `TOP` and `BASE` depth, the
+    `THICKNESS` and the sample `START` and `STOP` (exclusive) of each run.
+    """
+    depth = np.asarray(depth, dtype=float)
+    if thickness is None:
+        thickness = sample_thickness(depth)
+    edges = np.diff(np.asarray(mask, dtype=np.int8), prepend=0, append=0)
+    start = np.flatnonzero(edges == 1)
+    stop = np.flatnonzero(edges == -1)
+    cumulative = np.concatenate([[0.0], np.cumsum(thickness)])
+    return {
+        "TOP": depth[start],
+        "BASE": depth[stop - 1],
+        "THICKNESS": cumulative[stop] - cumulative[start],
+        "START": start,
+        "STOP": stop,
+    }
+
+
+def _zone_sums(values, starts, empty):
+    """Sums of `values` between consecutive `starts` (np.add.reduceat)"""
+    # Um zero no fim torna válidos os índices de zonas abaixo do perfil
+    sums = np.add.reduceat(np.append(values, 0.0), starts)
+    # reduceat devolve o próprio elemento para zonas vazias
+    sums[empty] = 0
+    return sums
+
+
+def zone_summary(depth, reservoir, pay, curves=None, tops=(), thickness=None):
+    """Gross, net and pay thickness and pay averages of each zone.
+
+    The zones start at the depth of the log and at each of the sorted `tops`
+    (depth must increase downwards). Every sum is one `np.add.reduceat` call
+    over the zone boundaries. Averages of `curves` are thickness-weighted
+    over the pay samples where the curve is defined. Returns a dict of
+    arrays, one value per zone.
+    """
+    depth = np.asarray(depth, dtype=float)
+    if thickness is None:
+        thickness = sample_thickness(depth)
+    tops = np.sort(np.asarray(tops, dtype=float))
+    starts = np.concatenate([[0], np.searchsorted(depth, tops)])
+    empty = np.diff(starts, append=depth.size) == 0
+
+    gross = _zone_sums(thickness, starts, empty)
+    net = _zone_sums(np.where(reservoir, thickness, 0.0), starts, empty)
+    pay_h = np.where(pay, thickness, 0.0)
+    net_pay = _zone_sums(pay_h, starts, empty)
+    summary = {
+        "TOP": np.concatenate([depth[:1], tops]),
+        "GROSS": gross,
+        "NET": net,
+        "PAY": net_pay,
+    }
+    with np.errstate(divide="ignore", invalid="ignore"):
+        summary["NET_TO_GROSS"] = net / gross
+        summary["PAY_TO_GROSS"] = net_pay / gross
+        for name, curve in (curves or {}).items():
+            curve = np.asarray(curve, dtype=float)
+            defined = ~np.isnan(curve)
+            weights = np.where(defined, pay_h, 0.0)
+            sums = _zone_sums(weights * np.where(defined, curve, 0.0), starts, empty)
+            summary[name] = sums / _zone_sums(weights, starts, empty)
+    return summary
+
+
+def cutoff_sensitivity(curves, grids, thickness, weights=None):
+    """Net thickness for every combination of cutoff values at once.
+
+    `grids` maps each curve name (see `CUTOFF_SENSE`) to the cutoff values
+    to try. Each sample is binned once by the first cutoff of every grid it
+    passes; cumulative sums of the binned thickness along each axis then
+    give the thickness passing each combination, without scanning the well
+    again. With `weights` (e.g. porosity) the sums are of thickness times
+    weight. Returns an array with one axis per grid, in the grid order.
+    """
+    names = list(grids)
+    thickness = np.asarray(thickness, dtype=float)
+    values = thickness if weights is None else thickness * np.asarray(weights)
+    valid = ~np.isnan(values)
+    shape = tuple(len(grids[name]) + 1 for name in names)
+    index = np.zeros(thickness.shape, dtype=np.intp)
+
+    flip = []
+    for name, size in zip(names, shape):
+        curve = np.asarray(curves[name], dtype=float)
+        grid = np.asarray(grids[name], dtype=float)
+        order = np.argsort(grid)
+        # Cutoffs de mínimo viram de máximo com os valores negados
+        if CUTOFF_SENSE[name] == "min":
+            curve, order = -curve, order[::-1]
+        grid = grid[order] * (-1 if CUTOFF_SENSE[name] == "min" else 1)
+        valid &= ~np.isnan(curve)
+        # Primeiro cutoff (em ordem crescente) que a amostra satisfaz
+        first = np.searchsorted(grid, curve, side="left")
+        index = index * size + first
+        flip.append(np.argsort(order))
+
+    binned = np.bincount(index[valid], values[valid], minlength=np.prod(shape))
+    net = binned.reshape(shape)
+    for axis in range(len(names)):
+        net = np.cumsum(net, axis=axis)
+    # Descarta a classe de quem não passa em nenhum cutoff e volta à ordem dada
+    net = net[tuple(slice(0, size - 1) for size in shape)]
+    for axis, back in enumerate(flip):
+        net = np.take(net, back, axis=axis)
+    return net
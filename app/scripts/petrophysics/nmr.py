@@ -0,0 +1,163 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
+
+import numpy as np
+from scipy.optimize import nnls
+
+import scripts.petrophysics.permeability as pm
+
+# Profundidades processadas por vez em matrizes muito grandes
+CHUNK_SIZE = 16384
+
+# Profundidades por tarefa na inversão paralela dos trens de ecos
+INVERSION_CHUNK_SIZE = 512
+
+# Valores singulares menores que esta fração do maior são descartados
+SVD_TOLERANCE = 1e-6
+
+NMR_CURVES = ("TCMR", "T2LM", "BVI", "FFI", "KSDR", "KTIM")
+
+
+def t2_axis(t2_min=0.3, t2_max=3000.0, n_bins=64):
+    """Log-spaced T2 bin centers (ms) of a T2 distribution"""
+    return np.geomspace(t2_min, t2_max, n_bins)
+
+
+def cutoff_weights(t2, cutoffs):
+    """Fraction of each T2 bin below each cutoff, shape (n_bins, n_cutoffs).
+
+    The bin that straddles a cutoff is split proportionally in log(T2), so
+    BVI/FFI vary smoothly with the cutoff instead of jumping bin by bin.
+    """
+    log_t2 = np.log(t2)
+    # Limites dos bins no ponto médio (em log) entre centros vizinhos
+    edges = np.empty(log_t2.size + 1)
+    edges[1:-1] = (log_t2[1:] + log_t2[:-1]) / 2
+    edges[0] = log_t2[0] - (edges[1] - log_t2[0])
+    edges[-1] = log_t2[-1] + (log_t2[-1] - edges[-2])
+
+    log_cutoffs = np.log(np.atleast_1d(cutoffs))
+    below = log_cutoffs[np.newaxis, :] - edges[:-1, np.newaxis]
+    return np.clip(below / np.diff(edges)[:, np.newaxis], 0, 1)
+
+
+def nmr_curves(
+    amplitudes,
+    t2,
+    cutoff=33.0,
+    sdr_a=4.0,
+    coates_c=10.0,
+    chunk_size=CHUNK_SIZE,
+):
+    """Process a (depth x bins) T2 amplitude matrix into NMR curves.
+
+    Total porosity (TCMR), T2 logarithmic mean (T2LM) and the BVI volume
+    below `cutoff` (ms, e.g. 33 for sandstones and 92 for carbonates) come
+    out of a single matrix product with the stacked bin weights. FFI and the
+    SDR (KSDR) and Coates (KTIM) permeabilities follow from those curves.
+    `cutoff` may also be a list, in which case BVI/FFI/KTIM get one column
+    per cutoff.
+
+    The matrix is processed in blocks of `chunk_size` depths, so it can be
+    a `np.memmap` larger than the available memory.
+    """
+    t2 = np.asarray(t2, dtype=float)
+    n_depths, n_bins = amplitudes.shape
+    if t2.shape != (n_bins,):
+        raise ValueError(f"'t2' must have {n_bins} bins, got {t2.shape}.")
+
+    bvi_weights = cutoff_weights(t2, cutoff)
+    weights = np.column_stack([np.ones(n_bins), np.log(t2), bvi_weights])
+
+    sums = np.empty((n_depths, weights.shape[1]))
+    for start in range(0, n_depths, chunk_size):
+        stop = min(start + chunk_size, n_depths)
+        np.dot(amplitudes[start:stop], weights, out=sums[start:stop])
+
+    tcmr = sums[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t2lm = np.exp(sums[:, 1] / tcmr)
+    bvi = sums[:, 2:]
+    ffi = tcmr[:, np.newaxis] - bvi
+
+    ksdr = pm.nmr_sdr(tcmr, t2lm, sdr_a)
+    ktim = pm.nmr_coates(tcmr[:, np.newaxis], ffi, bvi, coates_c)
+
+    if np.ndim(cutoff) == 0:
+        bvi, ffi, ktim = bvi[:, 0], ffi[:, 0], ktim[:, 0]
+    return dict(zip(NMR_CURVES, (tcmr, t2lm, bvi, ffi, ksdr, ktim)))
+
+
+@lru_cache(maxsize=32)
+def inversion_kernel(te, n_echoes, t2_min, t2_max, n_bins, tolerance=SVD_TOLERANCE):
+    """SVD-compressed CPMG kernel of an acquisition setup.
+
+    The kernel exp(-t/T2) for echo spacing `te` (ms) and `n_echoes` echoes
+    is factored once as U S V^T and truncated to the singular values above
+    `tolerance` times the largest. Returns (U_r, S_r V_r^T): projecting the
+    echo trains on U_r turns each inversion into a problem with a few dozen
+    equations instead of thousands. Kernels are cached per setup.
+    """
+    times = te * np.arange(1, n_echoes + 1)
+    t2 = t2_axis(t2_min, t2_max, n_bins)
+    kernel = np.exp(-times[:, np.newaxis] / t2[np.newaxis, :])
+    u, s, vt = np.linalg.svd(kernel, full_matrices=False)
+    rank = int(np.count_nonzero(s > s[0] * tolerance))
+    return u[:, :rank], s[:rank, np.newaxis] * vt[:rank]
+
+
+def _invert_chunk(echoes, setup, alpha):
+    """Worker: regularized NNLS inversion of a block of echo trains"""
+    basis, kernel = inversion_kernel(*setup)
+    n_bins = kernel.shape[1]
+    # Regularização de Tikhonov: min |K f - y|^2 + alpha^2 |f|^2, f >= 0
+    system = np.vstack([kernel, alpha * np.eye(n_bins)])
+    rhs = np.zeros(system.shape[0])
+    compressed = echoes @ basis
+
+    amplitudes = np.empty((echoes.shape[0], n_bins))
+    for i, data in enumerate(compressed):
+        rhs[: data.size] = data
+        amplitudes[i] = nnls(system, rhs)[0]
+    return amplitudes
+
+
+def invert_echoes(
+    echoes,
+    te,
+    t2_min=0.3,
+    t2_max=3000.0,
+    n_bins=64,
+    alpha=1.0,
+    max_workers=None,
+    chunk_size=INVERSION_CHUNK_SIZE,
+):
+    """Invert raw CPMG echo trains (depth x echoes) into T2 distributions.
+
+    Each depth is solved by non-negative least squares with Tikhonov
+    regularization `alpha` against the cached, SVD-compressed kernel of the
+    acquisition (see `inversion_kernel`). Blocks of `chunk_size` depths are
+    spread over `max_workers` processes; small logs are solved in-process.
+    Returns the (depth x n_bins) amplitude matrix, ready for `nmr_curves`,
+    on the T2 bins given by `t2_axis(t2_min, t2_max, n_bins)`.
+    """
+    echoes = np.atleast_2d(np.asarray(echoes, dtype=float))
+    setup = (float(te), echoes.shape[1], float(t2_min), float(t2_max), int(n_bins))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    starts = range(0, echoes.shape[0], chunk_size)
+    if max_workers == 1 or len(starts) == 1:
+        return _invert_chunk(echoes, setup, alpha)
+
+    # "spawn": processos criados por fork podem travar nos threads do BLAS
+    with ProcessPoolExecutor(max_workers, mp_context=get_context("spawn")) as executor:
+        blocks = executor.map(
+            _invert_chunk,
+            [echoes[start : start + chunk_size] for start in starts],
+            [setup] * len(starts),
+            [alpha] * len(starts),
+        )
+        return np.concatenate(list(blocks))
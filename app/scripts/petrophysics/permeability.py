@@ -0,0 +1,136 @@
+import numpy as np
+
+from scripts.petrophysics.buffers import output_buffer, unwrap
+
+PERMEABILITY_MODELS = (
+    "TIMUR",
+    "WYLLIE_ROSE",
+    "COATES_DUMANOIR",
+    "NMR_SDR",
+    "NMR_COATES",
+)
+
+# Constante de Wyllie & Rose (1950) para cada fluido
+WYLLIE_ROSE_CONSTANTS = {"Medium Gravity Oil": 250.0, "Dry Gas": 73.0}
+
+
+def timur(phi, swirr, out=None):
+    """Estimate the permeability (mD) using Timur (1968)"""
+    k = output_buffer(out, phi, swirr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.power(phi, 2.2, out=k)
+        np.multiply(k, 93.0, out=k)
+        np.divide(k, swirr, out=k)
+        np.square(k, out=k)
+    return unwrap(k)
+
+
+def wyllie_rose(phi, swirr, constant=250.0, out=None):
+    """Estimate the permeability (mD) using Wyllie & Rose (1950).
+
+    `constant` is 250 for medium gravity oil and 73 for dry gas.
+    """
+    k = output_buffer(out, phi, swirr, constant)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.power(phi, 3, out=k)
+        np.divide(k, swirr, out=k)
+        np.multiply(k, constant, out=k)
+        np.square(k, out=k)
+    return unwrap(k)
+
+
+def coates_dumanoir_w(phi, rw, rtirr):
+    """Constant W of the Coates & Dumanoir (1973) equation"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.log10(np.divide(rw, rtirr)) + 2.2
+        return np.sqrt(3.75 - np.asarray(phi) + np.square(w) / 2)
+
+
+def coates_dumanoir_c(rho_h):
+    """Constant C of the Coates & Dumanoir (1973) equation"""
+    return 23 + 465 * np.asarray(rho_h) - 188 * np.square(rho_h)
+
+
+def coates_dumanoir(phi, rw, rtirr, c, w, out=None):
+    """Estimate the permeability (mD) using Coates & Dumanoir (1973)"""
+    k = output_buffer(out, phi, rw, rtirr, c, w)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        np.power(phi, np.multiply(2, w), out=k)
+        np.multiply(k, c, out=k)
+        np.divide(k, np.power(w, 4), out=k)
+        np.multiply(k, rtirr, out=k)
+        np.divide(k, rw, out=k)
+        np.square(k, out=k)
+    return unwrap(k)
+
+
+def nmr_sdr(phi_nmr, t2gm, a=4.0, out=None):
+    """Estimate the permeability (mD) from NMR porosity and T2 geometric mean"""
+    k = output_buffer(out, phi_nmr, t2gm, a)
+    np.power(phi_nmr, 4, out=k)
+    np.multiply(k, a, out=k)
+    np.multiply(k, t2gm, out=k)
+    np.multiply(k, t2gm, out=k)
+    return unwrap(k)
+
+
+def nmr_coates(phi_nmr, ffi, bvi, c=10.0, out=None):
+    """Estimate the permeability (mD) using the Coates NMR (free fluid) model"""
+    k = output_buffer(out, phi_nmr, ffi, bvi, c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.divide(ffi, bvi)
+        np.divide(phi_nmr, c, out=k)
+        np.square(k, out=k)
+        np.square(k, out=k)
+        np.multiply(k, ratio, out=k)
+        np.multiply(k, ratio, out=k)
+    return unwrap(k)
+
+
+def permeability_models(
+    phi,
+    swirr=None,
+    rw=None,
+    rtirr=None,
+    rho_h=None,
+    phi_nmr=None,
+    t2gm=None,
+    ffi=None,
+    bvi=None,
+    wyllie_rose_constant=250.0,
+    sdr_a=4.0,
+    nmr_c=10.0,
+):
+    """Evaluate every permeability model over full curves at once.
+
+    Returns a structured array with one float64 field per model in
+    `PERMEABILITY_MODELS`. Models whose inputs are missing are filled with
+    NaN; `phi` is also used as the NMR porosity if `phi_nmr` is not given.
+    """
+    phi = np.asarray(phi, dtype=float)
+    result = np.empty(phi.shape, dtype=[(name, "f8") for name in PERMEABILITY_MODELS])
+    result[...] = np.nan
+    phi_nmr = phi if phi_nmr is None else phi_nmr
+
+    # Cada modelo é calculado num buffer contíguo e copiado para seu campo,
+    # já que os campos de um array estruturado são intercalados na memória
+    scratch = np.empty(phi.shape)
+
+    if swirr is not None:
+        result["TIMUR"] = timur(phi, swirr, out=scratch)
+        result["WYLLIE_ROSE"] = wyllie_rose(
+            phi, swirr, wyllie_rose_constant, out=scratch
+        )
+
+    if rw is not None and rtirr is not None and rho_h is not None:
+        w = coates_dumanoir_w(phi, rw, rtirr)
+        c = coates_dumanoir_c(rho_h)
+        result["COATES_DUMANOIR"] = coates_dumanoir(phi, rw, rtirr, c, w, out=scratch)
+
+    if t2gm is not None:
+        result["NMR_SDR"] = nmr_sdr(phi_nmr, t2gm, sdr_a, out=scratch)
+
+    if ffi is not None and bvi is not None:
+        result["NMR_COATES"] = nmr_coates(phi_nmr, ffi, bvi, nmr_c, out=scratch)
+
+    return result
@@ -0,0 +1,150 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+
+from scripts.petrophysics.crossplot import bin_points
+
+PICKETT_METHODS = ("HUBER", "RANSAC")
+
+# Fator para estimar o desvio padrão a partir do desvio absoluto mediano
+MAD_SCALE = 1.4826
+
+
+def _line_fit(x, y, w=None):
+    """Weighted least-squares line; returns (intercept, slope)"""
+    w = np.ones_like(x) if w is None else w
+    sw = w.sum()
+    mx = (w * x).sum() / sw
+    my = (w * y).sum() / sw
+    dx = x - mx
+    slope = (w * dx * (y - my)).sum() / (w * dx * dx).sum()
+    return my - slope * mx, slope
+
+
+def _robust_scale(r):
+    return MAD_SCALE * np.median(np.abs(r - np.median(r)))
+
+
+def huber_fit(x, y, delta=1.345, max_iter=50, tol=1e-8):
+    """Straight line fitted with the Huber loss (iteratively reweighted LS).
+
+    Residuals beyond `delta` robust standard deviations (from the median
+    absolute deviation) get weights that fall off as 1/|r|, so hydrocarbon
+    and shale points pull the line much less than in a plain fit. Returns
+    (intercept, slope).
+    """
+    b0, b1 = _line_fit(x, y)
+    for _ in range(max_iter):
+        r = y - (b0 + b1 * x)
+        scale = _robust_scale(r)
+        if scale == 0:
+            break
+        with np.errstate(divide="ignore"):
+            w = np.minimum(1.0, delta * scale / np.abs(r))
+        new = _line_fit(x, y, w)
+        converged = abs(new[0] - b0) + abs(new[1] - b1) < tol
+        b0, b1 = new
+        if converged:
+            break
+    return b0, b1
+
+
+def ransac_fit(
+    x, y, threshold=None, n_trials=500, max_points=10000, chunk_size=64, seed=0
+):
+    """Straight line fitted with RANSAC, scoring every trial line at once.
+
+    Lines through random pairs of points are scored by their number of
+    inliers (residual below `threshold`, by default twice the robust scale
+    of the residuals of a plain fit) on a subsample of `max_points`, a
+    block of `chunk_size` trials per broadcast. The best line is refitted by
+    least squares on all of its inliers. Returns (intercept, slope) and the
+    inlier mask.
+    """
+    rng = np.random.default_rng(seed)
+    if threshold is None:
+        b0, b1 = _line_fit(x, y)
+        threshold = 2 * _robust_scale(y - (b0 + b1 * x))
+    sample = rng.choice(x.size, min(x.size, max_points), replace=False)
+    xs, ys = x[sample], y[sample]
+
+    pairs = rng.integers(0, xs.size, (n_trials, 2))
+    x1, x2 = xs[pairs[:, 0]], xs[pairs[:, 1]]
+    y1, y2 = ys[pairs[:, 0]], ys[pairs[:, 1]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (y2 - y1) / (x2 - x1)
+    intercepts = y1 - slopes * x1
+    keep = np.isfinite(slopes)
+    slopes, intercepts = slopes[keep], intercepts[keep]
+    if slopes.size == 0:
+        raise ValueError("The points have no spread in porosity.")
+
+    scores = np.empty(slopes.size, dtype=np.intp)
+    for start in range(0, slopes.size, chunk_size):
+        block = slice(start, start + chunk_size)
+        r = ys - (intercepts[block, np.newaxis] + slopes[block, np.newaxis] * xs)
+        scores[block] = (np.abs(r) <= threshold).sum(axis=1)
+    best = np.argmax(scores)
+
+    inliers = np.abs(y - (intercepts[best] + slopes[best] * x)) <= threshold
+    return _line_fit(x[inliers], y[inliers]), inliers
+
+
+def pickett_fit(rt, phi, method="HUBER", a=1.0):
+    """Archie parameters from a Pickett plot of a water-bearing interval.
+
+    Fits log(Rt) = log(a Rw) - m log(phi) over the valid samples with the
+    robust `method` of `PICKETT_METHODS`. The plot only gives the product
+    a Rw, so `a` is given and Rw follows from it. Returns a dict with `m`,
+    `rw`, `a` and the number of samples used.
+    """
+    if method not in PICKETT_METHODS:
+        raise ValueError(f"Unknown Pickett fitting method '{method}'.")
+    rt = np.asarray(rt, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    with np.errstate(invalid="ignore"):
+        valid = (rt > 0) & (phi > 0) & (phi < 1)
+    if valid.sum() < 2:
+        raise ValueError("There are not enough samples with Rt and porosity.")
+    x, y = np.log10(phi[valid]), np.log10(rt[valid])
+
+    if method == "HUBER":
+        (intercept, slope), used = huber_fit(x, y), x.size
+    else:
+        (intercept, slope), inliers = ransac_fit(x, y)
+        used = int(inliers.sum())
+    return {"m": -slope, "rw": 10**intercept / a, "a": a, "samples": used}
+
+
+def plot_pickett(rt, phi, fit, n=2.0, saturations=(1.0, 0.5, 0.25), bins=200):
+    """Pickett crossplot drawn as a density grid with the fitted Sw lines"""
+    rt = np.asarray(rt, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        counts, xedges, yedges = bin_points(np.log10(phi), np.log10(rt), bins)
+
+    fig, ax = plt.subplots(1, 1, figsize=(8, 6))
+    mesh = ax.pcolormesh(
+        10**xedges,
+        10**yedges,
+        np.ma.masked_equal(counts, 0),
+        norm=LogNorm(),
+        cmap="viridis",
+    )
+    fig.colorbar(mesh, ax=ax, label="Samples")
+
+    phi_line = 10 ** np.array([xedges[0], xedges[-1]])
+    for sw in saturations:
+        rt_line = fit["a"] * fit["rw"] / (phi_line ** fit["m"] * sw**n)
+        ax.plot(phi_line, rt_line, label=f"$S_w$ = {sw:.0%}")
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlim(phi_line)
+    ax.set_ylim(10 ** yedges[0], 10 ** yedges[-1])
+    ax.set_xlabel(r"$\phi$ (decimal)")
+    ax.set_ylabel(r"$R_t$ (ohm-m)")
+    ax.set_title(f"Pickett plot: m = {fit['m']:.2f}, $R_w$ = {fit['rw']:.4f} ohm-m")
+    # Posição fixa: a busca da melhor posição percorre toda a malha
+    ax.legend(loc="upper right")
+    return fig
@@ -1,5 +1,6 @@
 import numpy as np
-import streamlit as st
+
+from scripts.petrophysics.flags import range_flags
 
 
 def correct_petrophysic_estimation_range(petrophysics_data):
@@ -22,32 +23,16 @@ def effective_porosity(phi, vsh):
 
 
 def density_porosity(rhob, rhom, rhof):
-    """Estimate the porosity from the bulk density log"""
-    # Verificar se rhob é um array ou um valor escalar
-    is_array = isinstance(rhob, (np.ndarray, list))
-
-    if rhom == rhof:
-        st.warning("This will result in a division by zero.", icon="🚨")
-        return np.nan  # Retorna NaN para evitar divisão por zero
-
-    if (
-        rhom < rhof
-        or (is_array and any(rhom <= rhob))
-        or (not is_array and rhom <= rhob)
-    ):
-        st.warning("Rho_Matriz must be greater than Rho_fluid and Rho_Log", icon="🚨")
-        # return np.nan  # Retorna NaN para valores inválidos
+    """Estimate the porosity from the bulk density log.
 
-    if is_array and any(rhom - rhob > rhom - rhof):
-        st.warning("rhob value is lower than rhof", icon="🚨")
-        # return np.nan  # Retorna NaN para valores inválidos
-
-    # Cálculo da porosidade
-    phi = (rhom - rhob) / (rhom - rhof)
+    Returns the porosity and its validity bitmask (see `flags.range_flags`).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        phi = np.divide(np.subtract(rhom, rhob), np.subtract(rhom, rhof))
 
     # Corrigir valores fora do intervalo [0, 1]
     # phi = correct_petrophysic_estimation_range(phi)
-    return phi
+    return phi, range_flags(phi)
 
 
 # def neutron_porosity(nphi: np.ndarray, vsh: np.ndarray, nphi_sh: float):
@@ -58,52 +43,26 @@ def density_porosity(rhob, rhom, rhof):
 
 def neutron_density_porosity(
     phid: np.ndarray, phin: np.ndarray, squared: bool = False
-) -> np.ndarray:
+) -> tuple[np.ndarray, np.ndarray]:
     """Estimate the effective porosity by calculating the mean of Bulk Density porosity and Neutron porosity"""
-    if squared == False:
-        if np.any((phid + phin / 2) > 1):
-            st.warning("The value must be a value between 0 and 1")
-
-            phi = (phid + phin) / 2
-        else:
-            phi = (phid + phin) / 2
-
-    elif squared == True:
-        if np.any((phid**2 + phin**2 / 2) > 1):
-            st.warning("The value must be a value between 0 and 1")
-
-            phi = np.sqrt((phid**2 + phin**2) / 2)
-
-        else:
-            phi = np.sqrt((phid**2 + phin**2) / 2)
+    if squared:
+        phi = np.sqrt((np.square(phid) + np.square(phin)) / 2)
+    else:
+        phi = np.add(phid, phin) / 2
 
     # phi = correct_petrophysic_estimation_range(phi)
-    return phi
+    return phi, range_flags(phi)
 
 
-def sonic_porosity(dt: np.ndarray, dtma: float, dtf: float):
+def sonic_porosity(
+    dt: np.ndarray, dtma: float, dtf: float
+) -> tuple[np.ndarray, np.ndarray]:
     """Estimate the Porosity from sonic using the Wyllie time-average equation [1]_."""
-    if dtf == dtma:
-        st.warning("This will result in a division by zero")
-
-        return np.nan
-
-    else:
-        if np.any(dt <= dtma) or dtf <= dtma:
-            st.warning("dt and dtf must be greater than dtma")
-
-            phidt = (dt - dtma) / (dtf - dtma)
-
-        elif np.any(dt - dtma > dtf - dtma):
-            st.warning("dt value is greather than dtf")
-
-            phidt = (dt - dtma) / (dtf - dtma)
-
-        else:
-            phidt = (dt - dtma) / (dtf - dtma)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        phidt = np.divide(np.subtract(dt, dtma), np.subtract(dtf, dtma))
 
     # phidt = correct_petrophysic_estimation_range(phidt)
-    return phidt
+    return phidt, range_flags(phidt)
 
 
 def gaymard_porosity(phid, phin):
@@ -112,3 +71,73 @@ def gaymard_porosity(phid, phin):
 
     # phie = correct_petrophysic_estimation_range(phie)
     return phie
+
+
+POROSITY_CURVES = ("PHID", "PHIS", "PHIND", "PHIGP")
+
+
+def porosity_curves(
+    rhob: np.ndarray = None,
+    nphi: np.ndarray = None,
+    dt: np.ndarray = None,
+    rhom=2.65,
+    rhof=1.0,
+    dtma=55.5,
+    dtf=189.0,
+    out: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute every porosity curve of a well in one vectorized pass.
+
+    `rhob`, `nphi` and `dt` are full depth-indexed curves of the same length.
+    The matrix/fluid parameters may be scalars or arrays of the same length
+    as the curves (per-zone values already broadcast along depth).
+
+    Returns a 2-D array with one row per curve in `POROSITY_CURVES`
+    (density, sonic, neutron-density and Gaymard-Poupon porosity). Missing
+    input curves produce rows filled with NaN. Pass a preallocated `out`
+    array of shape (4, n) to reuse the same buffer between runs.
+
+    The uint8 validity bitmask of every curve is returned alongside the
+    porosities.
+    """
+    curves = [np.asarray(c) for c in (rhob, nphi, dt) if c is not None]
+    if not curves:
+        raise ValueError("At least one of 'rhob', 'nphi' or 'dt' must be given.")
+    n = curves[0].shape[0]
+
+    if out is None:
+        out = np.empty((len(POROSITY_CURVES), n), dtype=np.result_type(*curves, float))
+    elif out.shape != (len(POROSITY_CURVES), n):
+        raise ValueError(
+            f"'out' must have shape {(len(POROSITY_CURVES), n)}, got {out.shape}."
+        )
+
+    phid, phis, phind, phigp = out
+
+    # Densidade: (rhom - rhob) / (rhom - rhof)
+    if rhob is not None:
+        np.subtract(rhom, rhob, out=phid)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(phid, np.subtract(rhom, rhof), out=phid)
+    else:
+        phid.fill(np.nan)
+
+    # Sônico (Wyllie): (dt - dtma) / (dtf - dtma)
+    if dt is not None:
+        np.subtract(dt, dtma, out=phis)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(phis, np.subtract(dtf, dtma), out=phis)
+    else:
+        phis.fill(np.nan)
+
+    # Neutrão-densidade: média aritmética e Gaymard-Poupon (média quadrática)
+    if nphi is not None:
+        np.add(phid, nphi, out=phind)
+        np.multiply(phind, 0.5, out=phind)
+        np.hypot(phid, nphi, out=phigp)
+        np.multiply(phigp, np.sqrt(0.5), out=phigp)
+    else:
+        phind.fill(np.nan)
+        phigp.fill(np.nan)
+
+    return out, range_flags(out)
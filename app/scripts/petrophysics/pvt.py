@@ -0,0 +1,168 @@
+import numpy as np
+
+import scripts.petrophysics.gas as gas
+
+PVT_PROPERTIES = ("RS", "BO", "BG", "MUO")
+
+PVT_CORRELATIONS = ("STANDING", "VASQUEZ_BEGGS")
+
+# Constantes de Vasquez & Beggs (1980) para API <= 30 e API > 30
+VASQUEZ_BEGGS_RS = {True: (0.0362, 1.0937, 25.724), False: (0.0178, 1.187, 23.931)}
+VASQUEZ_BEGGS_BO = {
+    True: (4.677e-4, 1.751e-5, -1.811e-8),
+    False: (4.670e-4, 1.100e-5, 1.337e-9),
+}
+
+
+def oil_gravity(api):
+    """Oil specific gravity (water = 1) from the API gravity"""
+    return 141.5 / (131.5 + np.asarray(api))
+
+
+def bubble_point(rsb, t, api, gamma_g, correlation="STANDING"):
+    """Bubble point pressure (psia) for the solution GOR `rsb` (scf/STB) at `t` (ºF)"""
+    t = np.asarray(t, dtype=float)
+    if correlation == "STANDING":
+        return 18.2 * (
+            (rsb / gamma_g) ** 0.83 * 10 ** (0.00091 * t - 0.0125 * api) - 1.4
+        )
+    c1, c2, c3 = VASQUEZ_BEGGS_RS[api <= 30]
+    return (rsb / (c1 * gamma_g * np.exp(c3 * api / (t + gas.RANKINE)))) ** (1 / c2)
+
+
+def solution_gor(p, t, api, gamma_g, correlation="STANDING"):
+    """Solution gas-oil ratio (scf/STB) of saturated oil at `p` (psia) and `t` (ºF)"""
+    p = np.asarray(p, dtype=float)
+    t = np.asarray(t, dtype=float)
+    if correlation == "STANDING":
+        return (
+            gamma_g * ((p / 18.2 + 1.4) * 10 ** (0.0125 * api - 0.00091 * t)) ** 1.2048
+        )
+    c1, c2, c3 = VASQUEZ_BEGGS_RS[api <= 30]
+    return c1 * gamma_g * p**c2 * np.exp(c3 * api / (t + gas.RANKINE))
+
+
+def oil_fvf(rs, t, api, gamma_g, correlation="STANDING"):
+    """Oil formation volume factor (bbl/STB) of saturated oil"""
+    t = np.asarray(t, dtype=float)
+    if correlation == "STANDING":
+        gamma_o = oil_gravity(api)
+        return 0.9759 + 0.00012 * (rs * np.sqrt(gamma_g / gamma_o) + 1.25 * t) ** 1.2
+    c1, c2, c3 = VASQUEZ_BEGGS_BO[api <= 30]
+    return 1 + c1 * rs + (t - 60) * (api / gamma_g) * (c2 + c3 * rs)
+
+
+def oil_viscosity(rs, t, api):
+    """Viscosity (cp) of saturated oil, Beggs & Robinson (1975)"""
+    t = np.asarray(t, dtype=float)
+    x = 10 ** (3.0324 - 0.02023 * api) * t**-1.163
+    dead = 10**x - 1
+    a = 10.715 * (rs + 100) ** -0.515
+    b = 5.44 * (rs + 150) ** -0.338
+    return a * dead**b
+
+
+class PVTTable:
+    """Black-oil properties tabulated on a temperature x pressure grid.
+
+    `tables` maps each property of `PVT_PROPERTIES` (or any lab property) to
+    an array of shape (len(temperature), len(pressure)). Queries interpolate
+    bilinearly between the grid nodes and hold the edge values outside the
+    grid.
+    """
+
+    def __init__(self, pressure, temperature, tables):
+        self.pressure = np.asarray(pressure, dtype=float)
+        self.temperature = np.atleast_1d(np.asarray(temperature, dtype=float))
+        self.properties = tuple(tables)
+        shape = (self.temperature.size, self.pressure.size)
+        self.values = np.stack(
+            [np.broadcast_to(np.asarray(tables[name], float), shape) for name in tables]
+        )
+
+    @classmethod
+    def from_correlations(
+        cls,
+        api,
+        gamma_g,
+        rsb,
+        correlation="STANDING",
+        pressure=None,
+        temperature=None,
+    ):
+        """Build the table from black-oil correlations.
+
+        Below the bubble point the oil is saturated (Standing, 1947 or
+        Vasquez & Beggs, 1980); above it Rs stays at `rsb` and Bo and the
+        viscosity follow the Vasquez & Beggs undersaturated equations. Bg
+        comes from the DAK Z-factor.
+        """
+        if correlation not in PVT_CORRELATIONS:
+            raise ValueError(f"Unknown PVT correlation '{correlation}'.")
+        p = np.linspace(14.7, 10000.0, 200) if pressure is None else pressure
+        t = np.linspace(60.0, 350.0, 30) if temperature is None else temperature
+        p = np.asarray(p, dtype=float)[np.newaxis, :]
+        t = np.atleast_1d(np.asarray(t, dtype=float))[:, np.newaxis]
+
+        pb = bubble_point(rsb, t, api, gamma_g, correlation)
+        saturated = p <= pb
+        p_sat = np.minimum(p, pb)
+        rs = np.where(saturated, solution_gor(p_sat, t, api, gamma_g, correlation), rsb)
+        bo = oil_fvf(rs, t, api, gamma_g, correlation)
+        muo = oil_viscosity(rs, t, api)
+
+        # Óleo subsaturado (Vasquez & Beggs)
+        above = ~saturated
+        ratio = np.where(above, p / pb, 1.0)
+        a = 1e-5 * (-1433 + 5 * rsb + 17.2 * t - 1180 * gamma_g + 12.61 * api)
+        bo = np.where(above, bo * ratio**-a, bo)
+        m = 2.6 * p**1.187 * np.exp(-11.513 - 8.98e-5 * p)
+        muo = np.where(above, muo * ratio**m, muo)
+
+        z = gas.z_factor(p, t, gamma_g)
+        bg = gas.gas_fvf(p, t, z)
+        tables = {"RS": rs, "BO": bo, "BG": bg, "MUO": muo}
+        return cls(p[0], t[:, 0], tables)
+
+    @classmethod
+    def from_lab(cls, pressure, temperature, **tables):
+        """Build the table from laboratory measurements on a pressure grid.
+
+        With a single `temperature` (e.g. a differential liberation at
+        reservoir temperature) each property is a 1-D array over `pressure`
+        and queries interpolate in pressure only.
+        """
+        order = np.argsort(pressure)
+        tables = {name: np.asarray(v, float)[..., order] for name, v in tables.items()}
+        return cls(np.asarray(pressure, float)[order], temperature, tables)
+
+    @staticmethod
+    def _weights(axis, x):
+        """Lower node index and linear weight of `x` along a sorted `axis`"""
+        if axis.size == 1:
+            return np.zeros(np.shape(x), dtype=np.intp), np.zeros(np.shape(x))
+        i = np.clip(np.searchsorted(axis, x) - 1, 0, axis.size - 2)
+        w = (np.clip(x, axis[0], axis[-1]) - axis[i]) / (axis[i + 1] - axis[i])
+        return i, w
+
+    def query(self, p, t, properties=None):
+        """Interpolate properties at pressures `p` (psia) and temperatures `t` (ºF).
+
+        `p` and `t` broadcast against each other (e.g. `p[None, :]` and
+        `t[:, None]` for a grid). Returns a dict of arrays, one per property.
+        """
+        p, t = np.broadcast_arrays(np.asarray(p, float), np.asarray(t, float))
+        names = self.properties if properties is None else tuple(properties)
+        missing = [name for name in names if name not in self.properties]
+        if missing:
+            raise ValueError(f"The PVT table has no {', '.join(missing)} property.")
+        values = self.values[[self.properties.index(name) for name in names]]
+
+        ip, wp = self._weights(self.pressure, p)
+        it, wt = self._weights(self.temperature, t)
+        jp = np.minimum(ip + 1, self.pressure.size - 1)
+        jt = np.minimum(it + 1, self.temperature.size - 1)
+        low = values[:, it, ip] * (1 - wp) + values[:, it, jp] * wp
+        high = values[:, jt, ip] * (1 - wp) + values[:, jt, jp] * wp
+        result = low * (1 - wt) + high * wt
+        return dict(zip(names, result))
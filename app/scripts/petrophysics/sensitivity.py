@@ -0,0 +1,89 @@
+import numpy as np
+
+from scripts.petrophysics.uncertainty import draw
+
+
+def _batch(base, low, high, n, distributions, rng):
+    """Every parameter set of the analysis as one column per parameter.
+
+    Rows: the base case, low and high of each varied parameter (one at a
+    time), then the Saltelli blocks A, B and AB_i of `n` samples each.
+    """
+    names = list(low)
+    k = len(names)
+    oat = 2 * k + 1
+    size = oat + n * (k + 2)
+    batch = {}
+    for name, value in base.items():
+        column = np.full(size, float(value))
+        if name in low:
+            i = names.index(name)
+            column[2 * i + 1] = low[name]
+            column[2 * i + 2] = high[name]
+            # Sem distribuição dada, uniforme entre low e high
+            dist = distributions.get(name) or {
+                "type": "uniform",
+                "low": low[name],
+                "high": high[name],
+            }
+            a, b = draw(dist, 2 * n, rng).reshape(2, n)
+            blocks = column[oat:].reshape(k + 2, n)
+            blocks[:] = a
+            blocks[1] = b
+            blocks[2 + i] = b
+        batch[name] = column
+    return batch
+
+
+def sensitivity(function, base, low, high, n=4096, distributions=None, seed=None):
+    """One-at-a-time swings and Sobol indices of a vectorized equation.
+
+    `function` is called once, with keyword arguments holding every
+    parameter set as one array: the `base` values, each parameter of `low`
+    moved alone to its low and high value, and the Saltelli samples of the
+    varied parameters (uniform between low and high unless `distributions`
+    gives one, see `volumetrics.DISTRIBUTIONS`). First-order indices use the
+    Saltelli (2010) estimator and total indices the Jansen (1999) one, on
+    the results centred on their mean, over the samples where the result is
+    defined.
+
+    Returns the `BASE` result and, per varied parameter sorted by the size
+    of its swing, the `NAMES`, the `LOW` and `HIGH` results and the `FIRST`
+    and `TOTAL` Sobol indices.
+    """
+    missing = set(low) ^ set(high) | set(low) - set(base)
+    if missing:
+        raise ValueError(f"Give base, low and high values for {sorted(missing)}.")
+    if not low:
+        raise ValueError("Vary at least one parameter.")
+    rng = np.random.default_rng(seed)
+    batch = _batch(base, low, high, n, distributions or {}, rng)
+    k = len(low)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        y = np.asarray(function(**batch), dtype=float)
+    y = np.broadcast_to(y, next(iter(batch.values())).shape)
+
+    oat, samples = y[: 2 * k + 1], y[2 * k + 1 :].reshape(k + 2, n)
+    f_a, f_b, f_ab = samples[0], samples[1], samples[2:]
+    valid = np.isfinite(samples).all(axis=0)
+    f_a, f_b, f_ab = f_a[valid], f_b[valid], f_ab[:, valid]
+    # Saídas centradas na média de A e B: sem isso o estimador de primeira
+    # ordem soma um erro proporcional à média, grande para médias altas
+    pooled = np.concatenate([f_a, f_b])
+    center = pooled.mean() if pooled.size else 0.0
+    f_a, f_b, f_ab = f_a - center, f_b - center, f_ab - center
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = np.var(pooled)
+        first = np.mean(f_b * (f_ab - f_a), axis=1) / var
+        total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / var
+
+    low_y, high_y = oat[1::2], oat[2::2]
+    order = np.argsort(-np.abs(high_y - low_y), kind="stable")
+    return {
+        "BASE": oat[0],
+        "NAMES": [list(low)[i] for i in order],
+        "LOW": low_y[order],
+        "HIGH": high_y[order],
+        "FIRST": first[order],
+        "TOTAL": total[order],
+    }
@@ -1,21 +1,97 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from scripts.petrophysics.buffers import output_buffer, unwrap
 
-def larionov(igr):
-    return 0.083 * (2 ** (3.7 * igr) - 1)
+VSH_METHODS = ("LINEAR", "LARIONOV", "LARIONOV_OLD_ROCKS", "STEIBER", "CLAVIER")
 
 
-def larionov_old_rocks(igr):
-    return 0.33 * (2 ** (2 * igr) - 1)
+def gamma_ray_index(gr, gr_clean, gr_shale, clip=True, out=None):
+    """Gamma ray index; the baselines may be scalars or per-depth curves"""
+    igr = output_buffer(out, gr, gr_clean, gr_shale)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(gr, gr_clean, out=igr)
+        np.divide(igr, np.subtract(gr_shale, gr_clean), out=igr)
+    if clip:
+        np.clip(igr, 0, 1, out=igr)
+    return unwrap(igr)
 
 
-def steiber(igr):
-    return igr / (3 - 2 * igr)
+def linear(igr, out=None):
+    vsh = output_buffer(out, igr)
+    np.copyto(vsh, igr)
+    return unwrap(vsh)
 
 
-def clavier(igr):
-    return 1.7 - (3.38 - (igr + 0.7) ** 2) ** (1 / 2)
+def larionov(igr, out=None):
+    vsh = output_buffer(out, igr)
+    np.multiply(igr, 3.7, out=vsh)
+    np.exp2(vsh, out=vsh)
+    np.subtract(vsh, 1, out=vsh)
+    np.multiply(vsh, 0.083, out=vsh)
+    return unwrap(vsh)
+
+
+def larionov_old_rocks(igr, out=None):
+    vsh = output_buffer(out, igr)
+    np.multiply(igr, 2, out=vsh)
+    np.exp2(vsh, out=vsh)
+    np.subtract(vsh, 1, out=vsh)
+    np.multiply(vsh, 0.33, out=vsh)
+    return unwrap(vsh)
+
+
+def steiber(igr, out=None):
+    vsh = output_buffer(out, igr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.multiply(igr, -2, out=vsh)
+        np.add(vsh, 3, out=vsh)
+        np.divide(igr, vsh, out=vsh)
+    return unwrap(vsh)
+
+
+def clavier(igr, out=None):
+    vsh = output_buffer(out, igr)
+    with np.errstate(invalid="ignore"):
+        np.add(igr, 0.7, out=vsh)
+        np.square(vsh, out=vsh)
+        np.subtract(3.38, vsh, out=vsh)
+        np.sqrt(vsh, out=vsh)
+        np.subtract(1.7, vsh, out=vsh)
+    return unwrap(vsh)
+
+
+VSH_TRANSFORMS = dict(
+    zip(VSH_METHODS, (linear, larionov, larionov_old_rocks, steiber, clavier))
+)
+
+
+def compute_vsh(gr, gr_clean, gr_shale, methods=VSH_METHODS, clip=True, out=None):
+    """Shale volume curves of several IGR transforms at once.
+
+    The gamma ray index is computed once and each method of `methods` (see
+    `VSH_METHODS`) writes its row of `out`, a (len(methods), n) array that
+    is allocated if not given. `gr_clean` and `gr_shale` may be per-depth
+    curves, e.g. zone baselines broadcast to the log. With `clip` the index
+    is limited to [0, 1] before the transforms.
+    """
+    gr = np.asarray(gr, dtype=float)
+    igr = gamma_ray_index(gr, gr_clean, gr_shale, clip=clip)
+    shape = (len(methods), *np.shape(igr))
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"'out' must have shape {shape}, got {out.shape}.")
+
+    for i, method in enumerate(methods):
+        VSH_TRANSFORMS[method](igr, out=out[i, ...])
+    return out
+
+
+# Curvas de referência do gráfico, calculadas uma única vez
+IGR_REFERENCE = np.linspace(0, 1, 100)
+VSH_REFERENCE = compute_vsh(IGR_REFERENCE, 0.0, 1.0)
+VSH_REFERENCE.flags.writeable = False
 
 
 def plot_igr(igr_custom=None):
@@ -25,23 +101,16 @@ def plot_igr(igr_custom=None):
     if not (0 <= igr_custom <= 1):
         raise ValueError("'igr_custom' must be between 0 and 1.")
 
-    igr = np.linspace(0, 1, 100)
-
-    vsh_larionov = larionov(igr)
-    vsh_larionov_or = larionov_old_rocks(igr)
-    vsh_steiber = steiber(igr)
-    vsh_clavier = clavier(igr)
+    igr = IGR_REFERENCE
+    _, vsh_larionov, vsh_larionov_or, vsh_steiber, vsh_clavier = VSH_REFERENCE
 
-    vsh_lar_custom = larionov(igr_custom)
-    vsh_lar_or_custom = larionov_old_rocks(igr_custom)
-    vsh_steiber_custom = steiber(igr_custom)
-    vsh_clavier_custom = clavier(igr_custom)
+    custom = dict(zip(VSH_METHODS, compute_vsh(igr_custom, 0.0, 1.0)))
 
     labels = {
-        "Larionov": f"Larionov - {vsh_lar_custom * 100:.2f}%",
-        "Larionov Old Rocks": f"Larionov Old Rocks - {vsh_lar_or_custom * 100:.2f}%",
-        "Steiber": f"Steiber - {vsh_steiber_custom * 100:.2f}%",
-        "Clavier": f"Clavier - {vsh_clavier_custom * 100:.2f}%",
+        "Larionov": f"Larionov - {custom['LARIONOV'] * 100:.2f}%",
+        "Larionov Old Rocks": f"Larionov Old Rocks - {custom['LARIONOV_OLD_ROCKS'] * 100:.2f}%",
+        "Steiber": f"Steiber - {custom['STEIBER'] * 100:.2f}%",
+        "Clavier": f"Clavier - {custom['CLAVIER'] * 100:.2f}%",
         "IGR": f"IGR - {igr_custom*100:.2f}%",
     }
 
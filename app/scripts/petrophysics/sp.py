@@ -0,0 +1,91 @@
+import numpy as np
+from scipy import interpolate, ndimage
+
+from scripts.petrophysics.buffers import output_buffer, unwrap
+from scripts.petrophysics.gamma_ray import histogram_quantiles, zone_histograms
+from scripts.petrophysics.shale_volume import gamma_ray_index
+
+SP_BASELINE_METHODS = ("MEDIAN", "SPLINE")
+
+# Classes de 0.25 mV para os histogramas de SP
+SP_EDGES = np.linspace(-300.0, 100.0, 1601)
+
+
+def sp_k(tf):
+    """SP constant K (mV) at the formation temperature `tf` (ºF)"""
+    return 60 + 0.133 * np.asarray(tf, dtype=float)
+
+
+def shale_baseline(sp, window, method="MEDIAN", shale=None):
+    """Shale baseline of an SP curve, following its drift along the well.
+
+    Only the samples flagged in `shale` are used; when not given, the shale
+    points are the samples above the rolling median of the SP (sands deflect
+    the SP to negative values). "MEDIAN" takes a centered rolling median of
+    `window` samples over the shale points, bridging the sands by linear
+    interpolation; "SPLINE" fits a least-squares cubic spline with a knot
+    every `window` samples.
+    """
+    if method not in SP_BASELINE_METHODS:
+        raise ValueError(f"Unknown SP baseline method '{method}'.")
+    sp = np.asarray(sp, dtype=float)
+    samples = np.arange(sp.size)
+    window = max(4, int(window))
+    points = ~np.isnan(sp)
+    if shale is not None:
+        points &= np.asarray(shale, dtype=bool)
+    elif points.sum() >= 4:
+        bridged = np.interp(samples, samples[points], sp[points])
+        with np.errstate(invalid="ignore"):
+            points &= sp >= ndimage.median_filter(bridged, size=window, mode="nearest")
+    if points.sum() < 4:
+        raise ValueError("There are not enough shale points for the SP baseline.")
+
+    if method == "MEDIAN":
+        bridged = np.interp(samples, samples[points], sp[points])
+        return ndimage.median_filter(bridged, size=window, mode="nearest")
+
+    x = samples[points]
+    # Nós internos apenas onde há pontos de folhelho dos dois lados
+    knots = np.arange(x[0] + window, x[-1] - window + 1, window, dtype=float)
+    knots = knots[np.diff(np.searchsorted(x, knots), prepend=0) > 0]
+    spline = interpolate.LSQUnivariateSpline(x, sp[points], knots, k=3)
+    # Fora dos pontos de folhelho a linha base fica constante
+    return spline(np.clip(samples, x[0], x[-1]))
+
+
+def zone_ssp(sp, zones=None, n_zones=None, percentile=1.0, edges=SP_EDGES):
+    """Static SP of each zone, the `percentile` of its baseline-corrected SP.
+
+    A low percentile stands for the most negative SP of the cleanest sand
+    without taking single noisy samples. Returns one value per zone (NaN for
+    empty zones), or a single value when `zones` is not given.
+    """
+    if n_zones is None:
+        n_zones = 1 if zones is None else int(np.max(zones)) + 1
+    counts = zone_histograms(sp, zones, n_zones, edges)
+    ssp = histogram_quantiles(counts, [percentile], edges)[:, 0]
+    return ssp if zones is not None else ssp[0]
+
+
+def sp_vsh(sp, ssp, sp_shale=0.0, clip=True, out=None):
+    """Shale volume from the SP, (SP - SSP) / (SP_shale - SSP).
+
+    `ssp` and `sp_shale` may be per-depth curves (e.g. zone values broadcast
+    to the log); with a drift-corrected SP the shale line is zero.
+    """
+    return gamma_ray_index(sp, ssp, sp_shale, clip=clip, out=out)
+
+
+def sp_rw(sp, rmf, k, out=None):
+    """Water resistivity from the SP, Rmf * 10^(SP / K).
+
+    `rmf` and `k` may be per-depth curves, so the temperature dependence of
+    both follows the log.
+    """
+    rw = output_buffer(out, sp, rmf, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(sp, k, out=rw)
+        np.power(10.0, rw, out=rw)
+        np.multiply(rw, rmf, out=rw)
+    return unwrap(rw)
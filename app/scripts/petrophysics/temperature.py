@@ -0,0 +1,47 @@
+import numpy as np
+
+from scripts.petrophysics.buffers import output_buffer, unwrap
+
+# Constante da equação de Arps para temperaturas em ºF
+ARPS_OFFSET = 6.77
+
+
+def formation_temperature(depth, surface_temp, points):
+    """Formation temperature (ºF) at every depth from measured temperatures.
+
+    `points` holds (depth, temperature) pairs such as the BHTs of each
+    logging run. A single point gives a linear gradient from the surface;
+    several points give a piecewise gradient, interpolated between them and
+    extended with the deepest gradient below the last one. `depth` may be
+    a single value or a curve.
+    """
+    points = sorted((float(d), float(t)) for d, t in points)
+    if not points:
+        raise ValueError("Give at least one measured temperature.")
+    depths, temps = np.array([(0.0, surface_temp), *points]).T
+    if np.any(np.diff(depths) <= 0):
+        raise ValueError(
+            "The measured temperatures must be at distinct depths below the surface."
+        )
+
+    depth = np.asarray(depth, dtype=float)
+    gradient = (temps[-1] - temps[-2]) / (depths[-1] - depths[-2])
+    return np.where(
+        depth > depths[-1],
+        temps[-1] + (depth - depths[-1]) * gradient,
+        np.interp(depth, depths, temps),
+    )
+
+
+def arps(resistivity, t1, t2, out=None):
+    """Convert a resistivity measured at `t1` to the temperature `t2` (ºF).
+
+    Arps (1953): R2 = R1 (T1 + 6.77) / (T2 + 6.77). Any argument may be a
+    per-depth curve, e.g. Rmf from the log header taken to the formation
+    temperature profile.
+    """
+    r2 = output_buffer(out, resistivity, t1, t2)
+    np.add(t1, ARPS_OFFSET, out=r2)
+    np.multiply(r2, resistivity, out=r2)
+    np.divide(r2, np.add(t2, ARPS_OFFSET), out=r2)
+    return unwrap(r2)
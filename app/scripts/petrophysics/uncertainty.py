@@ -0,0 +1,164 @@
+import numpy as np
+
+from scripts.petrophysics.volumetrics import MAX_BYTES, _quantiles
+
+# Percentis devolvidos; P90 é o valor excedido com 90 % de probabilidade
+PERCENTILES = {"P90": 10, "P50": 50, "P10": 90}
+# Valores por bloco de profundidades: os temporários de um bloco cabem no
+# cache, o que rende mais que blocos grandes dentro de `max_bytes`
+BLOCK_VALUES = 2**18
+
+
+def _select(values, ranks, start, stop):
+    """Put `ranks` of values[..., start:stop] in place, one kth at a time"""
+    if not ranks:
+        return
+    middle = len(ranks) // 2
+    k = ranks[middle]
+    # Um kth por chamada é bem mais rápido que vários de uma vez no np.partition
+    values[..., start:stop].partition(k - start, axis=-1)
+    _select(values, ranks[:middle], start, k)
+    _select(values, ranks[middle + 1 :], k + 1, stop)
+
+
+def partition_percentiles(values, q):
+    """Percentiles `q` (0-100) along the last axis of `values`, without sorting.
+
+    Same linear interpolation as `np.percentile`. The ranks below each
+    percentile are put in place by nested `partition` calls on ever smaller
+    slices; the next rank is the minimum of the slice above it, or is
+    already in place when it starts that slice. `values` is reordered in
+    place and must not hold NaN. Returns one array per percentile.
+    """
+    n = values.shape[-1]
+    ranks = np.asarray(q, dtype=float) / 100 * (n - 1)
+    low = np.floor(ranks).astype(np.intp)
+    kth = sorted(set(low.tolist()))
+    _select(values, kth, 0, n)
+    bounds = dict(zip(kth, kth[1:] + [n]))
+    result = []
+    for rank, lo in zip(ranks, low):
+        value = values[..., lo]
+        if rank > lo:
+            if bounds[lo] == lo + 1:
+                # O rank seguinte também foi posto no lugar
+                upper = values[..., lo + 1]
+            else:
+                upper = values[..., lo + 1 : bounds[lo]].min(axis=-1)
+            value = value + (rank - lo) * (upper - value)
+        result.append(value)
+    return result
+
+
+def _nan_percentiles(values, q):
+    """Percentiles `q` of each row of `values`, leaving out its NaN values"""
+    # O sort põe os NaN no fim; cada linha usa só os seus valores definidos
+    ordered = np.sort(values, axis=-1)
+    valid = np.count_nonzero(~np.isnan(values), axis=-1)
+    result = []
+    for p in q:
+        rank = p / 100 * (valid - 1)
+        low = np.floor(rank).astype(np.intp)[:, np.newaxis]
+        high = np.minimum(low + 1, valid[:, np.newaxis] - 1)
+        lower = np.take_along_axis(ordered, low, axis=-1)[:, 0]
+        upper = np.take_along_axis(ordered, high, axis=-1)[:, 0]
+        result.append(lower + (rank - low[:, 0]) * (upper - lower))
+    return result
+
+
+def draw(dist, n, rng):
+    """`n` realizations of a distribution (see `volumetrics.DISTRIBUTIONS`)"""
+    if dist["type"] == "constant":
+        return np.full(n, float(dist["value"]))
+    if dist["type"] in ("normal", "lognormal"):
+        return _quantiles(dist, z=rng.standard_normal(n))
+    return _quantiles(dist, u=rng.random(n))
+
+
+def monte_carlo_curves(
+    function, curves, params=None, noise=None, n=1000, seed=None, max_bytes=MAX_BYTES
+):
+    """Per-depth uncertainty of a vectorized equation by Monte Carlo.
+
+    `function` is called with keyword arguments: the log `curves` (each with
+    Gaussian noise of standard deviation `noise[name]`, a scalar or a curve)
+    and the `params`, either plain values or distributions as in
+    `volumetrics.DISTRIBUTIONS`. A parameter realization holds for the whole
+    well, while the log noise is drawn per sample. The `n` realizations are
+    evaluated as a (depth x n) array in blocks of depth that fit in
+    `max_bytes` (and `BLOCK_VALUES`, to stay in cache), and reduced to
+    percentiles with `np.partition`. The noise drawn for the first block is
+    reused by the next ones, which leaves the distribution at each depth
+    unchanged.
+
+    Returns the P90/P50/P10 curves (values exceeded with 90/50/10 %
+    probability) and the mean. Depths where only some realizations are
+    undefined use the defined ones.
+    """
+    curves = {name: np.asarray(c, dtype=float) for name, c in curves.items()}
+    if not curves:
+        raise ValueError("Give at least one log curve.")
+    size = np.broadcast_shapes(*(c.shape for c in curves.values()))[0]
+    noise = noise or {}
+    rng = np.random.default_rng(seed)
+    # Curvas com ruído e o resultado de cada bloco
+    width = max_bytes // (8 * n * (len(curves) + 1))
+    width = min(size, max(1, min(width, BLOCK_VALUES // n)))
+
+    # Realizações dos parâmetros, sorteadas uma vez para todo o poço
+    drawn = {}
+    for name, value in (params or {}).items():
+        if isinstance(value, dict):
+            drawn[name] = draw(value, n, rng)
+        else:
+            value = np.asarray(value, dtype=float)
+            drawn[name] = value if value.ndim == 0 else value[:, np.newaxis]
+    scores = {
+        name: rng.standard_normal((width, n))
+        for name in curves
+        if np.any(noise.get(name, 0.0))
+    }
+    noisy = {name: np.empty((width, n)) for name in scores}
+
+    names = list(PERCENTILES)
+    result = {name: np.empty(size) for name in (*names, "MEAN")}
+    for start in range(0, size, width):
+        block = slice(start, start + width)
+        rows = min(width, size - start)
+        inputs = {}
+        for name, curve in curves.items():
+            curve = curve[block, np.newaxis]
+            if name in scores:
+                std = np.asarray(noise[name], dtype=float)
+                std = std[block, np.newaxis] if std.ndim else std
+                curve = np.add(
+                    np.multiply(scores[name][:rows], std, out=noisy[name][:rows]),
+                    curve,
+                    out=noisy[name][:rows],
+                )
+            inputs[name] = curve
+        for name, value in drawn.items():
+            inputs[name] = value[block] if value.ndim == 2 else value
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            values = np.asarray(function(**inputs), dtype=float)
+        if values.shape != (rows, n):
+            values = np.broadcast_to(values, (rows, n)).copy()
+
+        mean = values.mean(axis=1)
+        # Só as profundidades de média indefinida podem ter NaN
+        suspect = np.flatnonzero(np.isnan(mean))
+        partial = suspect[~np.isnan(values[suspect]).all(axis=1)]
+        if partial.size:
+            # Poucas profundidades com realizações indefinidas: ignora os NaN
+            subset = values[partial]
+            fixed = _nan_percentiles(subset, list(PERCENTILES.values()))
+            values[partial] = 0
+        result["MEAN"][block] = mean
+        percentiles = partition_percentiles(values, list(PERCENTILES.values()))
+        for name, p in zip(names, percentiles):
+            result[name][block] = p
+        if partial.size:
+            for name, f in zip(names, fixed):
+                result[name][start + partial] = f
+            result["MEAN"][start + partial] = np.nanmean(subset, axis=1)
+    return result
@@ -0,0 +1,343 @@
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+# Barris por acre-pé e pés quadrados por acre
+OIL_FACTOR = 7758.0
+GAS_FACTOR = 43560.0
+
+OIL_INPUTS = ("area", "thickness", "phi", "sh", "rf", "boi")
+GAS_INPUTS = ("area", "thickness", "phi", "sh", "rf", "bgi")
+
+DISTRIBUTIONS = {
+    "constant": ("value",),
+    "normal": ("mean", "std"),
+    "lognormal": ("mean", "std"),
+    "triangular": ("low", "mode", "high"),
+    "uniform": ("low", "high"),
+    "empirical": ("sample",),
+}
+
+# Memória de trabalho máxima por bloco de realizações (bytes)
+MAX_BYTES = 64 * 2**20
+# Realizações por bloco: o bastante para amortizar as chamadas do numpy e
+# pouco o bastante para os temporários ficarem no cache
+BLOCK = 2**16
+# Níveis das tabelas de quantis das entradas e classes do histograma fino
+# de onde saem os percentis
+LEVELS = 2**16
+FINE_BINS = 2**16
+# Faixa de escores normais coberta pela tabela das entradas correlacionadas
+SCORE_RANGE = 8.0
+
+
+def _quantiles(dist, z=None, u=None):
+    """Values of `dist` at normal scores `z` or uniform probabilities `u`"""
+    kind = dist["type"]
+    if kind in ("normal", "lognormal"):
+        z = ndtri(u) if z is None else z
+        if kind == "normal":
+            return dist["mean"] + dist["std"] * z
+        # Parâmetros da normal subjacente a partir da média e desvio
+        sigma2 = np.log1p((dist["std"] / dist["mean"]) ** 2)
+        mu = np.log(dist["mean"]) - sigma2 / 2
+        return np.exp(mu + np.sqrt(sigma2) * z)
+
+    u = ndtr(z) if u is None else u
+    if kind == "uniform":
+        return dist["low"] + (dist["high"] - dist["low"]) * u
+    if kind == "triangular":
+        low, mode, high = dist["low"], dist["mode"], dist["high"]
+        width = high - low
+        split = (mode - low) / width
+        left = low + np.sqrt(u * width * (mode - low))
+        right = high - np.sqrt((1 - u) * width * (high - mode))
+        return np.where(u < split, left, right)
+    if kind == "empirical":
+        # Reamostragem dos valores medidos
+        sample = np.asarray(dist["sample"], dtype=float)
+        if sample.size == 0:
+            raise ValueError("The empirical distribution needs at least one value.")
+        # u pode chegar a 1.0 quando ndtr satura
+        index = np.minimum((u * sample.size).astype(np.intp), sample.size - 1)
+        return sample[index]
+    raise ValueError(f"Unknown distribution '{kind}'.")
+
+
+def _correlation_factor(names, correlations):
+    """Correlated inputs and the Cholesky factor of their correlation matrix"""
+    pairs = {
+        (a, b): rho
+        for (a, b), rho in (correlations or {}).items()
+        if a in names and b in names and a != b and rho
+    }
+    correlated = sorted({name for pair in pairs for name in pair}, key=names.index)
+    if not correlated:
+        return correlated, None
+    index = {name: i for i, name in enumerate(correlated)}
+    matrix = np.eye(len(correlated))
+    for (a, b), rho in pairs.items():
+        matrix[index[a], index[b]] = matrix[index[b], index[a]] = rho
+    try:
+        return correlated, np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        raise ValueError("The correlation matrix is not positive definite.")
+
+
+def _histogram_percentiles(counts, edges, below, above, q):
+    """Percentiles `q` (0-100) of values binned in `counts` over `edges`.
+
+    `below` and `above` hold, sorted, the values that fell outside the
+    edges. Ranks follow `np.percentile`; inside a bin the values are taken
+    as evenly spread.
+    """
+    cumulative = np.concatenate([[0], np.cumsum(counts)])
+    n = below.size + cumulative[-1] + above.size
+    result = []
+    for p in q:
+        rank = p / 100 * (n - 1)
+        if rank <= below.size - 1:
+            value = np.interp(rank, np.arange(below.size), below)
+        elif rank >= n - above.size:
+            value = np.interp(rank - (n - above.size), np.arange(above.size), above)
+        else:
+            value = np.interp(rank - below.size + 0.5, cumulative, edges)
+        result.append(float(value))
+    return result
+
+
+def _histogram_range(low, high):
+    """Range of a histogram, widened as `np.histogram` does for a single value"""
+    if low == high:
+        return low - 0.5, high + 0.5
+    return low, high
+
+
+def monte_carlo_volumes(
+    inputs,
+    n=1_000_000,
+    factor=OIL_FACTOR,
+    divisors=("boi",),
+    correlations=None,
+    bins=100,
+    seed=None,
+    max_bytes=MAX_BYTES,
+):
+    """Probabilistic volumetrics: factor * product(inputs) / product(divisors).
+
+    `inputs` maps each input name to a distribution, e.g.
+    `{"type": "triangular", "low": 0.1, "mode": 0.2, "high": 0.25}` (see
+    `DISTRIBUTIONS`). `correlations` maps pairs of names to their
+    correlation coefficient; correlated inputs are drawn from a Gaussian
+    copula (Cholesky factor of their correlation matrix applied to standard
+    normal scores), which preserves each input's own distribution. Each
+    input is drawn from a table of `LEVELS` of its quantiles, at the centres
+    of equal probability classes (of equal normal score classes within
+    +-`SCORE_RANGE` for correlated inputs), which moves its percentiles by
+    less than 1e-4 in probability.
+
+    The `n` realizations are drawn in blocks of at most `BLOCK` that fit in
+    `max_bytes` of working memory, and only their sum, extremes and a
+    histogram of `FINE_BINS` classes over the range of the first block are
+    kept (plus the few values outside that range), so memory does not grow
+    with `n`. The percentiles are interpolated in that histogram, within a
+    fraction of a class of the exact ones.
+
+    Returns the P90/P50/P10 (the values exceeded with 90/50/10 %
+    probability), the mean, the `bins` histogram and its exceedance curve.
+    """
+    n = int(n)
+    constant = float(factor)
+    sampled = {}
+    for name, dist in inputs.items():
+        if dist["type"] == "constant":
+            value = dist["value"]
+            constant = constant / value if name in divisors else constant * value
+        else:
+            sampled[name] = dist
+
+    names = list(sampled)
+    correlated, chol = _correlation_factor(names, correlations)
+    chunk = max(1, min(BLOCK, max_bytes // (8 * (len(correlated) + 4))))
+    rng = np.random.default_rng(seed)
+    # Divisores entram já invertidos, para que tudo seja multiplicação
+    probabilities = (np.arange(LEVELS) + 0.5) / LEVELS
+    normal = ndtri(probabilities)
+    step = 2 * SCORE_RANGE / LEVELS
+    scores = -SCORE_RANGE + step * (np.arange(LEVELS) + 0.5)
+    tables = {}
+    for name in names:
+        if name in correlated:
+            table = _quantiles(sampled[name], z=scores)
+        else:
+            table = _quantiles(sampled[name], u=probabilities)
+        tables[name] = 1 / table if name in divisors else table
+
+    buffer = np.empty(min(chunk, n))
+    values = np.empty_like(buffer)
+    fine = np.zeros(FINE_BINS, dtype=np.int64)
+    below, above = [], []
+    total, low, high = 0.0, np.inf, -np.inf
+    for start in range(0, n, chunk):
+        size = min(chunk, n - start)
+        block, scratch = buffer[:size], values[:size]
+        block.fill(constant)
+        index = {}
+        if correlated:
+            draws = rng.integers(0, LEVELS, (len(correlated), size), dtype=np.uint16)
+            z = chol @ normal[draws]
+            # Classe de cada escore na tabela das entradas correlacionadas
+            z += SCORE_RANGE
+            z /= step
+            np.clip(z, 0, LEVELS - 1, out=z)
+            index = dict(zip(correlated, z.astype(np.intp)))
+        for name, table in tables.items():
+            if name not in index:
+                index[name] = rng.integers(0, LEVELS, size, dtype=np.uint16)
+            table.take(index[name], out=scratch)
+            np.multiply(block, scratch, out=block)
+
+        total += block.sum()
+        block_low, block_high = block.min(), block.max()
+        low, high = min(low, block_low), max(high, block_high)
+        if start == 0:
+            # O histograma fino cobre a faixa do primeiro bloco
+            fine_low, fine_high = _histogram_range(low, high)
+            scale = FINE_BINS / (fine_high - fine_low)
+        np.subtract(block, fine_low, out=scratch)
+        np.multiply(scratch, scale, out=scratch)
+        if block_low < fine_low or block_high > fine_high:
+            # Raros valores fora da faixa: guardados à parte
+            outside = (block < fine_low) | (block > fine_high)
+            below.append(block[block < fine_low])
+            above.append(block[block > fine_high])
+            scratch = scratch[~outside]
+        np.minimum(scratch, FINE_BINS - 1, out=scratch)
+        fine += np.bincount(scratch.astype(np.intp), minlength=FINE_BINS)
+
+    fine_edges = np.linspace(fine_low, fine_high, FINE_BINS + 1)
+    below = np.sort(np.concatenate([[], *below]))
+    above = np.sort(np.concatenate([[], *above]))
+    p10, p50, p90 = _histogram_percentiles(fine, fine_edges, below, above, [10, 50, 90])
+
+    # Histograma exibido: classes finas e valores de fora reagrupados
+    edges = np.histogram_bin_edges([], bins=bins, range=_histogram_range(low, high))
+    centres = (fine_edges[:-1] + fine_edges[1:]) / 2
+    counts = np.histogram(centres, edges, weights=fine)[0]
+    counts = np.rint(counts).astype(np.int64)
+    counts += np.histogram(np.concatenate([below, above]), edges)[0]
+    exceedance = 1 - np.cumsum(counts) / n
+    return {
+        "P90": p10,
+        "P50": p50,
+        "P10": p90,
+        "mean": total / n,
+        "histogram": (counts, edges),
+        "exceedance": (edges[1:], exceedance),
+    }
+
+
+MAP_VOLUMES = ("AREA", "GRV", "NRV", "PV", "HCPV", "IN_PLACE")
+
+
+def load_grid(path):
+    """Open a .npy grid memory-mapped, so only the tiles in use are read"""
+    return np.load(path, mmap_mode="r")
+
+
+def rasterize_polygons(polygons, shape, x0=0.0, y0=0.0, dx=1.0, dy=1.0):
+    """Label grid (0 outside, i + 1 inside `polygons[i]`) for a map of `shape`.
+
+    Each polygon is a sequence of (x, y) vertices in the map coordinates of
+    a grid whose first node is at (`x0`, `y0`) with spacing `dx`, `dy`; row
+    index increases with y. Where polygons overlap the later one wins. Only
+    the nodes inside each polygon's bounding box are tested.
+    """
+    from matplotlib.path import Path
+
+    labels = np.zeros(shape, dtype=np.int32)
+    for label, vertices in enumerate(polygons, start=1):
+        vertices = np.asarray(vertices, dtype=float)
+        (xmin, ymin), (xmax, ymax) = vertices.min(axis=0), vertices.max(axis=0)
+        cols = slice(
+            max(int(np.floor((xmin - x0) / dx)), 0),
+            min(int(np.ceil((xmax - x0) / dx)) + 1, shape[1]),
+        )
+        rows = slice(
+            max(int(np.floor((ymin - y0) / dy)), 0),
+            min(int(np.ceil((ymax - y0) / dy)) + 1, shape[0]),
+        )
+        y, x = np.mgrid[rows, cols]
+        nodes = np.column_stack([x0 + x.ravel() * dx, y0 + y.ravel() * dy])
+        inside = Path(vertices).contains_points(nodes).reshape(x.shape)
+        labels[rows, cols][inside] = label
+    return labels
+
+
+def map_volumes(
+    thickness,
+    phi,
+    sw,
+    ntg=None,
+    cell_area=1.0,
+    fvf=1.0,
+    factor=OIL_FACTOR,
+    labels=None,
+    n_labels=None,
+    max_bytes=MAX_BYTES,
+    pvt=None,
+    pressure=None,
+    temperature=None,
+):
+    """In-place volumes from isochore, porosity, Sw and net-to-gross grids.
+
+    `thickness` (ft) and the property grids share one shape and may be
+    memory-mapped (see `load_grid`); they are reduced in blocks of rows that
+    fit in `max_bytes`. Nodes where any input is NaN are left out.
+    `cell_area` is in acres, so the volumes are in acre-ft and `IN_PLACE`
+    is `factor * HCPV / fvf` (7758 and Bo for STB of oil; 43560 and Bg for
+    SCF of gas). `labels` is an integer grid of segments (e.g. from
+    `rasterize_polygons`).
+
+    `fvf` is a single value or a grid. With a `PVTTable` as `pvt`, `fvf`
+    names its property instead ("BO" or "BG"), looked up at every node from
+    the `pressure` (psia) grid and the `temperature` (ºF) grid or value.
+
+    Returns a dict of arrays indexed by label (a single row without
+    `labels`) with the keys of `MAP_VOLUMES`.
+    """
+    rows, cols = thickness.shape
+    if pvt is not None and (pressure is None or temperature is None):
+        raise ValueError("The PVT table needs the pressure and temperature.")
+    if n_labels is None:
+        n_labels = 1 if labels is None else int(labels.max()) + 1
+    # Nós, GRV, NRV, PV, HCPV e volume in situ acumulados por segmento
+    totals = np.zeros((6, n_labels))
+    # Grades temporárias em float64 por bloco, mais as da consulta à tabela PVT
+    temporaries = 6 if pvt is None else 18
+    tile = max(1, max_bytes // (temporaries * 8 * cols))
+
+    for start in range(0, rows, tile):
+        block = slice(start, start + tile)
+        grv = np.array(thickness[block], dtype=float)
+        nrv = grv if ntg is None else grv * ntg[block]
+        pv = nrv * phi[block]
+        hcpv = pv * (1 - np.asarray(sw[block], dtype=float))
+        if pvt is not None:
+            t = temperature[block] if np.ndim(temperature) else temperature
+            fvf_block = pvt.query(pressure[block], t, [fvf])[fvf]
+        else:
+            fvf_block = fvf[block] if np.ndim(fvf) else fvf
+        in_place = hcpv / fvf_block
+        valid = ~np.isnan(in_place)
+        if labels is None:
+            index = np.zeros(np.count_nonzero(valid), dtype=np.intp)
+        else:
+            index = labels[block][valid]
+
+        totals[0] += np.bincount(index, minlength=n_labels)
+        for row, values in enumerate((grv, nrv, pv, hcpv, in_place), start=1):
+            totals[row] += np.bincount(index, values[valid], minlength=n_labels)
+
+    totals *= cell_area
+    totals[5] *= factor
+    return dict(zip(MAP_VOLUMES, totals))
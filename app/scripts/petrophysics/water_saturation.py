@@ -0,0 +1,115 @@
+import numpy as np
+
+from scripts.petrophysics.buffers import output_buffer, unwrap
+
+
+def _finish(sw, clip):
+    if clip:
+        np.clip(sw, 0, 1, out=sw)
+    return unwrap(sw)
+
+
+def archie(rt, phi, rw, a=1.0, m=2.0, n=2.0, clip=True, out=None):
+    """Estimate the water saturation using Archie (1942).
+
+    Every argument may be a scalar or a curve; zone parameters broadcast
+    against the log curves. The result is computed in place in `out` (a new
+    array if not given) and clipped to [0, 1] unless `clip` is False.
+    """
+    sw = output_buffer(out, rt, phi, rw, a, m, n)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        np.power(phi, m, out=sw)
+        np.multiply(sw, rt, out=sw)
+        np.divide(rw, sw, out=sw)
+        np.multiply(sw, a, out=sw)
+        np.power(sw, np.reciprocal(np.asarray(n, dtype=float)), out=sw)
+    return _finish(sw, clip)
+
+
+def dewan_compensated(rt, phi_s, rw, clip=True, out=None):
+    """Estimate the water saturation from sonic porosity (Dewan, 1983)"""
+    sw = output_buffer(out, rt, phi_s, rw)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(rw, rt, out=sw)
+        np.sqrt(sw, out=sw)
+        np.multiply(sw, 0.9, out=sw)
+        np.divide(sw, phi_s, out=sw)
+    return _finish(sw, clip)
+
+
+def dewan_dispersed_clay(rt, phi_s, rw, q, clip=True, out=None):
+    """Estimate the water saturation with the dispersed clay model (Dewan, 1983).
+
+    `q` is the fraction of the intergranular space filled with clay.
+    """
+    sw = output_buffer(out, rt, phi_s, rw, q)
+    half_q = np.multiply(q, 0.5)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # sqrt(x + (q/2)^2) = hypot(sqrt(x), q/2)
+        np.square(phi_s, out=sw)
+        np.multiply(sw, rt, out=sw)
+        np.divide(rw, sw, out=sw)
+        np.multiply(sw, 0.8, out=sw)
+        np.sqrt(sw, out=sw)
+        np.hypot(sw, half_q, out=sw)
+        np.subtract(sw, half_q, out=sw)
+        np.divide(sw, np.subtract(1, q), out=sw)
+    return _finish(sw, clip)
+
+
+def simandoux(rt, phi, rw, vsh, rsh, clip=True, out=None):
+    """Estimate the water saturation in shaly sands using Simandoux (1963)"""
+    sw = output_buffer(out, rt, phi, rw, vsh, rsh)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shale = np.divide(vsh, rsh)
+        np.square(phi, out=sw)
+        np.multiply(sw, 5, out=sw)
+        np.divide(sw, rt, out=sw)
+        np.divide(sw, rw, out=sw)
+        np.sqrt(sw, out=sw)
+        np.hypot(sw, shale, out=sw)
+        np.subtract(sw, shale, out=sw)
+        np.multiply(sw, 0.4, out=sw)
+        np.multiply(sw, rw, out=sw)
+        np.divide(sw, phi, out=sw)
+        np.divide(sw, phi, out=sw)
+    return _finish(sw, clip)
+
+
+def fertl(rt, phi, rw, vsh, a=0.25, clip=True, out=None):
+    """Estimate the water saturation in shaly sands using Fertl (1975).
+
+    `a` is 0.25 at the Gulf Coast and 0.35 at the Rocky Mountains.
+    """
+    sw = output_buffer(out, rt, phi, rw, vsh, a)
+    shale = np.multiply(a, vsh)
+    shale *= 0.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(rw, rt, out=sw)
+        np.sqrt(sw, out=sw)
+        np.hypot(sw, shale, out=sw)
+        np.subtract(sw, shale, out=sw)
+        np.divide(sw, phi, out=sw)
+    return _finish(sw, clip)
+
+
+def schlumberger(rt, phi, rw, vsh, rsh, clip=True, out=None):
+    """Estimate the water saturation in shaly sands using Schlumberger (1975)"""
+    sw = output_buffer(out, rt, phi, rw, vsh, rsh)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shale = np.divide(vsh, rsh)
+        clean = np.subtract(1, vsh)
+        np.square(phi, out=sw)
+        np.divide(sw, 0.2, out=sw)
+        np.divide(sw, rw, out=sw)
+        np.divide(sw, rt, out=sw)
+        np.divide(sw, clean, out=sw)
+        np.sqrt(sw, out=sw)
+        np.hypot(sw, shale, out=sw)
+        np.subtract(sw, shale, out=sw)
+        np.multiply(sw, 0.4, out=sw)
+        np.multiply(sw, rw, out=sw)
+        np.multiply(sw, clean, out=sw)
+        np.divide(sw, phi, out=sw)
+        np.divide(sw, phi, out=sw)
+    return _finish(sw, clip)
@@ -0,0 +1,216 @@
+import io
+import os
+import warnings
+
+import numpy as np
+
+# Tamanho dos blocos lidos da seção ~A (bytes)
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# Mnemônicos usuais de cada tipo de curva, em ordem de preferência
+CURVE_ALIASES = {
+    # Curva normalizada entre poços tem preferência sobre a original
+    "GR": ("GR_NORM", "GR", "SGR", "GRC", "CGR"),
+    "RHOB": ("RHOB", "RHOZ", "DEN", "ZDEN"),
+    "NPHI": ("NPHI", "TNPH", "NEU", "CNL"),
+    "DT": ("DT", "DTC", "AC", "DTCO"),
+    "PEF": ("PEF", "PE", "PEFZ", "PEF8"),
+    "RT": ("RT", "ILD", "LLD", "RD", "AT90", "RESD"),
+    "SP": ("SP", "SSP"),
+}
+
+_DATA_SECTIONS = ("~A", "~LOG_DATA")
+_CURVE_SECTIONS = ("~C", "~LOG_DEFINITION")
+
+
+def _parse_header_line(line):
+    """Split a `MNEM.UNIT  DATA : DESCRIPTION` header line into its fields"""
+    mnemonic, _, rest = line.partition(".")
+    if rest[:1].isspace() or not rest:
+        unit = ""
+    else:
+        unit, _, rest = rest.partition(" ")
+    if ":" in rest:
+        value, description = rest.rsplit(":", 1)
+    else:
+        value, description = rest, ""
+    # LAS 3.0: remove format ({F}) and association (|) fields from the description
+    description = description.split("{")[0].split("|")[0]
+    return mnemonic.strip(), unit.strip(), value.strip(), description.strip()
+
+
+def _open(source):
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb"), True
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source), True
+    return source, False
+
+
+def _remaining_bytes(f):
+    try:
+        position = f.tell()
+        end = f.seek(0, io.SEEK_END)
+        f.seek(position)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return end - position
+
+
+def _parse_values(block):
+    if not block or block.isspace():
+        return np.empty(0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(block, dtype=np.float64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            raise ValueError("The ~A section contains non-numeric values.") from None
+
+
+def _read_header(f):
+    """Read every section before ~A, leaving `f` at the first data line"""
+    sections = {"version": {}, "well": {}, "curves": {}, "parameters": {}}
+    current = None
+    while True:
+        raw = f.readline()
+        if not raw:
+            raise ValueError("The file has no ~A (ASCII log data) section.")
+        line = raw.decode("latin-1").strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("~"):
+            name = line.split()[0].split("|")[0].upper()
+            if name.startswith(_DATA_SECTIONS):
+                return sections
+            if name.startswith("~V"):
+                current = sections["version"]
+            elif name.startswith("~W"):
+                current = sections["well"]
+            elif name.startswith(_CURVE_SECTIONS):
+                current = sections["curves"]
+            elif name.startswith(("~P", "~LOG_PARAMETER")):
+                current = sections["parameters"]
+            else:
+                current = None
+            continue
+        if current is None:
+            continue
+        mnemonic, unit, value, description = _parse_header_line(line)
+        if current is sections["curves"]:
+            # Curvas repetidas recebem sufixo para não sobrescrever a anterior
+            key = mnemonic
+            while key in current:
+                key += "_"
+            current[key] = {"unit": unit, "description": description}
+        else:
+            current[mnemonic] = {
+                "unit": unit,
+                "value": value,
+                "description": description,
+            }
+
+
+def _strip_comments(block):
+    lines = block.split(b"\n")
+    return b"\n".join(line for line in lines if not line.lstrip().startswith(b"#"))
+
+
+def read_las(source, dtype=np.float64, chunk_size=CHUNK_SIZE):
+    """Read a LAS 2.0/3.0 file streaming the ~A section into NumPy columns.
+
+    `source` can be a path, raw bytes or any binary file object (e.g. a
+    Streamlit UploadedFile). The data section is read in `chunk_size` byte
+    blocks and parsed straight into one preallocated (n_curves, n_samples)
+    array of `dtype`; NULL values become NaN. Wrapped files are supported
+    because values are consumed as a flat stream.
+
+    Returns a dict with the `version`, `well`, `curves` and `parameters`
+    header sections and `data`, mapping each curve mnemonic to its column.
+    """
+    f, owned = _open(source)
+    try:
+        header = _read_header(f)
+        mnemonics = list(header["curves"])
+        n_curves = len(mnemonics)
+        if n_curves == 0:
+            raise ValueError("The file has no curve definitions (~C section).")
+
+        null = header["well"].get("NULL", {}).get("value")
+        null = float(null) if null else None
+        delimiter = header["version"].get("DLM", {}).get("value", "").upper()
+        delimiter = {"COMMA": b",", "TAB": b"\t"}.get(delimiter)
+
+        remaining = _remaining_bytes(f)
+        columns = None
+        n_rows = 0
+        leftover = np.empty(0)
+        tail = b""
+        finished = False
+
+        while not finished:
+            block = f.read(chunk_size)
+            if not block:
+                block, tail, finished = tail, b"", True
+            else:
+                block = tail + block
+                cut = block.rfind(b"\n") + 1
+                if cut:
+                    block, tail = block[:cut], block[cut:]
+                else:
+                    tail, block = block, b""
+
+            # LAS 3.0: outra seção pode começar depois dos dados
+            section = block.find(b"~")
+            if section != -1:
+                block, finished = block[:section], True
+            if b"#" in block:
+                block = _strip_comments(block)
+            if delimiter is not None:
+                block = block.replace(delimiter, b" ")
+
+            values = _parse_values(block)
+            if leftover.size:
+                values = np.concatenate((leftover, values))
+            rows = values.size // n_curves
+            leftover = values[rows * n_curves :]
+            if rows == 0:
+                continue
+
+            if columns is None:
+                # Estimativa do número de amostras a partir do primeiro bloco
+                estimate = rows
+                if remaining:
+                    estimate = int(remaining / max(len(block), 1) * rows * 1.05) + 1
+                columns = np.empty((n_curves, max(estimate, rows)), dtype=dtype)
+            elif n_rows + rows > columns.shape[1]:
+                grown = np.empty(
+                    (n_curves, max(n_rows + rows, int(columns.shape[1] * 1.5))),
+                    dtype=dtype,
+                )
+                grown[:, :n_rows] = columns[:, :n_rows]
+                columns = grown
+
+            chunk = values[: rows * n_curves].reshape(rows, n_curves)
+            if null is not None:
+                chunk[chunk == null] = np.nan
+            columns[:, n_rows : n_rows + rows] = chunk.T
+            n_rows += rows
+    finally:
+        if owned:
+            f.close()
+
+    if columns is None:
+        columns = np.empty((n_curves, 0), dtype=dtype)
+
+    header["data"] = dict(zip(mnemonics, columns[:, :n_rows]))
+    return header
+
+
+def find_curve(mnemonics, kind):
+    """First mnemonic in `mnemonics` matching the aliases of a curve `kind`"""
+    available = {m.upper(): m for m in mnemonics}
+    for alias in CURVE_ALIASES.get(kind, (kind,)):
+        if alias in available:
+            return available[alias]
+    return None
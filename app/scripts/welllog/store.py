@@ -0,0 +1,174 @@
+import json
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+# Raiz dos dados do app (relativa à raiz do projeto, ou GEOFISICA_DATA_ROOT);
+# os diretórios escolhidos na interface ficam sempre dentro dela
+DATA_ROOT = Path(os.environ.get("GEOFISICA_DATA_ROOT", "data"))
+# Diretório padrão do repositório de poços
+DEFAULT_STORE = DATA_ROOT / "wells"
+
+_HEADER_SECTIONS = ("version", "well", "curves", "parameters")
+
+
+def _well_name(name):
+    """Turn a well name into a safe file stem"""
+    stem = re.sub(r"[^\w.-]+", "_", str(name)).strip("._")
+    if not stem:
+        raise ValueError(f"Invalid well name: {name!r}")
+    return stem
+
+
+def data_directory(path, root=DATA_ROOT):
+    """Resolve `path`, relative to `root`, to a directory inside `root`.
+
+    Raises ValueError when it leads outside the root (an absolute path,
+    "..", or a symbolic link).
+    """
+    root = Path(root).resolve()
+    directory = (root / path).resolve()
+    if not directory.is_relative_to(root):
+        raise ValueError(f"Choose a directory inside {root}.")
+    return directory
+
+
+def _paths(store, name):
+    stem = _well_name(name)
+    store = Path(store)
+    return store / f"{stem}.arrow", store / f"{stem}.json"
+
+
+def _write_atomic(path, write):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_frame(data_path, df):
+    # Sem compressão para que o arquivo possa ser mapeado em memória
+    _write_atomic(data_path, lambda p: df.write_ipc(p, compression="uncompressed"))
+
+
+def _write_meta(meta_path, meta):
+    _write_atomic(
+        meta_path,
+        lambda p: p.write_text(json.dumps(meta, indent=2), encoding="utf-8"),
+    )
+
+
+def list_wells(store=DEFAULT_STORE):
+    """Names of every well saved in `store`"""
+    store = Path(store)
+    if not store.is_dir():
+        return []
+    return sorted(p.stem for p in store.glob("*.arrow"))
+
+
+def well_info(store, name):
+    """Header sections, depth curve and depth range of a stored well"""
+    _, meta_path = _paths(store, name)
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Well {name!r} not found in {store}.")
+    return json.loads(meta_path.read_text(encoding="utf-8"))
+
+
+def well_version(store, name):
+    """Identity of the stored data of a well: file path and modification time.
+
+    Changes whenever the well is written again, so it can key caches of
+    results computed from the well's curves.
+    """
+    data_path, _ = _paths(store, name)
+    return f"{data_path.resolve()}@{data_path.stat().st_mtime_ns}"
+
+
+def write_well(store, name, las):
+    """Save a well (as returned by `las.read_las`) to the columnar store.
+
+    Curves are written once as an uncompressed Arrow IPC file, which is
+    memory-mapped when read back, and the header goes to a JSON sidecar.
+    The first curve is taken as the depth index.
+    """
+    data_path, meta_path = _paths(store, name)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = las["data"]
+    depth_curve = next(iter(data))
+    depth = data[depth_curve]
+    # Sem profundidade definida o intervalo fica vazio (None)
+    defined = bool(np.isfinite(depth).any())
+    meta = {section: las.get(section, {}) for section in _HEADER_SECTIONS}
+    meta.update(
+        name=str(name),
+        depth_curve=depth_curve,
+        n_samples=int(depth.size),
+        top=float(np.nanmin(depth)) if defined else None,
+        base=float(np.nanmax(depth)) if defined else None,
+    )
+
+    df = pl.DataFrame({mnemonic: np.asarray(c) for mnemonic, c in data.items()})
+    _write_frame(data_path, df)
+    _write_meta(meta_path, meta)
+    return data_path
+
+
+def append_curves(store, name, curves, units=None):
+    """Add (or replace) computed curves of a stored well"""
+    data_path, meta_path = _paths(store, name)
+    meta = well_info(store, name)
+    n_samples = meta["n_samples"]
+    for mnemonic, curve in curves.items():
+        if np.shape(curve) != (n_samples,):
+            raise ValueError(
+                f"Curve {mnemonic!r} must have {n_samples} samples, "
+                f"got {np.shape(curve)}."
+            )
+
+    df = pl.read_ipc(data_path).with_columns(
+        pl.Series(mnemonic, np.asarray(curve)) for mnemonic, curve in curves.items()
+    )
+    _write_frame(data_path, df)
+
+    units = units or {}
+    for mnemonic in curves:
+        meta["curves"][mnemonic] = {
+            "unit": units.get(mnemonic, ""),
+            "description": "Computed curve",
+        }
+    _write_meta(meta_path, meta)
+
+
+def read_well(store, name, curves=None, top=None, base=None):
+    """Open a stored well reading only the requested curves and depth range.
+
+    The Arrow file is scanned lazily (memory-mapped by Polars) with the
+    column selection and the depth filter pushed down, so only the selected
+    curves are touched. Returns the same dict layout as `las.read_las`; the
+    depth curve is always included in `data`.
+    """
+    data_path, _ = _paths(store, name)
+    meta = well_info(store, name)
+    depth_curve = meta["depth_curve"]
+
+    columns = list(meta["curves"]) if curves is None else list(curves)
+    if depth_curve not in columns:
+        columns.insert(0, depth_curve)
+    missing = set(columns) - set(meta["curves"])
+    if missing:
+        raise KeyError(f"Curves not found in well {name!r}: {sorted(missing)}")
+
+    lf = pl.scan_ipc(data_path).select(columns)
+    if top is not None:
+        lf = lf.filter(pl.col(depth_curve) >= top)
+    if base is not None:
+        lf = lf.filter(pl.col(depth_curve) <= base)
+    df = lf.collect()
+
+    well = {section: meta[section] for section in _HEADER_SECTIONS}
+    well["curves"] = {c: meta["curves"][c] for c in columns}
+    well["data"] = {c: df.get_column(c).to_numpy() for c in columns}
+    return well
@@ -0,0 +1,72 @@
+import numpy as np
+
+
+def parse_tops(text):
+    """Formation tops from `NAME, DEPTH` lines (a bare depth is named by its row).
+
+    Blank lines, `#` comments and a header line without a numeric depth are
+    skipped. Returns a list of (name, depth) pairs in the order given.
+    """
+    tops = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = [
+            f.strip() for f in line.replace(";", ",").replace("\t", ",").split(",")
+        ]
+        try:
+            depth = float(fields[-1])
+        except ValueError:
+            if not tops:
+                continue  # cabeçalho
+            raise ValueError(f"Invalid formation top: {line!r}") from None
+        name = fields[0] if len(fields) > 1 else f"Zone {len(tops) + 1}"
+        tops.append((name, depth))
+    return tops
+
+
+class ZoneIndex:
+    """Formation tops indexed against the depth curve of a well.
+
+    Each zone goes from its top down to the next one. `index` holds the zone
+    of every sample (-1 above the first top), found once with
+    `np.searchsorted`. Per-zone parameters are broadcast to full-length
+    curves on demand and cached; a cached curve is only rebuilt when its
+    zone values or default change, and new tops need a new index.
+    """
+
+    def __init__(self, depth, tops):
+        tops = sorted(tops, key=lambda top: top[1])
+        self.names = tuple(str(name) for name, _ in tops)
+        self.tops = np.array([depth for _, depth in tops], dtype=float)
+        if np.any(np.diff(self.tops) == 0):
+            raise ValueError("Two formation tops are at the same depth.")
+        self.depth = np.asarray(depth, dtype=float)
+        self.index = np.searchsorted(self.tops, self.depth, side="right") - 1
+        # Primeira amostra de cada zona (fronteiras para np.add.reduceat)
+        self.starts = np.searchsorted(self.depth, self.tops)
+        self._parameters = {}
+        self._curves = {}
+
+    @property
+    def n_zones(self):
+        return self.tops.size
+
+    def set_parameter(self, name, values, default=np.nan):
+        """Set the zone values of a parameter (`default` above the first top)"""
+        values = np.broadcast_to(np.asarray(values, dtype=float), (self.n_zones,))
+        table = np.append(values, float(default))
+        cached = self._parameters.get(name)
+        if cached is None or not np.array_equal(cached, table, equal_nan=True):
+            self._parameters[name] = table
+            self._curves.pop(name, None)
+
+    def parameter(self, name):
+        """Full-length, read-only curve of a parameter along the depth curve"""
+        if name not in self._curves:
+            # O índice -1 (acima do primeiro topo) pega o valor padrão no fim
+            curve = self._parameters[name][self.index]
+            curve.setflags(write=False)
+            self._curves[name] = curve
+        return self._curves[name]
@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from scripts.petrophysics.batch import evaluate_well, run_batch  # noqa: E402
+from scripts.welllog.store import list_wells, read_well  # noqa: E402
+
+HEADER = """~V
+VERS. 2.0 :
+WRAP. NO :
+~W
+NULL. -999.25 :
+~C
+DEPT.M :
+GR.API :
+RHOB.G/C3 :
+NPHI.V/V :
+ILD.OHMM :
+~A
+"""
+
+
+def write_las(path, n=200):
+    depth = 2000.0 + 0.5 * np.arange(n)
+    gr = np.where(np.arange(n) < n // 2, 30.0, 110.0)
+    rhob = np.full(n, 2.3)
+    nphi = np.full(n, 0.2)
+    ild = np.where(np.arange(n) < n // 2, 20.0, 2.0)
+    with open(path, "w") as f:
+        f.write(HEADER)
+        np.savetxt(f, np.column_stack([depth, gr, rhob, nphi, ild]), fmt="%.4f")
+
+
+def test_evaluate_well_flags_clean_reservoir_as_pay():
+    data = {
+        "DEPT": np.array([1000.0, 1000.5, 1001.0, 1001.5]),
+        "GR": np.array([25.0, 25.0, 115.0, 115.0]),
+        "RHOB": np.full(4, 2.3),
+        "NPHI": np.full(4, 0.2),
+        "RT": np.array([30.0, 30.0, 1.0, 1.0]),
+    }
+    curves, summary = evaluate_well(data)
+
+    np.testing.assert_array_equal(curves["PAY"], [1.0, 1.0, 0.0, 0.0])
+    assert summary["net_pay"] == 1.0
+    assert summary["net_to_gross"] == 0.5
+
+
+def test_evaluate_well_takes_rw_to_formation_temperature():
+    data = {
+        "DEPT": np.array([0.0, 5000.0, 10000.0]),
+        "GR": np.full(3, 25.0),
+        "RHOB": np.full(3, 2.3),
+        "NPHI": np.full(3, 0.2),
+        "RT": np.full(3, 30.0),
+    }
+    params = {"bht": 225.0, "bht_depth": 10000.0, "rw_temp": 75.0}
+    curves, _ = evaluate_well(data, params)
+    reference, _ = evaluate_well(data)
+
+    # Gradiente de 15 ºF/1000 ft: Rw cai com Arps e Sw com a raiz de Rw
+    tf = np.array([75.0, 150.0, 225.0])
+    ratio = np.sqrt((75.0 + 6.77) / (tf + 6.77))
+    np.testing.assert_allclose(curves["SW"], reference["SW"] * ratio)
+
+
+def test_evaluate_well_removes_shale_porosity():
+    data = {
+        "DEPT": np.array([1000.0, 1000.5, 1001.0]),
+        "GR": np.array([20.0, 70.0, 120.0]),
+        "RHOB": np.full(3, 2.3),
+        "NPHI": np.full(3, 0.2),
+        "RT": np.full(3, 10.0),
+    }
+    curves, _ = evaluate_well(data, {"phi_shale": 0.12})
+    total, _ = evaluate_well(data, {"phi_shale": 0.0})
+
+    # PHIE = PHIT - Vsh * phi_shale; sem argila as duas coincidem
+    np.testing.assert_allclose(total["PHIE"] - curves["PHIE"], 0.12 * curves["VSH"])
+    assert curves["VSH"][0] == 0.0 and curves["VSH"][-1] > 0.9
+
+
+def test_run_batch_writes_every_well_to_the_store(tmp_path):
+    source = tmp_path / "las"
+    source.mkdir()
+    for name in ("A-1", "B-2"):
+        write_las(source / f"{name}.las")
+    (source / "broken.las").write_text("~V\n~C\nDEPT.M :\n~A\n1\n")
+    store = tmp_path / "store"
+
+    progress = []
+    results = run_batch(
+        source,
+        store,
+        max_workers=2,
+        progress=lambda done, total, result: progress.append((done, total)),
+    )
+
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+    errors = [r["well"] for r in results if "error" in r]
+    assert errors == ["broken"]
+    assert list_wells(store) == ["A-1", "B-2"]
+
+    well = read_well(store, "A-1", curves=["PAY"])
+    assert well["data"]["PAY"].sum() == 100
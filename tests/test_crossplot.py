@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from scripts.petrophysics import crossplot  # noqa: E402
+
+
+def test_bin_points_counts_every_valid_point():
+    x = np.array([0.0, 0.5, 1.0, 1.0, np.nan, 2.0])
+    y = np.array([0.0, 0.5, 1.0, 1.0, 1.0, 0.0])
+    counts, xedges, yedges = crossplot.bin_points(x, y, bins=2, extent=(0, 1, 0, 1))
+    # O ponto em x = 2 fica fora da extensão e o NaN é ignorado
+    np.testing.assert_array_equal(counts, [[1, 0], [0, 3]])
+    np.testing.assert_allclose(xedges, [0, 0.5, 1])
+
+
+def test_zoom_reuses_fine_grid_until_too_coarse():
+    rng = np.random.default_rng(4)
+    x, y = rng.random(200000), rng.random(200000)
+    fine = crossplot.bin_points(x, y, 400, extent=(0, 1, 0, 1))
+
+    extent = (0.25, 0.75, 0.5, 1.0)
+    counts, xedges, yedges = crossplot.zoom_bins(*fine, extent, bins=100)
+    assert counts.shape == (100, 100)
+    assert xedges[[0, -1]].tolist() == [0.25, 0.75]
+    # Mesmo resultado que binar de novo os pontos da janela
+    direct, _, _ = crossplot.bin_points(x, y, 100, extent=extent)
+    assert counts.sum() == direct.sum()
+    # Só amostras exatamente sobre as bordas podem trocar de classe
+    assert np.abs(counts - direct).sum() <= 10
+
+    assert crossplot.zoom_bins(*fine, (0.1, 0.2, 0.1, 0.2), bins=100) is None
+
+
+def test_mn_curves_for_clean_sandstone():
+    # Arenito limpo (quartzo, vf = 18000 ft/s): M = 0.810 e N = 0.628
+    m, n = crossplot.mn_curves(55.5, 2.65, -0.035)
+    assert m == pytest.approx(0.810, abs=0.01)
+    assert n == pytest.approx(0.627, abs=0.01)
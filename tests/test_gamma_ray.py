@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.gamma_ray as gamma_ray  # noqa: E402
+from scripts.welllog import store  # noqa: E402
+
+
+def test_zone_baselines_match_percentiles_when_streamed():
+    rng = np.random.default_rng(6)
+    gr = np.concatenate([rng.normal(40, 10, 20000), rng.normal(90, 15, 20000)])
+    zones = np.repeat([0, 1, 2], [20000, 19000, 1000])
+    zones[-1000:] = -1  # fora de qualquer zona
+
+    clean, shale = gamma_ray.pick_baselines(gr, zones, n_zones=3)
+    for zone in (0, 1):
+        expected = np.percentile(gr[zones == zone], [5, 95])
+        np.testing.assert_allclose([clean[zone], shale[zone]], expected, atol=0.1)
+    assert np.isnan(clean[2]) and np.isnan(shale[2])
+
+    counts = None
+    for start in range(0, gr.size, 7000):
+        block = slice(start, start + 7000)
+        counts = gamma_ray.zone_histograms(gr[block], zones[block], 3, counts=counts)
+    streamed = gamma_ray.histogram_quantiles(counts, [5, 95])
+    np.testing.assert_allclose(streamed[:2], np.column_stack([clean, shale])[:2])
+
+
+def test_rolling_baselines_follow_the_log():
+    gr = np.where(np.arange(3000) < 1500, 30.0, 100.0)
+    gr[10:20] = np.nan
+    clean, shale = gamma_ray.rolling_baselines(gr, 101, low=5, high=95)
+    assert clean.shape == gr.shape and not np.isnan(clean).any()
+    assert clean[0] == shale[0] == 30.0
+    assert clean[-1] == shale[-1] == 100.0
+    assert clean[1470] == 30.0 and shale[1470] == 100.0
+
+
+def test_normalization_maps_percentiles_onto_type_well():
+    rng = np.random.default_rng(7)
+    reference = gamma_ray.zone_histograms(rng.normal(70, 20, 50000))[0]
+    gr = rng.normal(100, 30, 50000)
+    counts = gamma_ray.zone_histograms(gr)[0]
+
+    for method in gamma_ray.NORMALIZATION_METHODS:
+        x, y = gamma_ray.normalization_map(counts, reference, method)
+        normalized = gamma_ray.apply_normalization(gr, x, y)
+        np.testing.assert_allclose(
+            np.percentile(normalized, [5, 50, 95]),
+            [70 - 1.645 * 20, 70, 70 + 1.645 * 20],
+            atol=1.0,
+        )
+
+    with pytest.raises(ValueError):
+        gamma_ray.normalization_map(np.zeros_like(counts), reference)
+
+
+def test_normalize_wells_writes_curve_to_store(tmp_path):
+    depth = 1000.0 + 0.5 * np.arange(2000)
+    for i, name in enumerate(("TYPE", "A-1", "A-2")):
+        gr = np.linspace(20.0, 120.0, depth.size) * (1 + 0.2 * i) + 5 * i
+        store.write_well(
+            tmp_path,
+            name,
+            {
+                "well": {},
+                "curves": {
+                    "DEPT": {"unit": "M", "description": ""},
+                    "GR": {"unit": "API", "description": ""},
+                },
+                "data": {"DEPT": depth, "GR": gr},
+            },
+        )
+
+    results = gamma_ray.normalize_wells(tmp_path, "TYPE", ["A-1", "A-2"], max_workers=2)
+    assert sorted(r["well"] for r in results) == ["A-1", "A-2"]
+    assert all("error" not in r for r in results)
+    for name in ("A-1", "A-2"):
+        data = store.read_well(tmp_path, name)["data"]
+        np.testing.assert_allclose(
+            data[gamma_ray.NORMALIZED_GR],
+            np.linspace(20.0, 120.0, depth.size),
+            atol=0.1,
+        )
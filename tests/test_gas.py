@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.gas as gas  # noqa: E402
+
+
+@pytest.mark.parametrize("method", gas.Z_METHODS)
+def test_z_factor_matches_standing_katz_chart(method):
+    ppc, tpc = gas.pseudo_critical(0.7)
+    # (Ppr, Tpr, Z) lidos do gráfico de Standing & Katz
+    chart = np.array([[1.0, 1.5, 0.91], [2.0, 1.5, 0.82], [4.0, 2.0, 0.94]])
+    p = chart[:, 0] * ppc
+    t = chart[:, 1] * tpc - gas.RANKINE
+
+    z = gas.z_factor(p, t, 0.7, method)
+    np.testing.assert_allclose(z, chart[:, 2], atol=0.01)
+    assert gas.z_factor(p[1], t[1], 0.7, method) == pytest.approx(z[1])
+
+
+def test_z_factor_broadcasts_and_depletes():
+    p = np.linspace(500.0, 8000.0, 200)[:, None]
+    gravity = np.array([0.6, 0.8, 1.0])
+    dak = gas.z_factor(p, 180.0, gravity)
+    hy = gas.z_factor(p, 180.0, gravity, "HALL_YARBOROUGH")
+    assert dak.shape == (200, 3)
+    np.testing.assert_allclose(dak, hy, atol=0.02)
+
+    path = gas.depletion_path(5000.0, 500.0, 200.0, 0.65, n=20)
+    assert path["RF"][0] == 0 and np.all(np.diff(path["RF"]) > 0)
+    np.testing.assert_allclose(
+        path["BG"], 0.02827 * path["Z"] * (200.0 + gas.RANKINE) / path["P"]
+    )
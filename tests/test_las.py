@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from scripts.welllog.las import read_las  # noqa: E402
+
+LAS_20 = b"""~VERSION INFORMATION
+ VERS.                 2.0 :   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                 YES :   MULTIPLE LINES PER DEPTH STEP
+~WELL INFORMATION
+ NULL.           -999.2500 :   NULL VALUE
+ WELL.     ANY ET AL 12-34 :   WELL
+~CURVE INFORMATION
+ DEPT.M                    :   DEPTH
+ RHOB.G/C3                 :   BULK DENSITY
+ NPHI.V/V                  :   NEUTRON POROSITY
+~A  DEPTH     RHOB   NPHI
+1670.000
+ 2.550 0.450
+1670.125
+ -999.2500 0.380
+1670.250
+ 2.400 0.300
+"""
+
+LAS_30 = b"""~Version
+VERS . 3.0 : CWLS LOG ASCII STANDARD - VERSION 3.0
+DLM . COMMA : DELIMITING CHARACTER
+~Well
+NULL . -999.25 : NULL VALUE
+~Log_Definition
+DEPT .M : Depth {F}
+GR .API : Gamma Ray {F}
+~Log_Data | Log_Definition
+# depth, gr
+1000.0,50.0
+1000.5,-999.25
+~Core_Definition
+CDEP .M : Core depth {F}
+~Core_Data | Core_Definition
+999.0
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 20])
+def test_read_las_wrapped_with_nulls(chunk_size):
+    las = read_las(LAS_20, chunk_size=chunk_size)
+
+    assert las["well"]["WELL"]["value"] == "ANY ET AL 12-34"
+    assert las["curves"]["RHOB"]["unit"] == "G/C3"
+    np.testing.assert_allclose(las["data"]["DEPT"], [1670.0, 1670.125, 1670.25])
+    np.testing.assert_allclose(las["data"]["RHOB"], [2.55, np.nan, 2.4])
+    np.testing.assert_allclose(las["data"]["NPHI"], [0.45, 0.38, 0.3])
+
+
+def test_read_las_30_comma_delimited_float32():
+    las = read_las(LAS_30, dtype=np.float32)
+
+    assert list(las["data"]) == ["DEPT", "GR"]
+    assert las["data"]["GR"].dtype == np.float32
+    np.testing.assert_allclose(las["data"]["GR"], [50.0, np.nan])
+
+
+def test_read_las_rejects_text_values():
+    with pytest.raises(ValueError):
+        read_las(b"~V\n~C\nDEPT.M :\nGR.API :\n~A\n1000.0 abc\n")
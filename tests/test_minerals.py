@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.minerals as minerals  # noqa: E402
+
+COMPONENTS = list(minerals.ENDPOINTS)
+RESPONSE = np.array(
+    [[minerals.ENDPOINTS[c][log] for c in COMPONENTS] for log in minerals.MINERAL_LOGS]
+)
+WEIGHTS = np.array([1 / minerals.LOG_UNCERTAINTY[log] for log in minerals.MINERAL_LOGS])
+
+
+def test_project_simplex():
+    v = np.array([[0.2, 0.3, 0.5], [2.0, 0.0, 0.0], [0.5, 0.5, 0.5], [-1, 3, 0.2]])
+    p = minerals.project_simplex(v)
+    np.testing.assert_allclose(p.sum(axis=1), 1)
+    assert p.min() >= 0
+    # Pontos do simplex não mudam
+    np.testing.assert_allclose(p[0], v[0])
+    np.testing.assert_allclose(p[1], [1, 0, 0])
+    np.testing.assert_allclose(p[2], [1 / 3, 1 / 3, 1 / 3])
+
+
+def test_solve_minerals_recovers_volumes():
+    rng = np.random.default_rng(3)
+    volumes = rng.dirichlet(np.ones(5), 500)
+    logs = dict(zip(minerals.MINERAL_LOGS, (volumes @ RESPONSE.T).T))
+    result = minerals.solve_minerals(logs)
+    solved = np.column_stack([result[c] for c in COMPONENTS])
+    np.testing.assert_allclose(solved, volumes, atol=1e-9)
+    np.testing.assert_allclose(result["MISFIT"], 0, atol=1e-9)
+
+
+def test_solve_minerals_is_the_constrained_optimum():
+    rng = np.random.default_rng(4)
+    volumes = rng.dirichlet(np.full(5, 0.5), 200)
+    noise = rng.normal(size=(200, 4)) * [0.03, 0.03, 3.0, 0.5]
+    logs = volumes @ RESPONSE.T + noise
+    logs[::7, 2] = np.nan
+    result = minerals.solve_minerals(dict(zip(minerals.MINERAL_LOGS, logs.T)))
+    solved = np.column_stack([result[c] for c in COMPONENTS])
+    np.testing.assert_allclose(solved.sum(axis=1), 1)
+    assert solved.min() >= 0
+
+    # Nenhum ponto do simplex tem misfit menor que a solução
+    trials = np.vstack([rng.dirichlet(np.full(5, 0.3), 20000), np.eye(5)])
+    for i in range(0, 200, 9):
+        used = ~np.isnan(logs[i])
+        a = RESPONSE[used] * WEIGHTS[used, None]
+        b = logs[i, used] * WEIGHTS[used]
+        best = np.sum((a @ solved[i] - b) ** 2)
+        assert best <= np.min(np.sum((trials @ a.T - b) ** 2, axis=1)) + 1e-9
+        assert result["MISFIT"][i] == pytest.approx(np.sqrt(best / used.sum()))
+
+
+def test_solve_minerals_missing_logs():
+    logs = {"RHOB": np.array([2.65, np.nan]), "NPHI": np.array([0.0, np.nan])}
+    result = minerals.solve_minerals(logs, components=("QUARTZ", "POROSITY"))
+    assert result["QUARTZ"][0] == pytest.approx(1, abs=0.02)
+    assert np.isnan(result["QUARTZ"][1])
+    with pytest.raises(ValueError):
+        minerals.solve_minerals({"PEF": np.ones(3)})
+
+
+def test_volumetric_pef():
+    # Calcita: PEF 5.08 e densidade 2.71 dão U perto de 13.8
+    assert minerals.volumetric_pef(5.08, 2.71) == pytest.approx(13.75, abs=0.05)
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.netpay as netpay  # noqa: E402
+
+
+def test_pay_intervals_and_zone_summary():
+    depth = 1000.0 + np.arange(10.0)
+    curves = {
+        "VSH": np.array([0.1, 0.1, 0.6, 0.1, 0.1, 0.1, 0.2, 0.9, 0.1, 0.1]),
+        "PHIE": np.array([0.2, 0.2, 0.2, 0.2, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2]),
+        "SW": np.array([0.3, 0.3, 0.3, 0.8, 0.3, 0.3, 0.4, 0.3, 0.3, np.nan]),
+    }
+    reservoir, pay = netpay.pay_flags(curves, {"VSH": 0.4, "PHIE": 0.1, "SW": 0.5})
+    np.testing.assert_array_equal(pay, [1, 1, 0, 0, 0, 1, 1, 0, 1, 0])
+
+    intervals = netpay.pay_intervals(depth, pay)
+    np.testing.assert_array_equal(intervals["TOP"], [1000.0, 1005.0, 1008.0])
+    np.testing.assert_array_equal(intervals["BASE"], [1001.0, 1006.0, 1008.0])
+    np.testing.assert_allclose(intervals["THICKNESS"], [2.0, 2.0, 1.0])
+
+    # A zona de 1020 está abaixo do perfil e fica vazia
+    summary = netpay.zone_summary(
+        depth, reservoir, pay, {"SW": curves["SW"]}, tops=[1005.0, 1020.0]
+    )
+    np.testing.assert_allclose(summary["GROSS"], [5.0, 5.0, 0.0])
+    np.testing.assert_allclose(summary["NET"], [3.0, 4.0, 0.0])
+    np.testing.assert_allclose(summary["PAY"], [2.0, 3.0, 0.0])
+    np.testing.assert_allclose(summary["NET_TO_GROSS"][:2], [0.6, 0.8])
+    assert summary["SW"][1] == pytest.approx((0.3 + 0.4 + 0.3) / 3)
+    assert np.isnan(summary["SW"][2])
+
+
+def test_cutoff_sensitivity_matches_rescanning():
+    rng = np.random.default_rng(5)
+    n = 5000
+    curves = {
+        "VSH": rng.random(n),
+        "PHIE": rng.random(n) * 0.3,
+        "SW": rng.random(n),
+        "PERM": 10 ** rng.normal(0, 1, n),
+    }
+    curves["SW"][::50] = np.nan
+    thickness = rng.uniform(0.1, 0.2, n)
+    grids = {
+        "VSH": [0.5, 0.2, 0.35],
+        "PHIE": np.linspace(0.0, 0.3, 7),
+        "SW": np.linspace(0.2, 0.8, 4),
+        "PERM": [10.0, 0.1, 1.0],
+    }
+    net = netpay.cutoff_sensitivity(curves, grids, thickness, weights=curves["PHIE"])
+    assert net.shape == (3, 7, 4, 3)
+    for index in np.ndindex(net.shape):
+        cutoffs = {name: grids[name][i] for name, i in zip(grids, index)}
+        mask = netpay.cutoff_mask(curves, cutoffs)
+        expected = (thickness * curves["PHIE"])[mask].sum()
+        assert net[index] == pytest.approx(expected)
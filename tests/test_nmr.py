@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.nmr as nmr  # noqa: E402
+
+
+def test_nmr_curves_match_per_depth_sums():
+    rng = np.random.default_rng(3)
+    t2 = nmr.t2_axis(0.3, 3000.0, 64)
+    amplitudes = rng.uniform(0.0, 0.005, (500, 64))
+
+    curves = nmr.nmr_curves(amplitudes, t2, cutoff=[33.0, 92.0], chunk_size=128)
+
+    tcmr = amplitudes.sum(axis=1)
+    np.testing.assert_allclose(curves["TCMR"], tcmr)
+    np.testing.assert_allclose(
+        curves["T2LM"], np.exp((amplitudes * np.log(t2)).sum(axis=1) / tcmr)
+    )
+    # Cutoffs no centro de um bin dividem esse bin ao meio
+    half = nmr.cutoff_weights(t2, t2[20])
+    assert half[20, 0] == 0.5 and half[:20, 0].all() and not half[21:, 0].any()
+
+    assert curves["BVI"].shape == (500, 2)
+    assert (curves["BVI"][:, 1] >= curves["BVI"][:, 0]).all()
+    np.testing.assert_allclose(curves["BVI"] + curves["FFI"], tcmr[:, None] * [1, 1])
+    np.testing.assert_allclose(curves["KSDR"], 4.0 * tcmr**4 * curves["T2LM"] ** 2)
+
+    single = nmr.nmr_curves(amplitudes, t2, cutoff=33.0)
+    np.testing.assert_allclose(single["KTIM"], curves["KTIM"][:, 0])
+
+
+def test_invert_echoes_recovers_t2_distribution():
+    rng = np.random.default_rng(4)
+    t2 = nmr.t2_axis(0.3, 3000.0, 64)
+    peaks = rng.uniform(np.log(10.0), np.log(300.0), (40, 1))
+    truth = np.exp(-0.5 * ((np.log(t2) - peaks) / 0.5) ** 2)
+    truth *= 0.25 / truth.sum(axis=1, keepdims=True)
+    times = 0.2 * np.arange(1, 1001)
+    echoes = truth @ np.exp(-times[:, None] / t2).T
+    echoes += rng.normal(0.0, 0.001, echoes.shape)
+
+    amplitudes = nmr.invert_echoes(echoes, 0.2, alpha=0.05, chunk_size=16)
+
+    assert amplitudes.shape == (40, 64) and (amplitudes >= 0).all()
+    curves = nmr.nmr_curves(amplitudes, t2)
+    expected = nmr.nmr_curves(truth, t2)
+    np.testing.assert_allclose(curves["TCMR"], expected["TCMR"], atol=0.01)
+    np.testing.assert_allclose(curves["T2LM"], expected["T2LM"], rtol=0.1)
+    assert nmr.inversion_kernel.cache_info().currsize >= 1
+
+    # Os blocos resolvidos em processos filhos dão o mesmo resultado
+    pooled = nmr.invert_echoes(echoes, 0.2, alpha=0.05, max_workers=2, chunk_size=16)
+    np.testing.assert_allclose(pooled, amplitudes)
@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.permeability as pm  # noqa: E402
+
+
+def test_permeability_models_match_scalar_equations():
+    rng = np.random.default_rng(1)
+    phi = rng.uniform(0.05, 0.3, 200)
+    swirr = rng.uniform(0.1, 0.5, 200)
+    rtirr = rng.uniform(5.0, 50.0, 200)
+    t2gm = rng.uniform(10.0, 300.0, 200)
+
+    result = pm.permeability_models(
+        phi, swirr, rw=0.05, rtirr=rtirr, rho_h=0.8, t2gm=t2gm
+    )
+
+    assert result.dtype.names == pm.PERMEABILITY_MODELS
+    np.testing.assert_allclose(result["TIMUR"], ((93 * phi**2.2) / swirr) ** 2)
+    np.testing.assert_allclose(result["WYLLIE_ROSE"], (250 * (phi**3 / swirr)) ** 2)
+
+    w = (3.75 - phi + (np.log10(0.05 / rtirr) + 2.2) ** 2 / 2) ** 0.5
+    c = 23 + 465 * 0.8 - 188 * 0.8**2
+    np.testing.assert_allclose(
+        result["COATES_DUMANOIR"], ((c * phi ** (2 * w)) / (w**4 * (0.05 / rtirr))) ** 2
+    )
+    np.testing.assert_allclose(result["NMR_SDR"], 4.0 * phi**4 * t2gm**2)
+    assert np.all(np.isnan(result["NMR_COATES"]))
+
+
+def test_scalar_inputs_return_scalars():
+    assert np.isclose(
+        pm.nmr_coates(0.2, 0.14, 0.06, 10.0), (0.02**4) * (0.14 / 0.06) ** 2
+    )
+    assert np.ndim(pm.timur(0.2, 0.3)) == 0
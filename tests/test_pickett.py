@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.pickett as pickett  # noqa: E402
+
+
+@pytest.mark.parametrize("method", pickett.PICKETT_METHODS)
+def test_pickett_fit_ignores_hydrocarbon_points(method):
+    rng = np.random.default_rng(3)
+    phi = rng.uniform(0.05, 0.35, 100000)
+    rt = 0.08 / phi**2.1 * 10 ** rng.normal(0, 0.02, phi.size)
+    # Amostras com hidrocarboneto ficam acima da reta de água
+    hc = rng.random(phi.size) < 0.15
+    rt[hc] *= rng.uniform(3, 30, hc.sum())
+    rt[:10] = np.nan
+
+    fit = pickett.pickett_fit(rt, phi, method, a=0.8)
+    assert fit["m"] == pytest.approx(2.1, abs=0.05)
+    assert fit["a"] * fit["rw"] == pytest.approx(0.08, rel=0.1)
@@ -0,0 +1,68 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.flags as flags_module  # noqa: E402
+import scripts.petrophysics.porosity as porosity  # noqa: E402
+
+
+def test_porosity_curves_match_scalar_equations():
+    rng = np.random.default_rng(0)
+    rhob = rng.uniform(2.0, 2.6, 1000)
+    nphi = rng.uniform(0.05, 0.35, 1000)
+    dt = rng.uniform(60.0, 110.0, 1000)
+
+    out, flags = porosity.porosity_curves(rhob, nphi, dt, rhom=2.65, rhof=1.0)
+    phid, phis, phind, phigp = out
+
+    np.testing.assert_allclose(phid, (2.65 - rhob) / (2.65 - 1.0))
+    np.testing.assert_allclose(phis, (dt - 55.5) / (189.0 - 55.5))
+    np.testing.assert_allclose(phind, (phid + nphi) / 2)
+    np.testing.assert_allclose(phigp, porosity.gaymard_porosity(phid, nphi))
+
+
+def test_porosity_curves_reuses_out_buffer_and_zone_parameters():
+    rhob = np.array([2.3, 2.4, 2.5, 2.6])
+    nphi = np.array([0.2, 0.2, 0.1, 0.1])
+    rhom = np.array([2.65, 2.65, 2.71, 2.71])
+    out = np.empty((len(porosity.POROSITY_CURVES), 4))
+
+    result, flags = porosity.porosity_curves(rhob, nphi, rhom=rhom, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(out[0], (rhom - rhob) / (rhom - 1.0))
+    assert np.all(np.isnan(out[1]))
+    assert np.all(flags[1] == flags_module.UNDEFINED)
+
+
+def test_density_porosity_flags_out_of_range_samples():
+    rhob = np.array([0.9, 2.2, 2.7])
+    phi, flags = porosity.density_porosity(rhob, 2.65, 1.0)
+
+    assert flags.dtype == np.uint8
+    assert list(flags) == [
+        flags_module.ABOVE_RANGE,
+        flags_module.VALID,
+        flags_module.BELOW_RANGE,
+    ]
+
+    _, flags = porosity.density_porosity(2.2, 2.65, 2.65)
+    assert flags & flags_module.UNDEFINED
+
+
+def test_range_flags_across_blocks():
+    # Mais amostras que um bloco, num arranjo 2-D não contíguo
+    rng = np.random.default_rng(5)
+    values = rng.uniform(-0.5, 1.5, (3, flags_module.FLAG_BLOCK + 7))
+    values[:, ::11] = np.nan
+    values[:, ::13] = np.inf
+    values = values.T
+    expected = (
+        (values < 0) * flags_module.BELOW_RANGE
+        | (values > 1) * flags_module.ABOVE_RANGE
+        | ~np.isfinite(values) * flags_module.UNDEFINED
+    )
+    np.testing.assert_array_equal(flags_module.range_flags(values), expected)
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.pvt as pvt  # noqa: E402
+
+
+@pytest.mark.parametrize("correlation", pvt.PVT_CORRELATIONS)
+def test_correlations_are_continuous_at_the_bubble_point(correlation):
+    pb = pvt.bubble_point(600.0, 200.0, 35.0, 0.75, correlation)
+    rs = pvt.solution_gor(pb, 200.0, 35.0, 0.75, correlation)
+    # O expoente 1.2048 de Standing é 1/0.83 arredondado
+    assert rs == pytest.approx(600.0, rel=1e-3)
+
+    table = pvt.PVTTable.from_correlations(35.0, 0.75, 600.0, correlation)
+    assert table.properties == pvt.PVT_PROPERTIES
+    below, above = table.query([0.9 * pb, 1.1 * pb], 200.0)["RS"]
+    assert below < 600.0 and above == pytest.approx(600.0)
+    # Bo cresce até o ponto de bolha e cai com a compressão do óleo acima dele
+    bo = table.query(np.array([0.5, 0.9, 1.2, 2.0]) * pb, 200.0)["BO"]
+    assert bo[0] < bo[1] and bo[2] > bo[3]
+
+
+def test_query_interpolates_bilinearly():
+    p = np.array([1000.0, 2000.0, 4000.0])
+    t = np.array([100.0, 200.0])
+    table = pvt.PVTTable(p, t, {"X": t[:, None] * 0.01 + p[None, :] * 0.001})
+
+    rng = np.random.default_rng(0)
+    qp = rng.uniform(1000.0, 4000.0, (50, 1))
+    qt = rng.uniform(100.0, 200.0, (1, 40))
+    np.testing.assert_allclose(table.query(qp, qt)["X"], qt * 0.01 + qp * 0.001)
+    # Fora da grade valem os valores da borda
+    assert table.query(5000.0, 250.0)["X"] == pytest.approx(2.0 + 4.0)
+
+    lab = pvt.PVTTable.from_lab([3000, 1000, 2000], 200.0, BO=[1.3, 1.2, 1.25])
+    np.testing.assert_allclose(lab.query([1500, 2500], 180.0)["BO"], [1.225, 1.275])
+
+    # Propriedade ausente da tabela
+    with pytest.raises(ValueError):
+        lab.query(2000, 180.0, ["BG"])
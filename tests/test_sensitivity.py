@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.sensitivity as sens  # noqa: E402
+import scripts.petrophysics.water_saturation as ws  # noqa: E402
+
+
+def test_sensitivity_ishigami_indices():
+    calls = []
+
+    def ishigami(x1, x2, x3):
+        calls.append(x1.shape)
+        return np.sin(x1) + 7 * np.sin(x2) ** 2 + 0.1 * x3**4 * np.sin(x1)
+
+    names = ("x1", "x2", "x3")
+    result = sens.sensitivity(
+        ishigami,
+        dict.fromkeys(names, 0.0),
+        dict.fromkeys(names, -np.pi),
+        dict.fromkeys(names, np.pi),
+        n=2**15,
+        seed=0,
+    )
+    # Todos os conjuntos de parâmetros numa única chamada
+    assert calls == [(7 + 5 * 2**15,)]
+    first = dict(zip(result["NAMES"], result["FIRST"]))
+    total = dict(zip(result["NAMES"], result["TOTAL"]))
+    # Valores analíticos da função de Ishigami (a = 7, b = 0.1)
+    assert first["x1"] == pytest.approx(0.314, abs=0.02)
+    assert first["x2"] == pytest.approx(0.442, abs=0.02)
+    assert first["x3"] == pytest.approx(0.0, abs=0.02)
+    assert total["x1"] == pytest.approx(0.558, abs=0.02)
+    assert total["x3"] == pytest.approx(0.244, abs=0.02)
+
+
+def test_sensitivity_large_mean():
+    names = ("x1", "x2")
+    # Modelo aditivo com média alta: S1 = 1/5 e S2 = 4/5 para qualquer média
+    result = sens.sensitivity(
+        lambda x1, x2: 1e4 + x1 + 2 * x2,
+        dict.fromkeys(names, 0.5),
+        dict.fromkeys(names, 0.0),
+        dict.fromkeys(names, 1.0),
+        n=4096,
+        seed=2,
+    )
+    first = dict(zip(result["NAMES"], result["FIRST"]))
+    total = dict(zip(result["NAMES"], result["TOTAL"]))
+    assert first["x1"] == pytest.approx(0.2, abs=0.03)
+    assert first["x2"] == pytest.approx(0.8, abs=0.03)
+    assert total["x1"] == pytest.approx(0.2, abs=0.03)
+    assert total["x2"] == pytest.approx(0.8, abs=0.03)
+
+
+def test_sensitivity_one_at_a_time():
+    base = {"rt": 20.0, "phi": 0.2, "rw": 0.05, "a": 1.0, "m": 2.0, "n": 2.0}
+    low = {"phi": 0.15, "m": 1.8, "rw": 0.04}
+    high = {"phi": 0.25, "m": 2.2, "rw": 0.06}
+    result = sens.sensitivity(ws.archie, base, low, high, n=256, seed=1)
+
+    assert result["BASE"] == pytest.approx(ws.archie(**base))
+    for name, lo, hi in zip(result["NAMES"], result["LOW"], result["HIGH"]):
+        assert lo == pytest.approx(ws.archie(**{**base, name: low[name]}))
+        assert hi == pytest.approx(ws.archie(**{**base, name: high[name]}))
+    swings = np.abs(result["HIGH"] - result["LOW"])
+    assert np.all(np.diff(swings) <= 0)
+    assert result["NAMES"][0] == "phi"
+
+    with pytest.raises(ValueError):
+        sens.sensitivity(ws.archie, base, {"phi": 0.1}, {}, n=16)
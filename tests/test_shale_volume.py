@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.shale_volume as sv  # noqa: E402
+
+
+def test_compute_vsh_matches_each_transform():
+    rng = np.random.default_rng(5)
+    gr = rng.uniform(0.0, 160.0, 1000)
+    # Linhas de base variando por zona
+    gr_clean = np.where(np.arange(1000) < 500, 20.0, 35.0)
+
+    out = np.empty((len(sv.VSH_METHODS), 1000))
+    vsh = sv.compute_vsh(gr, gr_clean, 140.0, out=out)
+    assert vsh is out
+
+    igr = np.clip((gr - gr_clean) / (140.0 - gr_clean), 0, 1)
+    expected = {
+        "LINEAR": igr,
+        "LARIONOV": 0.083 * (2 ** (3.7 * igr) - 1),
+        "LARIONOV_OLD_ROCKS": 0.33 * (2 ** (2 * igr) - 1),
+        "STEIBER": igr / (3 - 2 * igr),
+        "CLAVIER": 1.7 - (3.38 - (igr + 0.7) ** 2) ** (1 / 2),
+    }
+    for row, method in zip(vsh, sv.VSH_METHODS):
+        np.testing.assert_allclose(row, expected[method])
+
+    (steiber,) = sv.compute_vsh(60.0, 20.0, 120.0, ["STEIBER"])
+    assert steiber == sv.steiber(0.4)
+    np.testing.assert_allclose(sv.VSH_REFERENCE[1], sv.larionov(sv.IGR_REFERENCE))
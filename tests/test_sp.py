@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.sp as sp  # noqa: E402
+
+
+@pytest.mark.parametrize("method", sp.SP_BASELINE_METHODS)
+def test_shale_baseline_removes_drift(method):
+    n = 30000
+    samples = np.arange(n)
+    drift = np.linspace(0, 30, n) + 5 * np.sin(samples / 4000)
+    sand = (samples // 700) % 3 == 1
+    curve = drift + np.where(sand, -80.0, 0.0)
+
+    baseline = sp.shale_baseline(curve, 1500, method, shale=~sand)
+    np.testing.assert_allclose(baseline, drift, atol=1.0)
+
+    zones = samples * 2 // n
+    ssp = sp.zone_ssp(curve - baseline, zones, percentile=5)
+    np.testing.assert_allclose(ssp, -80.0, atol=1.0)
+
+    # Sem marcação de folhelhos os pontos vêm da mediana móvel
+    automatic = sp.shale_baseline(curve, 1500, method)
+    np.testing.assert_allclose(automatic[2000:-2000], drift[2000:-2000], atol=1.0)
+
+
+def test_sp_vsh_and_rw_curves():
+    vsh = sp.sp_vsh(np.array([-80.0, -40.0, 0.0, 10.0]), -80.0)
+    np.testing.assert_allclose(vsh, [0.0, 0.5, 1.0, 1.0])
+
+    k = sp.sp_k(np.array([100.0, 200.0]))
+    np.testing.assert_allclose(k, [73.3, 86.6])
+    rw = sp.sp_rw(-80.0, 0.5, k)
+    # Mesma equação da aba de resistividade, ponto a ponto
+    np.testing.assert_allclose(rw, 10 ** ((k * np.log10(0.5) - 80.0) / k))
@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from scripts.welllog import store  # noqa: E402
+
+
+def make_well(n=100):
+    depth = 1000.0 + 0.5 * np.arange(n)
+    return {
+        "well": {"WELL": {"unit": "", "value": "A-1", "description": "WELL"}},
+        "curves": {
+            "DEPT": {"unit": "M", "description": "Depth"},
+            "GR": {"unit": "API", "description": "Gamma Ray"},
+            "RHOB": {"unit": "G/C3", "description": "Bulk Density"},
+        },
+        "data": {
+            "DEPT": depth,
+            "GR": np.linspace(20.0, 120.0, n),
+            "RHOB": np.full(n, 2.4),
+        },
+    }
+
+
+def test_write_and_read_depth_range(tmp_path):
+    las = make_well()
+    store.write_well(tmp_path, "A-1", las)
+
+    assert store.list_wells(tmp_path) == ["A-1"]
+    well = store.read_well(tmp_path, "A-1", curves=["GR"], top=1010.0, base=1020.0)
+
+    assert list(well["data"]) == ["DEPT", "GR"]
+    np.testing.assert_array_equal(well["data"]["DEPT"], np.arange(1010.0, 1020.5, 0.5))
+    np.testing.assert_array_equal(well["data"]["GR"], las["data"]["GR"][20:41])
+
+
+def test_append_curves(tmp_path):
+    store.write_well(tmp_path, "A-1", make_well())
+    store.append_curves(tmp_path, "A-1", {"PHID": np.zeros(100)}, units={"PHID": "V/V"})
+
+    well = store.read_well(tmp_path, "A-1", curves=["PHID"])
+    assert well["curves"]["PHID"]["unit"] == "V/V"
+    np.testing.assert_array_equal(well["data"]["PHID"], np.zeros(100))
+
+    with pytest.raises(ValueError):
+        store.append_curves(tmp_path, "A-1", {"BAD": np.zeros(3)})
+    with pytest.raises(KeyError):
+        store.read_well(tmp_path, "A-1", curves=["NOPE"])
+
+
+def test_well_version_changes_on_write(tmp_path):
+    store.write_well(tmp_path, "A-1", make_well())
+    version = store.well_version(tmp_path, "A-1")
+    # Mesmo nome em outro diretório é outro dado
+    store.write_well(tmp_path / "other", "A-1", make_well())
+    assert store.well_version(tmp_path / "other", "A-1") != version
+
+    store.append_curves(tmp_path, "A-1", {"PHID": np.zeros(100)})
+    # Garante outro instante de modificação mesmo em sistemas de arquivos grosseiros
+    path = tmp_path / "A-1.arrow"
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+    assert store.well_version(tmp_path, "A-1") != version
+
+
+def test_data_directory_stays_inside_root(tmp_path):
+    (tmp_path / "wells").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path.parent)
+    assert store.data_directory("wells", root=tmp_path) == tmp_path.resolve() / "wells"
+    assert store.data_directory("", root=tmp_path) == tmp_path.resolve()
+    for path in ("..", "wells/../..", "/etc", "link"):
+        with pytest.raises(ValueError):
+            store.data_directory(path, root=tmp_path)
+
+
+def test_empty_depth_has_no_interval(tmp_path):
+    las = make_well(3)
+    las["data"]["DEPT"] = np.full(3, np.nan)
+    store.write_well(tmp_path, "A-1", las)
+    info = store.well_info(tmp_path, "A-1")
+    assert info["top"] is None and info["base"] is None
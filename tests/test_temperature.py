@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.temperature as temperature  # noqa: E402
+
+
+def test_formation_temperature_gradients():
+    depth = np.array([0.0, 5000.0, 10000.0, 15000.0])
+    # Um ponto: gradiente linear desde a superfície
+    linear = temperature.formation_temperature(depth, 75.0, [(10000.0, 225.0)])
+    np.testing.assert_allclose(linear, [75.0, 150.0, 225.0, 300.0])
+
+    # Vários pontos: gradiente por trechos, o último estendido abaixo
+    piecewise = temperature.formation_temperature(
+        depth, 75.0, [(10000.0, 225.0), (5000.0, 125.0)]
+    )
+    np.testing.assert_allclose(piecewise, [75.0, 125.0, 225.0, 325.0])
+
+    # Uma única profundidade, como nas calculadoras de valor único
+    for fd, tf in ((5000.0, 150.0), (15000.0, 300.0)):
+        single = temperature.formation_temperature(fd, 75.0, [(10000.0, 225.0)])
+        assert float(single) == pytest.approx(tf)
+
+    with pytest.raises(ValueError):
+        temperature.formation_temperature(depth, 75.0, [])
+
+
+def test_arps_matches_western_atlas_rmf():
+    tf = np.array([75.0, 150.0, 250.0])
+    rmf = temperature.arps(1.2, 75.0, tf)
+    np.testing.assert_allclose(rmf, 1.2 * (75.0 + 6.77) / (tf + 6.77))
+    assert temperature.arps(0.05, 150.0, 150.0) == pytest.approx(0.05)
@@ -0,0 +1,84 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.uncertainty as uncertainty  # noqa: E402
+import scripts.petrophysics.water_saturation as ws  # noqa: E402
+
+
+@pytest.mark.parametrize("n", [1, 2, 9, 1000])
+def test_partition_percentiles_matches_numpy(n):
+    rng = np.random.default_rng(n)
+    values = rng.normal(size=(50, n))
+    q = [10, 50, 90, 2.5]
+    expected = np.percentile(values, q, axis=1)
+    np.testing.assert_allclose(
+        uncertainty.partition_percentiles(values.copy(), q), expected
+    )
+
+
+@pytest.mark.parametrize(
+    "q, sizes",
+    [
+        ([10, 50, 90], [3, 4]),
+        ([49, 50, 51], range(1, 201)),
+        ([10, 11, 12], range(1, 201)),
+    ],
+)
+def test_partition_percentiles_adjacent_ranks(q, sizes):
+    # Ranks vizinhos: o rank seguinte de um percentil abre a fatia do outro
+    for n in sizes:
+        values = np.random.default_rng(n).normal(size=(3, n))
+        expected = np.percentile(values, q, axis=1)
+        np.testing.assert_allclose(
+            uncertainty.partition_percentiles(values.copy(), q), expected
+        )
+
+
+def test_monte_carlo_curves_percentiles():
+    depth_values = np.linspace(0, 1, 7)
+    # x + p com p ~ N(0, 1): P90 = x - 1.2816, P10 = x + 1.2816
+    result = uncertainty.monte_carlo_curves(
+        lambda x, p: x + p,
+        {"x": depth_values},
+        {"p": {"type": "normal", "mean": 0.0, "std": 1.0}},
+        n=20000,
+        seed=1,
+    )
+    np.testing.assert_allclose(result["P50"], depth_values, atol=0.03)
+    np.testing.assert_allclose(result["P90"], depth_values - 1.2816, atol=0.05)
+    np.testing.assert_allclose(result["P10"], depth_values + 1.2816, atol=0.05)
+    # O mesmo parâmetro vale no poço todo: o sorteio é igual em cada profundidade
+    np.testing.assert_allclose(np.diff(result["P50"] - depth_values), 0, atol=1e-12)
+
+
+def test_monte_carlo_curves_blocks_and_noise():
+    rng = np.random.default_rng(2)
+    rt = 10 ** rng.normal(1, 0.3, 500)
+    phi = rng.uniform(0.05, 0.3, 500)
+    params = {"rw": 0.05, "m": {"type": "normal", "mean": 2.0, "std": 0.1}}
+    kwargs = dict(curves={"rt": rt, "phi": phi}, params=params, n=200, seed=3)
+    whole = uncertainty.monte_carlo_curves(ws.archie, **kwargs)
+    blocks = uncertainty.monte_carlo_curves(ws.archie, max_bytes=20000, **kwargs)
+    for name in ("P90", "P50", "P10", "MEAN"):
+        np.testing.assert_allclose(blocks[name], whole[name])
+    assert np.all(whole["P90"] <= whole["P50"]) and np.all(whole["P50"] <= whole["P10"])
+
+    # Sem incerteza, as três curvas são o valor determinístico
+    exact = ws.archie(rt, phi, 0.05)
+    fixed = uncertainty.monte_carlo_curves(
+        ws.archie, {"rt": rt, "phi": phi}, {"rw": 0.05}, n=10
+    )
+    np.testing.assert_allclose(fixed["P50"], exact)
+    np.testing.assert_allclose(fixed["P90"], exact)
+
+    # Ruído só na porosidade: profundidades com realizações indefinidas
+    noisy = uncertainty.monte_carlo_curves(
+        lambda phi: np.sqrt(phi), {"phi": phi}, noise={"phi": 0.1}, n=400, seed=4
+    )
+    assert not np.any(np.isnan(noisy["P50"]))
+    assert np.all(noisy["P90"] >= 0)
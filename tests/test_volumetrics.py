@@ -0,0 +1,160 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.pvt as pvt  # noqa: E402
+import scripts.petrophysics.volumetrics as vol  # noqa: E402
+
+
+def test_monte_carlo_volumes_percentiles():
+    inputs = {
+        "area": {"type": "constant", "value": 640.0},
+        "thickness": {"type": "uniform", "low": 20.0, "high": 40.0},
+        "phi": {"type": "constant", "value": 0.2},
+        "sh": {"type": "constant", "value": 0.8},
+        "rf": {"type": "constant", "value": 0.3},
+        "boi": {"type": "constant", "value": 1.2},
+    }
+    result = vol.monte_carlo_volumes(inputs, 200_000, seed=0, max_bytes=2**20)
+
+    # Só a espessura varia: os percentis seguem os da uniforme
+    scale = 7758 * 640 * 0.2 * 0.8 * 0.3 / 1.2
+    assert result["P90"] == pytest.approx(scale * 22.0, rel=1e-2)
+    assert result["P50"] == pytest.approx(scale * 30.0, rel=1e-2)
+    assert result["P10"] == pytest.approx(scale * 38.0, rel=1e-2)
+    counts, edges = result["histogram"]
+    assert counts.sum() == 200_000 and edges.size == 101
+    assert result["exceedance"][1][-1] == 0
+
+
+def test_correlated_inputs_keep_marginals():
+    inputs = {
+        "phi": {"type": "triangular", "low": 0.1, "mode": 0.2, "high": 0.25},
+        "sh": {"type": "lognormal", "mean": 0.7, "std": 0.05},
+    }
+    options = {"seed": 1, "n": 100_000, "factor": 1.0, "divisors": ()}
+    independent = vol.monte_carlo_volumes(inputs, **options)
+    correlated = vol.monte_carlo_volumes(
+        inputs, correlations={("phi", "sh"): 0.9}, **options
+    )
+    # Marginais preservadas: a média do produto só ganha a covariância
+    # (desvio da triangular: sqrt(0.0175 / 18))
+    mean = 0.55 / 3 * 0.7
+    covariance = 0.9 * np.sqrt(0.0175 / 18) * 0.05
+    assert independent["mean"] == pytest.approx(mean, rel=2e-3)
+    assert correlated["mean"] == pytest.approx(mean + covariance, rel=2e-3)
+    # A correlação positiva alarga a distribuição do produto
+    spread = independent["P10"] - independent["P90"]
+    assert correlated["P10"] - correlated["P90"] > 1.1 * spread
+
+    with pytest.raises(ValueError):
+        vol.monte_carlo_volumes(
+            {**inputs, "rf": {"type": "uniform", "low": 0, "high": 1}},
+            n=10,
+            correlations={("phi", "sh"): 0.9, ("phi", "rf"): -0.9, ("sh", "rf"): 0.9},
+        )
+
+
+def test_monte_carlo_volumes_streaming_percentiles():
+    # Lognormal de cauda longa, em muitos blocos: valores acima da faixa do
+    # primeiro bloco ficam fora do histograma fino
+    inputs = {"area": {"type": "lognormal", "mean": 1.0, "std": 1.0}}
+    options = {"factor": 1.0, "divisors": (), "bins": 50, "seed": 3}
+    result = vol.monte_carlo_volumes(
+        inputs, 1_000_000, max_bytes=8 * 5 * 1000, **options
+    )
+    sigma = np.sqrt(np.log(2.0))
+    mu = -(sigma**2) / 2
+    for name, z in (("P90", -1.2816), ("P50", 0.0), ("P10", 1.2816)):
+        assert result[name] == pytest.approx(np.exp(mu + sigma * z), rel=5e-3)
+    assert result["mean"] == pytest.approx(1.0, rel=5e-3)
+    counts, edges = result["histogram"]
+    assert counts.sum() == 1_000_000 and edges.size == 51
+
+    # Percentis do histograma fino contra os exatos, com valores fora da faixa
+    rng = np.random.default_rng(4)
+    values = rng.gamma(2.0, size=100_001)
+    edges = np.linspace(0.5, 6.0, 2**16 + 1)
+    inside = (values >= edges[0]) & (values <= edges[-1])
+    counts = np.histogram(values[inside], edges)[0]
+    below = np.sort(values[values < edges[0]])
+    above = np.sort(values[values > edges[-1]])
+    q = [0.5, 10, 50, 90, 99.9]
+    np.testing.assert_allclose(
+        vol._histogram_percentiles(counts, edges, below, above, q),
+        np.percentile(values, q),
+        rtol=1e-3,
+    )
+
+
+def test_empirical_distribution_at_probability_one():
+    sample = {"type": "empirical", "sample": [1.0, 2.0, 3.0]}
+    # ndtr satura em 1.0 para escores altos
+    values = vol._quantiles(sample, z=np.array([-40.0, 0.0, 40.0]))
+    np.testing.assert_array_equal(values, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(vol._quantiles(sample, u=np.array([1.0])), [3.0])
+
+
+def test_map_volumes_by_segment(tmp_path):
+    rng = np.random.default_rng(2)
+    grids = {
+        "thickness": rng.uniform(0.0, 100.0, (60, 40)),
+        "phi": rng.uniform(0.05, 0.3, (60, 40)),
+        "sw": rng.uniform(0.2, 0.8, (60, 40)),
+        "ntg": rng.uniform(0.5, 1.0, (60, 40)),
+    }
+    grids["sw"][0, :5] = np.nan
+    for name, grid in grids.items():
+        np.save(tmp_path / f"{name}.npy", grid)
+    mapped = {name: vol.load_grid(tmp_path / f"{name}.npy") for name in grids}
+
+    square = [(9.5, 9.5), (29.5, 9.5), (29.5, 29.5), (9.5, 29.5)]
+    labels = vol.rasterize_polygons([square], (60, 40))
+    assert np.count_nonzero(labels == 1) == 20 * 20
+
+    result = vol.map_volumes(
+        **mapped, cell_area=2.0, fvf=1.25, labels=labels, max_bytes=40 * 8 * 5 * 7
+    )
+    h, phi, sw, ntg = (grids[k] for k in ("thickness", "phi", "sw", "ntg"))
+    hcpv = np.nan_to_num(h * ntg * phi * (1 - sw)) * 2.0
+    np.testing.assert_allclose(
+        result["HCPV"], [hcpv[labels == 0].sum(), hcpv[labels == 1].sum()]
+    )
+    np.testing.assert_allclose(result["AREA"], [2.0 * (60 * 40 - 400 - 5), 800.0])
+    np.testing.assert_allclose(result["IN_PLACE"], 7758 * result["HCPV"] / 1.25)
+
+
+def test_map_volumes_with_volume_factor_from_pvt_table():
+    rng = np.random.default_rng(3)
+    grids = {
+        "thickness": rng.uniform(0.0, 100.0, (30, 20)),
+        "phi": rng.uniform(0.05, 0.3, (30, 20)),
+        "sw": rng.uniform(0.2, 0.8, (30, 20)),
+    }
+    pressure = rng.uniform(1000.0, 4000.0, (30, 20))
+    table = pvt.PVTTable.from_lab([1000.0, 4000.0], 180.0, BO=[1.1, 1.4])
+    bo = 1.1 + 0.3 * (pressure - 1000.0) / 3000.0
+    h, phi, sw = grids.values()
+    expected = 7758 * (h * phi * (1 - sw) / bo).sum()
+
+    # Tabela PVT consultada em cada nó, em blocos de poucas linhas
+    looked_up = vol.map_volumes(
+        **grids,
+        fvf="BO",
+        pvt=table,
+        pressure=pressure,
+        temperature=180.0,
+        max_bytes=20 * 8 * 18 * 4,
+    )
+    np.testing.assert_allclose(looked_up["IN_PLACE"], [expected])
+    # A mesma grade de Bo passada diretamente
+    gridded = vol.map_volumes(**grids, fvf=bo, max_bytes=20 * 8 * 6 * 4)
+    np.testing.assert_allclose(gridded["IN_PLACE"], [expected])
+    np.testing.assert_allclose(gridded["HCPV"], [(h * phi * (1 - sw)).sum()])
+
+    with pytest.raises(ValueError):
+        vol.map_volumes(**grids, fvf="BO", pvt=table)
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+import scripts.petrophysics.water_saturation as ws  # noqa: E402
+
+rng = np.random.default_rng(42)
+RT = rng.uniform(1.0, 50.0, 500)
+PHI = rng.uniform(0.05, 0.3, 500)
+VSH = rng.uniform(0.0, 0.5, 500)
+
+
+def test_archie_matches_scalar_equation():
+    sw = ws.archie(RT, PHI, 0.05, a=1.0, m=2.0, n=2.0, clip=False)
+    np.testing.assert_allclose(sw, ((1.0 * 0.05) / (RT * PHI**2.0)) ** 0.5)
+    assert ws.archie(2.0, 0.25, 0.125) == 1.0
+
+
+def test_shaly_sand_equations_match_scalar_equations():
+    rw, rsh, a, q = 0.05, 4.0, 0.25, 0.2
+
+    expected = (0.4 * rw / PHI**2) * (
+        np.sqrt((VSH / rsh) ** 2 + (5 * PHI**2) / (RT * rw)) - VSH / rsh
+    )
+    np.testing.assert_allclose(ws.simandoux(RT, PHI, rw, VSH, rsh, clip=False), expected)
+
+    expected = (1 / PHI) * (np.sqrt(rw / RT + (a * VSH / 2) ** 2) - a * VSH / 2)
+    np.testing.assert_allclose(ws.fertl(RT, PHI, rw, VSH, a, clip=False), expected)
+
+    expected = (
+        np.sqrt((VSH / rsh) ** 2 + PHI**2 / (0.2 * rw * RT * (1 - VSH))) - VSH / rsh
+    ) / (PHI**2 / (0.4 * rw * (1 - VSH)))
+    np.testing.assert_allclose(
+        ws.schlumberger(RT, PHI, rw, VSH, rsh, clip=False), expected
+    )
+
+    expected = (np.sqrt((0.8 * rw) / (RT * PHI**2) + (q / 2) ** 2) - q / 2) / (1 - q)
+    np.testing.assert_allclose(
+        ws.dewan_dispersed_clay(RT, PHI, rw, q, clip=False), expected
+    )
+
+    expected = 0.9 * np.sqrt(rw / RT) / PHI
+    np.testing.assert_allclose(ws.dewan_compensated(RT, PHI, rw, clip=False), expected)
+
+
+def test_zone_parameters_broadcast_and_clip_in_place():
+    rw = np.where(np.arange(500) < 250, 0.02, 2.0)
+    out = np.empty(500)
+
+    sw = ws.archie(RT, PHI, rw, out=out)
+
+    assert sw is out
+    assert sw.min() >= 0 and sw.max() <= 1
+    np.testing.assert_allclose(
+        sw[:250], np.clip((0.02 / (RT[:250] * PHI[:250] ** 2)) ** 0.5, 0, 1)
+    )
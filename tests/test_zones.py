@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+
+from scripts.welllog.zones import ZoneIndex, parse_tops  # noqa: E402
+
+
+def test_parse_tops():
+    text = "Name, Depth\nTop B; 1050  # base\n\nTop A\t1010\n1080\n"
+    assert parse_tops(text) == [
+        ("Top B", 1050.0),
+        ("Top A", 1010.0),
+        ("Zone 3", 1080.0),
+    ]
+    with pytest.raises(ValueError):
+        parse_tops("A, 1000\nB, deep")
+
+
+def test_zone_parameters_broadcast_and_cache():
+    depth = 1000.0 + np.arange(10.0)
+    zones = ZoneIndex(depth, [("B", 1006.0), ("A", 1002.5)])
+    assert zones.names == ("A", "B")
+    np.testing.assert_array_equal(zones.index, [-1, -1, -1, 0, 0, 0, 1, 1, 1, 1])
+    np.testing.assert_array_equal(zones.starts, [3, 6])
+
+    zones.set_parameter("RHOMA", [2.71, 2.87], default=2.65)
+    rhoma = zones.parameter("RHOMA")
+    np.testing.assert_allclose(rhoma, [2.65] * 3 + [2.71] * 3 + [2.87] * 4)
+    assert not rhoma.flags.writeable
+
+    # Os mesmos valores mantêm a curva em cache; valores novos a refazem
+    zones.set_parameter("RHOMA", [2.71, 2.87], default=2.65)
+    assert zones.parameter("RHOMA") is rhoma
+    zones.set_parameter("RHOMA", [2.71, 2.84], default=2.65)
+    assert zones.parameter("RHOMA")[-1] == 2.84
+
+    with pytest.raises(ValueError):
+        ZoneIndex(depth, [("A", 1002.0), ("B", 1002.0)])